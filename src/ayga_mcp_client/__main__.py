@@ -3,10 +3,27 @@
 import os
 import argparse
 import asyncio
+import importlib.util
 
+from .api.client import RESULT_DELIVERY_MODES, HTTPSettings
+from .api.rate_limit import DEFAULT_GLOBAL_RATE, DEFAULT_PARSER_RATE, RateLimiter
+from .api.scheduler import DEFAULT_CATEGORY_LIMITS, parse_category_limits
 from .server import run_stdio_server
 
 
+def _env_flag(name: str) -> bool:
+    """Read a boolean environment variable ('1', 'true', 'yes', 'on')."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _category_limits(value: str):
+    """argparse type for --category-limits."""
+    try:
+        return parse_category_limits(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -32,15 +49,130 @@ def main():
         default=os.environ.get("REDIS_API_KEY"),
         help="API key for authentication (alternative to username/password)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("REDIS_CACHE_DIR"),
+        help="Directory for a persistent result cache shared across sessions (default: memory only)",
+    )
+    parser.add_argument(
+        "--result-delivery",
+        choices=RESULT_DELIVERY_MODES,
+        default=os.environ.get("REDIS_RESULT_DELIVERY", "auto"),
+        help="'auto' subscribes to result events and falls back to polling; 'poll' always polls (default: auto)",
+    )
+    
+    # HTTP connection pool and timeouts; string defaults from the environment
+    # go through `type`, so argparse reports bad values as usage errors
+    defaults = HTTPSettings()
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=os.environ.get("REDIS_MAX_CONNECTIONS", defaults.max_connections),
+        help=f"Maximum concurrent HTTP connections (default: {defaults.max_connections})",
+    )
+    parser.add_argument(
+        "--max-keepalive",
+        type=int,
+        default=os.environ.get("REDIS_MAX_KEEPALIVE", defaults.max_keepalive_connections),
+        help=f"Maximum idle keep-alive connections (default: {defaults.max_keepalive_connections})",
+    )
+    parser.add_argument(
+        "--http2",
+        action=argparse.BooleanOptionalAction,
+        default=_env_flag("REDIS_HTTP2"),
+        help="Enable HTTP/2 multiplexing (requires: pip install ayga-mcp-client[http2]); "
+        "--no-http2 overrides REDIS_HTTP2",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=os.environ.get("REDIS_CONNECT_TIMEOUT", defaults.connect_timeout),
+        help=f"Connection timeout in seconds (default: {defaults.connect_timeout})",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=os.environ.get("REDIS_READ_TIMEOUT", defaults.read_timeout),
+        help=f"Read timeout in seconds (default: {defaults.read_timeout})",
+    )
+    parser.add_argument(
+        "--pool-timeout",
+        type=float,
+        default=os.environ.get("REDIS_POOL_TIMEOUT", defaults.pool_timeout),
+        help=f"Maximum wait for a free pooled connection in seconds (default: {defaults.pool_timeout})",
+    )
+    
+    parser.add_argument(
+        "--keep-results",
+        action="store_true",
+        default=_env_flag("REDIS_KEEP_RESULTS"),
+        help="Keep result keys in Redis after reading them (default: delete, to bound Redis memory)",
+    )
+    parser.add_argument(
+        "--compact-output",
+        action="store_true",
+        default=_env_flag("REDIS_COMPACT_OUTPUT"),
+        help="Return tool results as compact JSON instead of indented (smaller stdio payloads)",
+    )
+    
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=os.environ.get("REDIS_RATE_LIMIT", DEFAULT_GLOBAL_RATE),
+        help=f"Maximum API requests per second, 0 for no limit (default: {DEFAULT_GLOBAL_RATE:g})",
+    )
+    parser.add_argument(
+        "--parser-rate-limit",
+        type=float,
+        default=os.environ.get("REDIS_PARSER_RATE_LIMIT", DEFAULT_PARSER_RATE),
+        help=f"Maximum task submissions per second per parser, 0 for no limit (default: {DEFAULT_PARSER_RATE:g})",
+    )
+    
+    default_limits = ",".join(f"{name}={limit}" for name, limit in DEFAULT_CATEGORY_LIMITS.items())
+    parser.add_argument(
+        "--category-limits",
+        type=_category_limits,
+        default=os.environ.get("REDIS_CATEGORY_LIMITS", ""),
+        help=f"Concurrent tasks per parser category, e.g. 'slow=48'; batch work uses at most "
+        f"75%% of them (default: {default_limits})",
+    )
     
     args = parser.parse_args()
     
+    if args.result_delivery not in RESULT_DELIVERY_MODES:
+        # argparse only checks choices given on the command line, not the
+        # REDIS_RESULT_DELIVERY default
+        parser.error(
+            f"REDIS_RESULT_DELIVERY must be one of {', '.join(RESULT_DELIVERY_MODES)}, "
+            f"got {args.result_delivery!r}"
+        )
+    
+    if args.http2 and importlib.util.find_spec("h2") is None:
+        # Fail now rather than on every tool call when the client is created
+        parser.error("HTTP/2 requires the h2 package: pip install ayga-mcp-client[http2]")
+    
+    http_settings = HTTPSettings(
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_keepalive,
+        http2=args.http2,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        pool_timeout=args.pool_timeout,
+    )
+    
     # Run MCP server
     asyncio.run(run_stdio_server(
         api_url=args.api_url,
         username=args.username,
         password=args.password,
         api_key=args.api_key,
+        cache_dir=args.cache_dir,
+        result_delivery=args.result_delivery,
+        http_settings=http_settings,
+        keep_results=args.keep_results,
+        compact_output=args.compact_output,
+        rate_limiter=RateLimiter(global_rate=args.rate_limit, parser_rate=args.parser_rate_limit),
+        category_limits=args.category_limits,
     ))
 
 
@@ -0,0 +1,190 @@
+"""JSON encoding and decoding for the client and server.
+
+Uses orjson or msgspec when installed (``pip install ayga-mcp-client[fast]``)
+and the standard library otherwise.
+
+Large result payloads are kept as undecoded JSON text (RawJSON) from the
+moment they are read until something needs the parsed value. Tool output
+splices that text in verbatim instead of decoding and re-encoding it, so a
+multi-megabyte crawl never exists as a tree of Python objects.
+"""
+
+import json
+import re
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union, overload
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+# Active backend: "orjson", "msgspec" or "json"
+BACKEND = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+# Result values at least this long keep their data as raw JSON text
+RAW_RESULT_MIN_CHARS = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+# Strings (skipped whole, so brackets inside them are ignored) or brackets
+_STRUCTURE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_RAW_MARKER = re.compile(r'"@raw:([0-9a-f]{32})"')
+
+
+class RawJSON:
+    """A JSON value kept as text until it is needed."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def decode(self) -> Any:
+        """Parse the JSON text."""
+        return loads(self.text)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and other.text == self.text
+
+    def __repr__(self) -> str:
+        return f"RawJSON({len(self.text)} chars)"
+
+
+@overload
+def decode_result(result: Dict[str, Any]) -> Dict[str, Any]: ...
+@overload
+def decode_result(result: None) -> None: ...
+def decode_result(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return a result with raw 'data' decoded (other results unchanged)."""
+    if result is not None and isinstance(result.get("data"), RawJSON):
+        return {**result, "data": result["data"].decode()}
+    return result
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON text or UTF-8 bytes.
+
+    Raises:
+        ValueError: If the input is not valid JSON
+    """
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None, fallback: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode a value as JSON text, writing RawJSON values verbatim.
+
+    Args:
+        obj: Value to encode
+        indent: Indentation, or None for compact output (raw values keep
+            their own formatting)
+        fallback: Converter for other non-JSON types (like json.dumps default)
+
+    Raises:
+        TypeError: If a value cannot be encoded
+    """
+    raw: Dict[str, str] = {}
+
+    def default(value: Any) -> Any:
+        if isinstance(value, RawJSON):
+            marker = uuid.uuid4().hex
+            raw[marker] = value.text
+            return f"@raw:{marker}"
+        if fallback is not None:
+            return fallback(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    text = _encode(obj, indent, default)
+    if not raw:
+        return text
+    return _RAW_MARKER.sub(lambda match: raw.get(match.group(1), match.group(0)), text)
+
+
+def _encode(obj: Any, indent: Optional[int], default: Callable[[Any], Any]) -> str:
+    if BACKEND == "orjson" and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let the stdlib try
+    elif BACKEND == "msgspec":
+        try:
+            encoded: bytes = msgspec.json.encode(obj, enc_hook=default)
+            if indent:
+                encoded = msgspec.json.format(encoded, indent=indent)
+            return encoded.decode("utf-8")
+        except (TypeError, msgspec.EncodeError):
+            pass
+    if indent is None:
+        return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(obj, indent=indent, default=default, ensure_ascii=False)
+
+
+def _skip_ws(text: str, index: int) -> int:
+    match = _WHITESPACE.match(text, index)
+    return match.end() if match else index
+
+
+def _value_end(text: str, start: int) -> int:
+    """Index just past the JSON value starting at start, without decoding it."""
+    if start >= len(text):
+        raise ValueError("Unexpected end of JSON")
+    if text[start] not in "[{":
+        # Scalars and strings are small enough to decode
+        _, end = _decoder.raw_decode(text, start)
+        return end
+
+    depth = 0
+    for match in _STRUCTURE.finditer(text, start):
+        token = match.group()
+        if token[0] == '"':
+            continue
+        depth += 1 if token in "[{" else -1
+        if depth == 0:
+            return match.end()
+    raise ValueError("Unterminated JSON value")
+
+
+def parse_result_array(value: str) -> List[Any]:
+    """Decode an A-Parser result array, keeping its data element raw.
+
+    The value has the shape [taskId, status, errorCode, errorMsg, data, ...].
+    The first four elements are decoded; data is returned as RawJSON and any
+    trailing elements are dropped.
+
+    Raises:
+        ValueError: If the value is not such an array
+    """
+    index = _skip_ws(value, 0)
+    if value[index:index + 1] != "[":
+        raise ValueError("Result is not a JSON array")
+    index += 1
+
+    header = []
+    for _ in range(4):
+        element, index = _decoder.raw_decode(value, _skip_ws(value, index))
+        header.append(element)
+        index = _skip_ws(value, index)
+        if value[index:index + 1] != ",":
+            raise ValueError("Result array is too short")
+        index += 1
+
+    start = _skip_ws(value, index)
+    end = _value_end(value, start)
+    return [*header, RawJSON(value[start:end])]
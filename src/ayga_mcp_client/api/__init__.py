@@ -1,5 +1,17 @@
 """API client package."""
 
-from .client import RedisAPIClient
+from .cache import ResultCache
+from .client import HTTPSettings, ProgressUpdate, RedisAPIClient
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .scheduler import TaskScheduler
 
-__all__ = ["RedisAPIClient"]
+__all__ = [
+    "HTTPSettings",
+    "ProgressUpdate",
+    "RateLimiter",
+    "RedisAPIClient",
+    "ResultCache",
+    "RetryPolicy",
+    "TaskScheduler",
+]
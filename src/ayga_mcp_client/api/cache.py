@@ -0,0 +1,291 @@
+"""In-process and on-disk caches for parser results."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .._json import dumps
+from ..registry import get_parser
+
+
+# Cache TTLs (seconds) by policy
+CACHE_TTL_POLICIES = {
+    "short": 300,  # Search results and AI answers change quickly
+    "medium": 3600,  # Listings, profiles, trends
+    "long": 86400,  # Page content and channel info rarely change
+}
+
+DEFAULT_CACHE_POLICY = "short"  # Parsers not in the registry
+
+
+def get_cache_ttl(parser_id: str) -> int:
+    """Get cache TTL for a parser based on its cache policy."""
+    spec = get_parser(parser_id)
+    return CACHE_TTL_POLICIES[spec.cache_policy if spec else DEFAULT_CACHE_POLICY]
+
+
+class DiskResultCache:
+    """SQLite-backed result store shared by processes on one machine.
+
+    Payloads are stored zlib-compressed with an expiry timestamp. The database
+    runs in WAL mode so several MCP server processes can read while one
+    writes. Storage errors are swallowed: the disk cache is best-effort.
+
+    get() and set() block on SQLite (up to the 5s busy timeout) and on
+    zlib. Code running on the event loop uses get_async() and
+    set_in_background() instead, which run them on a dedicated I/O thread
+    in submission order.
+    """
+
+    FILENAME = "results.sqlite3"
+
+    def __init__(self, cache_dir: str):
+        directory = Path(cache_dir).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / self.FILENAME
+        self._lock = threading.Lock()
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-cache")
+        self._conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Return (expires_at, value) for a fresh entry, or None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expires_at, payload FROM results WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error:
+            self.errors += 1
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = row
+        try:
+            value = json.loads(zlib.decompress(payload))
+        except (zlib.error, ValueError):
+            self.errors += 1
+            return None
+        self.hits += 1
+        return expires_at, value
+
+    def set(self, key: str, value: Dict[str, Any], expires_at: float):
+        """Store a compressed result until expires_at."""
+        payload = zlib.compress(dumps(value, fallback=str).encode("utf-8"))
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, expires_at, payload) VALUES (?, ?, ?)",
+                    (key, expires_at, payload),
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            self.errors += 1
+
+    async def get_async(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """get() on the I/O thread, without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self._io, self.get, key)
+
+    def set_in_background(self, key: str, value: Dict[str, Any], expires_at: float):
+        """Queue set() on the I/O thread and return at once."""
+        self._io.submit(self.set, key, value, expires_at)
+
+    def purge_expired(self) -> int:
+        """Delete expired entries. Returns number of rows removed."""
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM results WHERE expires_at <= ?", (time.time(),)
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            self.errors += 1
+            return 0
+        return cursor.rowcount
+
+    def clear(self):
+        """Delete all entries."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM results")
+                self._conn.commit()
+        except sqlite3.Error:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get disk cache counters and usage."""
+        try:
+            with self._lock:
+                entries = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "file_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
+
+    def close(self):
+        """Finish queued writes and close the database connection."""
+        self._io.shutdown(wait=True)
+        with self._lock:
+            self._conn.close()
+
+
+class ResultCache:
+    """LRU cache of parser results with per-entry TTL and a memory cap.
+
+    With a DiskResultCache attached, results are also written to disk and
+    memory misses are looked up there before counting as a miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk: Optional[DiskResultCache] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk = disk
+        # key -> (expires_at, size_bytes, value)
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(parser_id: str, query: str, preset: str, aparser_options: Dict[str, Any]) -> str:
+        """Build a cache key from the normalized task parameters."""
+        return json.dumps(
+            [parser_id.strip().lower(), query, preset, aparser_options],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None if missing or expired."""
+        value = self._get_memory(key)
+        if value is not None or self.disk is None:
+            return self._count(value)
+        return self._count(self._promote(key, self.disk.get(key)))
+
+    async def get_async(self, key: str) -> Optional[Dict[str, Any]]:
+        """get() for the event loop: disk lookups run on the I/O thread."""
+        value = self._get_memory(key)
+        if value is not None or self.disk is None:
+            return self._count(value)
+        return self._count(self._promote(key, await self.disk.get_async(key)))
+
+    def _get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def _promote(
+        self, key: str, stored: Optional[Tuple[float, Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        # Copy a disk hit to memory with its remaining TTL
+        if stored is None:
+            return None
+        expires_at, value = stored
+        self._store(key, value, expires_at)
+        return value
+
+    def _count(self, value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float):
+        """Store a result, evicting least recently used entries as needed."""
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        self._store(key, value, expires_at)
+        if self.disk is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.disk.set(key, value, expires_at)
+        else:
+            # Compression and the SQLite write must not stall the event loop
+            self.disk.set_in_background(key, value, expires_at)
+
+    def _store(self, key: str, value: Dict[str, Any], expires_at: float):
+        size = len(dumps(value, fallback=str))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (expires_at, size, value)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+        if self.disk:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and usage."""
+        lookups = self.hits + self.misses
+        stats: Dict[str, Any] = {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+        if self.disk:
+            stats["disk"] = self.disk.stats()
+        return stats
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
@@ -1,8 +1,191 @@
 """HTTP client for Redis API."""
 
 import asyncio
+import base64
+import inspect
+import json
+import time
 import httpx
-from typing import Callable, Optional, Dict, Any
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from .._json import RAW_RESULT_MIN_CHARS, decode_result, dumps, loads, parse_result_array
+from ..registry import get_parser
+from .cache import ResultCache, get_cache_ttl
+from .latency import LatencyTracker
+from .rate_limit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy
+from .scheduler import PRIORITY_INTERACTIVE, TaskScheduler
+
+
+# Redis keys used by the A-Parser Redis API bridge
+TASK_QUEUE_KEY = "aparser_redis_api"
+RESULT_KEY_PREFIX = "aparser_redis_api:"
+
+# Shared result poller settings
+POLL_INITIAL_DELAY = 1.5  # A-Parser needs time to process
+POLL_BACKOFF_FACTOR = 1.2
+POLL_MAX_DELAY = 5.0
+POLL_MAX_CONCURRENCY = 16  # Parallel GETs per tick when multi-key fetch is unavailable
+MGET_CHUNK_SIZE = 50  # Keys per multi-key fetch (keeps the query string short)
+
+# Adaptive polling (used once a parser has enough completion samples)
+ADAPTIVE_MIN_SAMPLES = 5
+POLL_MIN_DELAY = 0.5
+POLL_DENSE_MAX_DELAY = 2.0  # Poll at least this often inside the expected window
+POLL_MAX_SLEEP = 30.0  # Longest sleep before the expected window, in case the sketch is off
+POLL_DEADLINE_MARGIN = 1.0  # Check once more this long before the earliest waiter gives up
+
+# Push delivery (server-sent events on result key writes)
+RESULT_DELIVERY_MODES = ("auto", "poll")
+PUSH_SAFETY_POLL_DELAY = 15.0  # Poll this rarely while subscribed, in case an event is lost
+PUSH_CONNECT_TIMEOUT = 10.0
+PUSH_RECONNECT_DELAY = 1.0
+PUSH_MAX_RECONNECT_DELAY = 30.0
+
+# trace events that mark a pooled connection as acquired for a request
+_CONNECTION_ACQUIRED_EVENTS = ("connect_tcp.started", "send_request_headers.started")
+
+# Submitted tasks are remembered this long (seconds) for latency tracking;
+# detached tasks (submit now, fetch later) expire after the same time
+TASK_REGISTRY_TTL = 3600
+
+# Bulk submission settings
+LPUSH_CHUNK_SIZE = 100  # Tasks per multi-value LPUSH request
+
+# Replays of a request answered 429, after the rate limiter's pause
+RATE_LIMIT_MAX_RETRIES = 3
+
+# Cleanup of abandoned (cancelled or timed out) tasks
+ABANDONED_REAP_INTERVAL = 10.0  # Try to delete abandoned result keys this often
+ABANDONED_RESULT_WAIT = 900.0  # Stop waiting for an abandoned task's result after this long
+
+# JWT refresh settings
+TOKEN_REFRESH_MARGIN = 60.0  # Refresh this many seconds before the token expires
+TOKEN_REFRESH_RETRY_DELAY = 30.0  # Wait before retrying a failed background refresh
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the ``exp`` claim (Unix time) from a JWT without verifying it.
+    
+    Returns None for opaque tokens or tokens without an expiry.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+@dataclass
+class HTTPSettings:
+    """Connection pool, protocol and timeout settings for the HTTP client."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False  # Requires the 'h2' package (pip install ayga-mcp-client[http2])
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 30.0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class ProgressUpdate:
+    """Progress of a task that is still running, reported after each poll."""
+
+    task_id: str
+    elapsed: float  # Seconds since this waiter started
+    timeout: float
+    polls: int  # Result checks so far
+    status: str  # "queued" until A-Parser writes the result key, then its status
+
+    @property
+    def fraction(self) -> float:
+        """Share of the timeout used so far (capped below 1.0)."""
+        return min(self.elapsed / self.timeout, 0.95) if self.timeout else 0.0
+
+
+# Progress callbacks may be plain functions or coroutine functions; coroutines
+# run in the background so a slow consumer never delays polling
+ProgressCallback = Callable[[ProgressUpdate], Optional[Awaitable[None]]]
+
+
+@dataclass
+class _TaskInfo:
+    """Task submitted by this client."""
+
+    parser_id: Optional[str]
+    submitted_at: float  # Event loop time
+    task_json: Optional[str] = None  # Queue entry, for removing it again on cancel
+    expires_at: float = 0.0  # Event loop time
+    
+    # Detached tasks are fetched later through check_tasks(), which keeps
+    # their outcome here until the task expires
+    detached: bool = False
+    cache_key: Optional[str] = None
+    status: str = "queued"
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    completed_at: Optional[float] = None
+
+    def finish(self, outcome: Any, now: float):
+        """Record a result or parser error (an exception) as the outcome."""
+        self.completed_at = now
+        if isinstance(outcome, BaseException):
+            self.status = "failed"
+            self.error = str(outcome)
+        else:
+            self.status = "completed"
+            self.result = outcome
+
+
+@dataclass
+class _PendingResult:
+    """Task awaited through the shared result poller."""
+
+    task_id: str
+    future: asyncio.Future
+    next_poll: float
+    submitted_at: float
+    parser_id: Optional[str] = None
+    delay: float = POLL_INITIAL_DELAY
+    polls: int = 0
+    tail_polls: int = 0
+    status: str = "queued"
+    waiters: List[Tuple[Optional[ProgressCallback], float, float]] = field(
+        default_factory=list
+    )
+
+
+@dataclass
+class _InFlight:
+    """Parser run shared by concurrent identical requests."""
+
+    # time.monotonic() the shared run may last until: the latest deadline
+    # of the callers attached to it
+    deadline: float
+    # Set right after construction - the task needs the flight to run
+    task: asyncio.Task = field(init=False)
+    callers: int = 0
 
 
 class RedisAPIClient:
@@ -14,27 +197,235 @@ class RedisAPIClient:
         username: Optional[str] = None,
         password: Optional[str] = None,
         api_key: Optional[str] = None,
+        cache: Optional[ResultCache] = None,
+        result_delivery: str = "auto",
+        http_settings: Optional[HTTPSettings] = None,
+        keep_results: bool = False,
+        scheduler: Optional[TaskScheduler] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
+        if result_delivery not in RESULT_DELIVERY_MODES:
+            raise ValueError(f"result_delivery must be one of {RESULT_DELIVERY_MODES}")
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.api_key = api_key
         self._token: Optional[str] = None
         self._client: Optional[httpx.AsyncClient] = None
+        # Serializes client creation and login so concurrent first calls
+        # share one authentication
+        self._init_lock = asyncio.Lock()
+        self._authenticated = False
+        self._token_expires_at: Optional[float] = None
+        self._token_refresh_task: Optional[asyncio.Task] = None
+        self._token_refreshes = 0
+        self._auth_retries = 0
+        self.http_settings = http_settings or HTTPSettings()
+        # Result keys are deleted after they are read unless kept for debugging
+        self.keep_results = keep_results
+        self._requests = 0
+        self._pool_waits = 0
+        self._pool_wait_total = 0.0
+        self._pool_wait_max = 0.0
+        self._pool_timeouts = 0
+        self.cache = cache if cache is not None else ResultCache()
+        # Per-category caps on tasks in flight (see api/scheduler.py)
+        self.scheduler = scheduler if scheduler is not None else TaskScheduler()
+        # Request and submission rates, adapted to 429 responses
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        # Transient failures of run_parser() are retried within its timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        
+        # Shared result poller state (one loop for all in-flight tasks)
+        self._pending: Dict[str, _PendingResult] = {}
+        self._poller_task: Optional[asyncio.Task] = None
+        self._poller_wakeup: Optional[asyncio.Event] = None
+        self._mget_supported: Optional[bool] = None  # None = not probed yet
+        self._multi_lpush_supported: Optional[bool] = None
+        self._tasks: Dict[str, _TaskInfo] = {}
+        self.latency = LatencyTracker()
+        self._poll_requests = 0
+        self._poll_checks = 0
+        self._poll_misses = 0
+        
+        # Push delivery: "auto" subscribes to result key writes and falls back
+        # to polling if the API has no subscription endpoint
+        self.result_delivery = result_delivery
+        self._push_supported: Optional[bool] = None
+        self._push_task: Optional[asyncio.Task] = None
+        self._push_connected = False
+        # Set once the open stream has delivered an event for a pending task;
+        # until then it may be silent (e.g. keyspace notifications are off)
+        self._push_verified = False
+        self._push_events = 0
+        
+        # Single-flight: identical concurrent run_parser calls share one task
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._coalesced = 0
+        
+        # Background work such as async progress callbacks and task
+        # cancellation (kept referenced until done)
+        self._background_tasks: Set[asyncio.Task] = set()
+        
+        # Abandoned tasks: task_id -> loop time after which we stop trying
+        # to delete their result key. Queue removal and key deletion use
+        # endpoints that may be missing and are disabled on first refusal.
+        self._abandoned: Dict[str, float] = {}
+        self._reaper_task: Optional[asyncio.Task] = None
+        self._lrem_supported: Optional[bool] = None
+        self._delete_supported: Optional[bool] = None
+        self._cancelled = 0
+        self._dequeued = 0
+        self._abandoned_deleted = 0
+        self._results_deleted = 0
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with auth."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=120.0)
+        """Get or create HTTP client with auth.
+        
+        Safe to call concurrently: the first caller creates the client and
+        logs in while the others wait on the lock, then all of them reuse
+        the same client and token. A failed login is retried on the next call.
+        """
+        if self._client is not None and self._authenticated:
+            return self._client
+        
+        async with self._init_lock:
+            if self._client is None:
+                settings = self.http_settings
+                self._client = httpx.AsyncClient(
+                    timeout=settings.timeout(),
+                    limits=settings.limits(),
+                    http2=settings.http2,
+                    event_hooks={"request": [self._trace_pool_wait]},
+                )
             
-            # Authenticate if credentials provided
-            if self.username and self.password:
-                await self._login()
-            elif self.api_key:
-                await self._exchange_api_key()
+            if not self._authenticated:
+                await self._authenticate()
+                self._authenticated = True
         
         return self._client
     
+    def _has_credentials(self) -> bool:
+        return bool((self.username and self.password) or self.api_key)
+    
+    async def _authenticate(self):
+        """Obtain a token if credentials are provided."""
+        if self.username and self.password:
+            await self._login()
+        elif self.api_key:
+            await self._exchange_api_key()
+    
+    def _set_token(self, token: str):
+        """Store a new token and schedule its refresh before expiry."""
+        self._token = token
+        self._token_expires_at = _token_expiry(token)
+        if self._token_expires_at is not None and (
+            self._token_refresh_task is None or self._token_refresh_task.done()
+        ):
+            self._token_refresh_task = asyncio.create_task(self._token_refresh_loop())
+    
+    def _token_expiring(self) -> bool:
+        return (
+            self._token_expires_at is not None
+            and time.time() >= self._token_expires_at - TOKEN_REFRESH_MARGIN
+        )
+    
+    async def _refresh_token(self, stale_token: Optional[str]):
+        """Re-authenticate unless another caller already replaced stale_token."""
+        async with self._init_lock:
+            if self._token != stale_token:
+                return
+            await self._authenticate()
+            self._token_refreshes += 1
+    
+    async def _token_refresh_loop(self):
+        """Refresh the token shortly before it expires, for as long as it has an expiry."""
+        while self._token_expires_at is not None:
+            delay = self._token_expires_at - TOKEN_REFRESH_MARGIN - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if not self._token_expiring():
+                continue  # Refreshed by a request in the meantime
+            try:
+                await self._refresh_token(self._token)
+            except (httpx.HTTPError, KeyError, ValueError):
+                # Requests refresh on demand meanwhile - try again later
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_DELAY)
+    
+    async def _trace_pool_wait(self, request: httpx.Request):
+        """Measure how long a request waits for a pooled connection."""
+        started = time.perf_counter()
+        acquired = False
+        
+        async def trace(event_name: str, info: Dict[str, Any]):
+            nonlocal acquired
+            if not acquired and event_name.endswith(_CONNECTION_ACQUIRED_EVENTS):
+                acquired = True
+                wait = time.perf_counter() - started
+                self._pool_waits += 1
+                self._pool_wait_total += wait
+                self._pool_wait_max = max(self._pool_wait_max, wait)
+        
+        request.extensions["trace"] = trace
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self._token}"} if self._token else {}
+    
+    async def _request(
+        self, method: str, path: str, parser_ids: Sequence[str] = (), **kwargs
+    ) -> httpx.Response:
+        """Send an authenticated, rate-limited request to the API.
+        
+        An expiring token is refreshed before sending. If the API still
+        answers 401, the token is refreshed once and the request replayed.
+        A 429 response pauses the rate limiter for its Retry-After delay and
+        the request is replayed (up to RATE_LIMIT_MAX_RETRIES times).
+        
+        Args:
+            parser_ids: Parsers of the tasks a push carries, whose
+                submission rates adapt to 429 responses
+        """
+        client = await self._get_client()
+        if self._token_expiring():
+            await self._refresh_token(self._token)
+        
+        extra_headers = kwargs.pop("headers", {})
+        if "json" in kwargs:
+            # Encode request bodies with the fast JSON backend
+            kwargs["content"] = dumps(kwargs.pop("json")).encode("utf-8")
+            extra_headers = {"Content-Type": "application/json", **extra_headers}
+        url = f"{self.base_url}{path}"
+        auth_retried = False
+        rate_retries = 0
+        while True:
+            await self.rate_limiter.acquire()
+            token = self._token
+            headers = {**self._auth_headers(), **extra_headers}
+            self._requests += 1
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+            except httpx.PoolTimeout:
+                self._pool_timeouts += 1
+                raise
+            
+            if response.status_code == 429:
+                self.rate_limiter.on_rate_limited(
+                    parse_retry_after(response.headers.get("Retry-After")), parser_ids
+                )
+                if rate_retries < RATE_LIMIT_MAX_RETRIES:
+                    rate_retries += 1
+                    continue
+                return response
+            if response.status_code == 401 and not auth_retried and self._has_credentials():
+                auth_retried = True
+                self._auth_retries += 1
+                await self._refresh_token(token)
+                continue
+            
+            self.rate_limiter.on_success(parser_ids)
+            return response
+    
     async def _login(self):
         """Login with username/password."""
         response = await self._client.post(
@@ -42,7 +433,7 @@ class RedisAPIClient:
             json={"username": self.username, "password": self.password},
         )
         response.raise_for_status()
-        self._token = response.json()["access_token"]
+        self._set_token(response.json()["access_token"])
     
     async def _exchange_api_key(self):
         """Exchange API key for JWT token."""
@@ -51,194 +442,208 @@ class RedisAPIClient:
             headers={"X-API-Key": self.api_key},
         )
         response.raise_for_status()
-        self._token = response.json()["access_token"]
+        self._set_token(response.json()["access_token"])
     
     async def health_check(self) -> Dict[str, Any]:
         """Check API health."""
-        client = await self._get_client()
-        response = await client.get(f"{self.base_url}/health")
+        response = await self._request("GET", "/health")
         response.raise_for_status()
         return response.json()
     
     async def list_parsers(self) -> Dict[str, Any]:
         """Get list of available parsers."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.base_url}/parsers",
-            headers={"Authorization": f"Bearer {self._token}"} if self._token else {},
-        )
+        response = await self._request("GET", "/parsers")
         response.raise_for_status()
         return response.json()
     
     async def get_parser_info(self, parser_id: str) -> Dict[str, Any]:
         """Get parser details."""
-        client = await self._get_client()
-        response = await client.get(
-            f"{self.base_url}/parsers/{parser_id}",
-            headers={"Authorization": f"Bearer {self._token}"} if self._token else {},
-        )
+        response = await self._request("GET", f"/parsers/{parser_id}")
         response.raise_for_status()
         return response.json()
     
-    async def submit_parser_task(self, parser_id: str, query: str, options: Optional[Dict] = None) -> Dict[str, Any]:
+    async def submit_parser_task(
+        self,
+        parser_id: str,
+        query: str,
+        options: Optional[Dict] = None,
+        detached: bool = False,
+    ) -> Dict[str, Any]:
         """Submit parser task via Redis queue.
         
         Args:
             parser_id: Parser ID (e.g., 'perplexity', 'chatgpt')
             query: Query string
             options: Optional parser options
+            detached: Keep the task's outcome in the task registry for
+                check_tasks() instead of waiting for it
             
         Returns:
             Dict with 'task_id' key
         """
-        import uuid
-        import json as stdlib_json
+        task_id, task_json = self._build_task(parser_id, query, options)
+        await self._lpush_tasks([(task_id, parser_id, task_json)])
+        if detached:
+            info = self._tasks[task_id]
+            info.detached = True
+            info.cache_key = self._cache_key(parser_id, query, options)
         
-        client = await self._get_client()
+        return {"task_id": task_id}
+    
+    async def submit_parser_tasks(
+        self,
+        batch: Sequence[Tuple[str, str, Optional[Dict]]],
+    ) -> List[str]:
+        """Submit many parser tasks with multi-value LPUSH requests.
+        
+        Tasks are pushed in chunks of up to 100 per request, in batch order,
+        so A-Parser picks them up in the same order as individual submits.
+        The batch is submitted all or nothing: if a push fails, tasks this
+        call already queued are cancelled before the error is raised, so the
+        caller can resubmit without running anything twice.
+        
+        Args:
+            batch: Sequence of (parser_id, query, options) tuples
+            
+        Returns:
+            Task IDs in the same order as the batch
+        """
+        tasks = []
+        for parser_id, query, options in batch:
+            task_id, task_json = self._build_task(parser_id, query, options)
+            tasks.append((task_id, parser_id, task_json))
+        
+        try:
+            for i in range(0, len(tasks), LPUSH_CHUNK_SIZE):
+                await self._lpush_tasks(tasks[i:i + LPUSH_CHUNK_SIZE])
+        except BaseException:
+            for task_id, _, _ in tasks:
+                if task_id in self._tasks:
+                    self.cancel_task(task_id)
+            raise
+        
+        return [task_id for task_id, _, _ in tasks]
+    
+    def _register_tasks(self, tasks: List[Tuple[str, str, str]]):
+        """Remember submitted (task_id, parser_id, task_json) for latency tracking and cancel."""
+        now = asyncio.get_running_loop().time()
+        if len(self._tasks) > 1000:
+            self._purge_tasks(now)
+        for task_id, parser_id, task_json in tasks:
+            self._tasks[task_id] = _TaskInfo(
+                parser_id=parser_id,
+                submitted_at=now,
+                task_json=task_json,
+                expires_at=now + TASK_REGISTRY_TTL,
+            )
+    
+    def _purge_tasks(self, now: float):
+        """Drop expired tasks; detached tasks nobody fetched are cancelled."""
+        for task_id, info in list(self._tasks.items()):
+            if info.expires_at > now:
+                continue
+            if info.detached and info.completed_at is None:
+                self.cancel_task(task_id)  # Removes the entry once cleaned up
+            else:
+                del self._tasks[task_id]
+    
+    def _build_task(self, parser_id: str, query: str, options: Optional[Dict] = None) -> Tuple[str, str]:
+        """Serialize an A-Parser task.
+        
+        Returns:
+            Tuple of (task_id, task_json)
+        """
+        import uuid
         
         # Generate task ID
         task_id = str(uuid.uuid4())
         
-        # Map parser_id to A-Parser format (40 parsers: 6 FreeAI + 6 YouTube + 10 Social + 4 Translation + 8 SE + 3 Content + 1 Analytics + 1 Visual + 1 Net)
-        parser_map = {
-            # FreeAI Category (6)
-            "perplexity": "FreeAI::Perplexity",
-            "googleai": "FreeAI::GoogleAI",
-            "chatgpt": "FreeAI::ChatGPT",
-            "kimi": "FreeAI::Kimi",
-            "deepai": "FreeAI::DeepAI",
-            "copilot": "FreeAI::Copilot",
-            
-            # YouTube Category (6)
-            "youtube_video": "SE::YouTube::Video",
-            "youtube_search": "SE::YouTube",
-            "youtube_suggest": "SE::YouTube::Suggest",
-            "youtube_channel_videos": "JS::Example::Youtube::Channel::Videos",
-            "youtube_channel_about": "Net::HTTP",
-            "youtube_comments": "JS::Example::Youtube::Comments",
-            
-            # Social Media Category (10)
-            "telegram_group": "Telegram::GroupScraper",
-            "reddit_posts": "Reddit::Posts",
-            "reddit_post_info": "Reddit::PostInfo",
-            "reddit_comments": "Reddit::Comments",
-            "instagram_profile": "Social::Instagram::Profile",
-            "instagram_post": "Social::Instagram::Post",
-            "instagram_tag": "Social::Instagram::Tag",
-            "instagram_geo": "Social::Instagram::Geo",
-            "instagram_search": "Social::Instagram::Search",
-            "tiktok_profile": "Social::TikTok::Profile",
-            
-            # Translation Category (4)
-            "google_translate": "SE::Google::Translate",
-            "deepl_translate": "DeepL::Translator",
-            "bing_translate": "SE::Bing::Translator",
-            "yandex_translate": "SE::Yandex::Translate",
-            
-            # Search Engine Category (8)
-            "google_search": "SE::Google",
-            "yandex_search": "SE::Yandex",
-            "bing_search": "SE::Bing",
-            "duckduckgo_search": "SE::DuckDuckGo",
-            "baidu_search": "SE::Baidu",
-            "yahoo_search": "SE::Yahoo",
-            "rambler_search": "SE::Rambler",
-            "you_search": "SE::You",
-            
-            # Content Category (3)
-            "article_extractor": "HTML::ArticleExtractor",
-            "text_extractor": "HTML::TextExtractor",
-            "link_extractor": "HTML::LinkExtractor",
-            
-            # Analytics Category (1)
-            "google_trends": "SE::Google::Trends",
-            
-            # Visual Content Category (1)
-            "pinterest_search": "SE::Pinterest",
-            
-            # Net Category (1)
-            "http": "Net::HTTP",
-        }
+        aparser_name, preset, aparser_options = self._translate_options(parser_id, options)
         
-        aparser_name = parser_map.get(parser_id, f"FreeAI::{parser_id.title()}")
+        # A-Parser task format: [taskId, parser, preset, query, options, {}]
+        task_data = [task_id, aparser_name, preset, query, aparser_options, {}]
+        return task_id, dumps(task_data)
+    
+    def _translate_options(
+        self, parser_id: str, options: Optional[Dict] = None
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """Map a parser ID and MCP options to A-Parser task parameters.
         
-        # Extract preset and other options
-        preset = options.get("preset", "default") if options else "default"
+        Returns:
+            Tuple of (aparser_name, preset, aparser_options)
+        
+        Raises:
+            ValueError: If an option value does not fit its declared type or
+                the preset is not one the parser allows
+        """
+        spec = get_parser(parser_id)
+        aparser_name = spec.aparser_name if spec else f"FreeAI::{parser_id.title()}"
         
-        # Build options dict for A-Parser (5th element in task array)
+        # Extract preset and translate the options this parser accepts in
+        # one pass; unknown keys are dropped
+        preset = "default"
         aparser_options = {}
         if options:
-            # Language parameters (for Translation parsers)
-            if "from_language" in options:
-                aparser_options["fromLanguage"] = options["from_language"]
-            if "to_language" in options:
-                aparser_options["toLanguage"] = options["to_language"]
-            
-            # Pagination parameters
-            if "pages_count" in options:
-                aparser_options["pagesCount"] = options["pages_count"]
-            if "max_comments_count" in options:
-                aparser_options["maxCommentsCount"] = options["max_comments_count"]
-            if "max_empty_posts" in options:
-                aparser_options["maxEmptyPosts"] = options["max_empty_posts"]
-            
-            # YouTube-specific parameters
-            if "interface_language" in options:
-                aparser_options["interfaceLanguage"] = options["interface_language"]
-            if "subtitles_language" in options:
-                aparser_options["subtitlesLanguage"] = options["subtitles_language"]
-            if "comments_pages" in options:
-                aparser_options["commentsPages"] = options["comments_pages"]
-            if "sort" in options:
-                aparser_options["sort"] = options["sort"]
-            
-            # Google Trends parameters
-            if "category" in options:
-                aparser_options["search_category"] = options["category"]
-            if "region" in options:
-                aparser_options["search_region"] = options["region"]
-            if "time_period" in options:
-                aparser_options["search_time"] = options["time_period"]
-            if "language" in options:
-                aparser_options["hl"] = options["language"]
-            if "property" in options:
-                aparser_options["search_property"] = options["property"]
-            if "use_empty_queries" in options:
-                aparser_options["use_empty_queries"] = options["use_empty_queries"]
+            preset = options.get("preset", preset)
+            if spec and spec.presets and preset not in spec.presets:
+                raise ValueError(
+                    f"Invalid preset '{preset}' for {parser_id}: expected one of {', '.join(spec.presets)}"
+                )
+            option_map = spec.option_map if spec else {}
+            for key, value in options.items():
+                option = option_map.get(key)
+                if option is not None:
+                    aparser_options[option.aparser_name] = option.convert(value)
         
-        # A-Parser task format: [taskId, parser, preset, query, options, {}]
-        task_data = [task_id, aparser_name, preset, query, aparser_options, {}]
-        task_json = stdlib_json.dumps(task_data)
-        
-        # Submit to Redis list via structures API
-        queue_key = "aparser_redis_api"
-        response = await client.post(
-            f"{self.base_url}/structures/list/{queue_key}/lpush",
-            json={"value": task_json},
-            headers={"Authorization": f"Bearer {self._token}"},
-        )
-        response.raise_for_status()
+        return aparser_name, preset, aparser_options
+    
+    async def _lpush_tasks(self, tasks: List[Tuple[str, str, str]]):
+        """Push (task_id, parser_id, task_json) tasks onto the A-Parser queue.
         
-        return {"task_id": task_id}
+        Several tasks go out as one multi-value LPUSH; if the API rejects
+        multi-value pushes, falls back to one request per task. Waits for
+        each parser's submission rate limit first. Tasks are registered as
+        soon as they are pushed, so after a failure the registry holds
+        exactly the ones that were queued.
+        """
+        path = f"/structures/list/{TASK_QUEUE_KEY}/lpush"
+        parser_ids = [parser_id for _, parser_id, _ in tasks]
+        await self.rate_limiter.acquire_tasks(parser_ids)
+        
+        if len(tasks) > 1 and self._multi_lpush_supported is not False:
+            response = await self._request(
+                "POST", path, parser_ids=parser_ids,
+                json={"values": [task_json for _, _, task_json in tasks]},
+            )
+            if response.status_code not in (400, 405, 422):
+                response.raise_for_status()
+                self._multi_lpush_supported = True
+                self._register_tasks(tasks)
+                return
+            self._multi_lpush_supported = False
+        
+        for task in tasks:
+            _, parser_id, task_json = task
+            response = await self._request(
+                "POST", path, parser_ids=[parser_id], json={"value": task_json}
+            )
+            response.raise_for_status()
+            self._register_tasks([task])
     
-    async def get_task_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+    async def get_task_result(self, task_id: str, decode: bool = True) -> Optional[Dict[str, Any]]:
         """Get task result from Redis KV.
         
         Args:
             task_id: Task ID from submit_parser_task
+            decode: Decode large result data (False leaves it as RawJSON)
             
         Returns:
             Parsed result dict if available, None if not ready yet
         """
-        import json as stdlib_json
+        result_key = f"{RESULT_KEY_PREFIX}{task_id}"
         
-        client = await self._get_client()
-        result_key = f"aparser_redis_api:{task_id}"
-        
-        response = await client.get(
-            f"{self.base_url}/kv/{result_key}",
-            headers={"Authorization": f"Bearer {self._token}"},
-        )
+        self._poll_requests += 1
+        response = await self._request("GET", f"/kv/{result_key}")
         
         if response.status_code == 404:
             # Task not ready yet
@@ -247,13 +652,28 @@ class RedisAPIClient:
         response.raise_for_status()
         
         # Parse result (comes as string value from Redis)
-        result_json = response.json()
+        result_json = loads(response.content)
         if not result_json or "value" not in result_json:
             return None
+        
+        result = self._parse_result_value(task_id, result_json["value"])
+        return decode_result(result) if decode else result
+    
+    def _parse_result_value(self, task_id: str, value: str) -> Optional[Dict[str, Any]]:
+        """Parse a raw result value stored by A-Parser.
+        
+        Returns:
+            Parsed result dict, or None if the task is still processing
             
-        # Parse value string
+        Raises:
+            ValueError: If the parser reported an error or the value is malformed
+        """
         try:
-            result_data = stdlib_json.loads(result_json["value"])
+            if len(value) >= RAW_RESULT_MIN_CHARS and value.lstrip().startswith("["):
+                # Large result: decode only the header, keep data as raw text
+                result_data = parse_result_array(value)
+            else:
+                result_data = loads(value)
             
             # Check if it's A-Parser array format: [taskId, status, errorCode, errorMsg, data, ...]
             if isinstance(result_data, list) and len(result_data) >= 5:
@@ -264,6 +684,7 @@ class RedisAPIClient:
                     raise ValueError(f"Parser error {error_code}: {error_msg}")
                 
                 if status != "success":
+                    self._set_status(task_id, str(status))
                     return None  # Still processing
                 
                 # Return parsed data
@@ -277,32 +698,251 @@ class RedisAPIClient:
                 elif result_data.get("error"):
                     raise ValueError(f"Parser error: {result_data.get('error')}")
                 else:
+                    self._set_status(task_id, str(result_data.get("status", "processing")))
                     return None  # Still processing
             
             else:
                 raise ValueError(f"Unexpected result format: {type(result_data)}")
             
-        except (stdlib_json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             raise ValueError(f"Failed to parse result: {e}")
     
+    def _set_status(self, task_id: str, status: str):
+        """Remember the last A-Parser status seen for a task being awaited."""
+        entry = self._pending.get(task_id)
+        if entry is not None:
+            entry.status = status
+        info = self._tasks.get(task_id)
+        if info is not None:
+            info.status = status
+    
+    async def check_tasks(
+        self, task_ids: List[str], consume: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check tasks without waiting for them.
+        
+        Tasks that are not finished yet are fetched in one round (see
+        get_task_results). Outcomes of detached tasks are kept in the task
+        registry, so they can be checked again until the task expires even
+        though their result key is deleted after reading. So are outcomes of
+        task IDs the registry does not know (e.g. submitted before a
+        restart). Finished results are also stored in the result cache.
+        
+        Args:
+            task_ids: Task IDs from submit_parser_task
+            consume: Record fetched outcomes and delete their result keys;
+                False only reports them, leaving Redis and the registry as
+                they were
+            
+        Returns:
+            Dict mapping task ID to a dict with 'task_id', 'parser_id',
+            'status' ('queued', an A-Parser status, 'completed', 'failed' or
+            'unknown' for IDs this client did not submit), 'elapsed' and
+            'result' or 'error' when finished. Large result data is left as
+            RawJSON.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._purge_tasks(now)
+        
+        # Tasks awaited through the poller are left to it, so their result
+        # is not read (and deleted) from under the waiter
+        to_fetch = []
+        for task_id in dict.fromkeys(task_ids):
+            info = self._tasks.get(task_id)
+            if task_id not in self._pending and (info is None or info.completed_at is None):
+                to_fetch.append(task_id)
+        
+        outcomes = await self.get_task_results(to_fetch, decode=False) if to_fetch else {}
+        now = loop.time()
+        self._poll_checks += len(to_fetch)
+        
+        read = []
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for task_id in task_ids:
+            if task_id in statuses:
+                continue
+            info = self._tasks.get(task_id)
+            outcome = outcomes.get(task_id)
+            fetch_error = None
+            
+            if isinstance(outcome, httpx.HTTPError):
+                fetch_error = f"Failed to check task: {outcome}"
+            elif outcome is not None and not consume:
+                # Report the stored result or parser error, keep everything
+                info = replace(info) if info else _TaskInfo(parser_id=None, submitted_at=now)
+                info.finish(outcome, now)
+            elif outcome is not None:
+                read.append(task_id)  # Result or parser error was stored
+                if info is None:
+                    # Not submitted by this process - keep the outcome like a
+                    # detached task's, since its key is deleted
+                    info = _TaskInfo(
+                        parser_id=None,
+                        submitted_at=now,
+                        expires_at=now + TASK_REGISTRY_TTL,
+                        detached=True,
+                    )
+                    self._tasks[task_id] = info
+                self._complete_task(task_id, info, outcome, now)
+            
+            if info is None:
+                statuses[task_id] = {"task_id": task_id, "parser_id": None, "status": "unknown"}
+                if fetch_error:
+                    statuses[task_id]["error"] = fetch_error
+                continue
+            
+            status: Dict[str, Any] = {
+                "task_id": task_id,
+                "parser_id": info.parser_id,
+                "status": info.status,
+                "elapsed": round((info.completed_at or now) - info.submitted_at, 1),
+            }
+            if info.result is not None:
+                status["result"] = info.result
+            if info.error or fetch_error:
+                status["error"] = info.error or fetch_error
+            statuses[task_id] = status
+        
+        if read and not self.keep_results:
+            self._run_in_background(self._delete_read_results(read))
+        return statuses
+    
+    def _complete_task(self, task_id: str, info: _TaskInfo, outcome: Any, now: float):
+        """Record a fetched result or parser error for check_tasks."""
+        info.finish(outcome, now)
+        if info.result is None:
+            return
+        
+        # No latency sample: this is when the result was checked, which for
+        # a detached task can be long after it finished
+        if info.cache_key and info.parser_id:
+            self.cache.set(info.cache_key, outcome, get_cache_ttl(info.parser_id))
+        if not info.detached:
+            # Not submitted for later fetching - hand the result out once
+            self._tasks.pop(task_id, None)
+    
+    async def get_task_results(self, task_ids: List[str], decode: bool = True) -> Dict[str, Any]:
+        """Check several tasks at once.
+        
+        Uses the multi-key KV fetch (``GET /kv/mget``) when the API supports
+        it, otherwise falls back to a bounded fan-out of ``get_task_result``.
+        
+        Args:
+            task_ids: Task IDs from submit_parser_task
+            decode: Decode large result data (False leaves it as RawJSON)
+            
+        Returns:
+            Dict mapping task ID to its parsed result, None if not ready yet,
+            or the exception raised while fetching/parsing that task
+        """
+        outcomes: Dict[str, Any] = {}
+        
+        if self._mget_supported is not False:
+            for i in range(0, len(task_ids), MGET_CHUNK_SIZE):
+                chunk = task_ids[i:i + MGET_CHUNK_SIZE]
+                try:
+                    chunk_outcomes = await self._mget_task_results(chunk)
+                except Exception as e:
+                    chunk_outcomes = {task_id: e for task_id in chunk}
+                if chunk_outcomes is None:
+                    break  # Not supported - fan out below
+                outcomes.update(chunk_outcomes)
+        
+        remaining = [task_id for task_id in task_ids if task_id not in outcomes]
+        if remaining:
+            semaphore = asyncio.Semaphore(POLL_MAX_CONCURRENCY)
+            
+            async def fetch(task_id: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.get_task_result(task_id, decode=False)
+            
+            results = await asyncio.gather(
+                *(fetch(task_id) for task_id in remaining),
+                return_exceptions=True,
+            )
+            outcomes.update(zip(remaining, results))
+        
+        if decode:
+            outcomes = {
+                task_id: outcome if isinstance(outcome, BaseException) else decode_result(outcome)
+                for task_id, outcome in outcomes.items()
+            }
+        return outcomes
+    
+    async def _mget_task_results(self, task_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """Fetch several result keys in one request.
+        
+        Returns:
+            Outcomes per task ID (see get_task_results), or None if the API
+            has no multi-key fetch
+        """
+        keys = [f"{RESULT_KEY_PREFIX}{task_id}" for task_id in task_ids]
+        
+        self._poll_requests += 1
+        response = await self._request(
+            "GET", "/kv/mget", params=[("keys", key) for key in keys]
+        )
+        
+        if response.status_code in (404, 405, 501):
+            self._mget_supported = False
+            return None
+        
+        response.raise_for_status()
+        
+        # Accept {"values": [...]} aligned with keys or {"values": {key: value}}
+        payload = loads(response.content)
+        values = payload.get("values") if isinstance(payload, dict) else None
+        if isinstance(values, list) and len(values) == len(keys):
+            values = dict(zip(keys, values))
+        elif not isinstance(values, dict):
+            self._mget_supported = False
+            return None
+        
+        self._mget_supported = True
+        
+        outcomes: Dict[str, Any] = {}
+        for task_id, key in zip(task_ids, keys):
+            value = values.get(key)
+            if value is None:
+                outcomes[task_id] = None
+                continue
+            try:
+                outcomes[task_id] = self._parse_result_value(task_id, value)
+            except ValueError as e:
+                outcomes[task_id] = e
+        return outcomes
+    
     async def wait_for_result(
         self,
         task_id: str,
         timeout: int = 180,
-        progress_callback: Optional[Callable[[float], None]] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        decode: bool = True,
     ) -> Dict[str, Any]:
-        """Poll for task result with exponential backoff.
+        """Wait for task result via the shared result poller.
         
-        Uses progressive polling strategy:
+        All waiting tasks are checked together by one polling loop, so many
+        concurrent calls share a single request stream. Until a parser has
+        enough recorded completions, tasks follow a progressive polling
+        strategy:
         - Start with 1.5s delay
         - Increase by 20% each poll (exponential backoff)
         - Cap at 5s maximum delay
         - Total timeout default 180s for slow parsers
         
+        After that the schedule adapts to the parser's observed latency:
+        sleep until its 10th percentile completion time, poll densely up
+        to the 90th percentile, then back off again.
+        
         Args:
             task_id: Task ID from submit_parser_task
             timeout: Maximum wait time in seconds (default: 180)
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback receiving a ProgressUpdate
+                after each poll that finds the task still running
+            decode: Decode large result data. Results of 64 KiB or more keep
+                their data as RawJSON when False, for callers that only
+                re-serialize it
             
         Returns:
             Dict with parsed result
@@ -310,29 +950,645 @@ class RedisAPIClient:
         Raises:
             TimeoutError: If result not ready within timeout
         """
-        start = asyncio.get_event_loop().time()
-        delay = 1.5  # Start with 1.5s (A-Parser needs time to process)
-        max_delay = 5.0  # Cap at 5s between polls
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start
-            if elapsed > timeout:
-                raise TimeoutError(f"Task {task_id} timed out after {timeout}s")
+        existing = self._pending.get(task_id)
+        created = existing is None
+        if existing is None:
+            info = self._tasks.get(task_id)
+            entry = _PendingResult(
+                task_id=task_id,
+                future=loop.create_future(),
+                next_poll=start,
+                submitted_at=info.submitted_at if info else start,
+                parser_id=info.parser_id if info else None,
+                delay=POLL_INITIAL_DELAY,
+            )
+            self._pending[task_id] = entry
+        else:
+            entry = existing
+        
+        waiter = (progress_callback, start, float(timeout))
+        entry.waiters.append(waiter)
+        if created:
+            entry.next_poll = start + self._next_poll_delay(entry, start)
+        else:
+            # Make sure this waiter's deadline gets a check too
+            entry.next_poll = start + self._cap_to_deadline(entry, start, entry.next_poll - start)
+        self._ensure_poller()
+        
+        try:
+            result: Dict[str, Any] = await asyncio.wait_for(asyncio.shield(entry.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Task {task_id} timed out after {timeout}s")
+        finally:
+            entry.waiters.remove(waiter)
+            if not entry.waiters and self._pending.get(task_id) is entry:
+                # Nobody is waiting any more - stop polling this task
+                del self._pending[task_id]
+                entry.future.cancel()
+        return decode_result(result) if decode else result
+    
+    def _next_poll_delay(self, entry: _PendingResult, now: float) -> float:
+        """Delay until the next check of a pending task.
+        
+        Never later than POLL_DEADLINE_MARGIN before the earliest waiter's
+        timeout, so a result that is already stored is always picked up.
+        """
+        return self._cap_to_deadline(entry, now, self._scheduled_poll_delay(entry, now))
+    
+    def _cap_to_deadline(self, entry: _PendingResult, now: float, delay: float) -> float:
+        last_chances = [
+            started + timeout - POLL_DEADLINE_MARGIN for _, started, timeout in entry.waiters
+        ]
+        upcoming = [last_chance - now for last_chance in last_chances if last_chance > now]
+        return min([delay, *upcoming])
+    
+    def _scheduled_poll_delay(self, entry: _PendingResult, now: float) -> float:
+        if self._push_connected and self._push_verified:
+            # Result writes are known to arrive as events - polling is only
+            # a safety net
+            return PUSH_SAFETY_POLL_DELAY
+        
+        sketch = self.latency.get(entry.parser_id) if entry.parser_id else None
+        expected_first = expected_last = None
+        if sketch is not None and sketch.count >= ADAPTIVE_MIN_SAMPLES:
+            expected_first, expected_last = sketch.quantile(0.1), sketch.quantile(0.9)
+        
+        if expected_first is None or expected_last is None:
+            # Fixed schedule: 1.5s, 1.5s, 1.8s, 2.2s, 2.6s, 3.1s, 3.7s, 4.5s, 5s, 5s...
+            delay = entry.delay
+            if entry.polls:
+                entry.delay = min(entry.delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+            return delay
+        
+        elapsed = now - entry.submitted_at
+        dense = min(max((expected_last - expected_first) / 8, POLL_MIN_DELAY), POLL_DENSE_MAX_DELAY)
+        
+        if elapsed < expected_first - POLL_MIN_DELAY:
+            # Sleep until the earliest expected completion
+            return min(expected_first - elapsed, POLL_MAX_SLEEP)
+        if elapsed < expected_last:
+            # Inside the expected completion window - poll densely
+            return dense
+        
+        # Slower than usual - back off from the dense interval
+        entry.tail_polls += 1
+        return min(dense * POLL_BACKOFF_FACTOR ** entry.tail_polls, POLL_MAX_DELAY)
+    
+    def _ensure_poller(self):
+        """Start the shared poller if needed and wake it for new tasks."""
+        if self._poller_wakeup is None:
+            self._poller_wakeup = asyncio.Event()
+        self._poller_wakeup.set()
+        
+        if self._poller_task is None or self._poller_task.done():
+            self._poller_task = asyncio.create_task(self._poll_loop())
+        
+        if (
+            self.result_delivery == "auto"
+            and self._push_supported is not False
+            and (self._push_task is None or self._push_task.done())
+        ):
+            self._push_task = asyncio.create_task(self._push_loop())
+    
+    async def _poll_loop(self):
+        """Check all due tasks together each tick until none are pending."""
+        loop = asyncio.get_running_loop()
+        
+        while self._pending:
+            now = loop.time()
+            due = [entry for entry in self._pending.values() if entry.next_poll <= now]
             
-            result = await self.get_task_result(task_id)
+            if not due:
+                next_poll = min(entry.next_poll for entry in self._pending.values())
+                self._poller_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._poller_wakeup.wait(), timeout=next_poll - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
             
-            if result:
-                return result
+            try:
+                outcomes = await self.get_task_results(
+                    [entry.task_id for entry in due], decode=False
+                )
+            except Exception as e:
+                outcomes = {entry.task_id: e for entry in due}
             
-            # Report progress
-            if progress_callback:
-                progress_callback(min(elapsed / timeout, 0.95))
+            now = loop.time()
+            self._poll_checks += len(due)
+            read = []
+            for entry in due:
+                if entry.future.done():
+                    continue  # All waiters left while we were fetching
+                
+                outcome = outcomes.get(entry.task_id)
+                if outcome is not None and not isinstance(outcome, httpx.HTTPError):
+                    read.append(entry.task_id)  # Result or parser error was stored
+                
+                if isinstance(outcome, BaseException):
+                    entry.future.set_exception(outcome)
+                    if not isinstance(outcome, httpx.HTTPError):
+                        # A failed poll leaves the task live; keep its info
+                        # so it can still be dequeued by cancel_task()
+                        self._tasks.pop(entry.task_id, None)
+                elif outcome is not None:
+                    entry.future.set_result(outcome)
+                    if entry.parser_id:
+                        self.latency.record(entry.parser_id, now - entry.submitted_at)
+                    self._tasks.pop(entry.task_id, None)
+                else:
+                    # Not ready - report progress and schedule the next poll
+                    entry.polls += 1
+                    self._poll_misses += 1
+                    entry.next_poll = now + self._next_poll_delay(entry, now)
+                    self._report_progress(entry, now)
+                    continue
+                
+                if self._pending.get(entry.task_id) is entry:
+                    del self._pending[entry.task_id]
             
-            # Exponential backoff: 1.5s, 1.8s, 2.2s, 2.6s, 3.1s, 3.7s, 4.5s, 5s, 5s...
-            await asyncio.sleep(delay)
-            delay = min(delay * 1.2, max_delay)
+            if read and not self.keep_results and self._delete_supported is not False:
+                self._run_in_background(self._delete_read_results(read))
+        
+        # Nothing left to wait for - drop the subscription too
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+    
+    def _report_progress(self, entry: _PendingResult, now: float):
+        """Send a progress update to every waiter of a task that is not ready."""
+        for callback, started, timeout in entry.waiters:
+            if not callback:
+                continue
+            update = ProgressUpdate(
+                task_id=entry.task_id,
+                elapsed=now - started,
+                timeout=timeout,
+                polls=entry.polls,
+                status=entry.status,
+            )
+            try:
+                outcome = callback(update)
+            except Exception:
+                continue  # A broken callback must not stop the poller
+            if inspect.isawaitable(outcome):
+                self._run_in_background(outcome)
+    
+    def _background_done(self, task: asyncio.Task):
+        self._background_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()  # Consume errors from background work
+    
+    def _run_in_background(self, coro: Awaitable[Any]):
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_done)
+    
+    def cancel_task(self, task_id: str):
+        """Abandon a submitted task (best effort, runs in the background).
+        
+        A task A-Parser has not picked up yet is removed from the queue, so
+        it never takes a parser thread. A running task cannot be aborted, so
+        its result key is deleted once the result lands instead of lingering
+        unread in Redis.
+        
+        Args:
+            task_id: Task ID from submit_parser_task
+        """
+        if task_id in self._abandoned:
+            return
+        self._abandoned[task_id] = asyncio.get_running_loop().time() + ABANDONED_RESULT_WAIT
+        self._cancelled += 1
+        self._run_in_background(self._abandon_task(task_id))
+    
+    async def _abandon_task(self, task_id: str):
+        info = self._tasks.pop(task_id, None)
+        if info and info.task_json and await self._remove_queued_task(info.task_json):
+            # Never started - no result will be written
+            self._dequeued += 1
+            self._abandoned.pop(task_id, None)
+            return
+        
+        if self.keep_results or self._delete_supported is False:
+            self._abandoned.pop(task_id, None)
+        elif self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_abandoned())
+    
+    async def _remove_queued_task(self, task_json: str) -> bool:
+        """LREM a task from the A-Parser queue. Returns True if it was removed."""
+        if self._lrem_supported is False:
+            return False
+        try:
+            response = await self._request(
+                "POST",
+                f"/structures/list/{TASK_QUEUE_KEY}/lrem",
+                json={"value": task_json, "count": 1},
+            )
+            if response.status_code in (404, 405, 501):
+                self._lrem_supported = False
+                return False
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False
+        self._lrem_supported = True
+        return self._affected(response)
+    
+    async def _delete_result_key(self, task_id: str) -> bool:
+        """Delete a task's result key. Returns True if a key was deleted."""
+        if self._delete_supported is False:
+            return False
+        try:
+            response = await self._request("DELETE", f"/kv/{RESULT_KEY_PREFIX}{task_id}")
+            if response.status_code in (405, 501):
+                self._delete_supported = False
+                return False
+            if response.status_code == 404:
+                return False
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return False
+        self._delete_supported = True
+        return self._affected(response)
+    
+    @staticmethod
+    def _affected(response: httpx.Response) -> bool:
+        """Whether a delete/remove response reports that something was removed."""
+        try:
+            body = response.json()
+        except ValueError:
+            return True  # No body - the status code is all we get
+        if isinstance(body, dict):
+            for key in ("deleted", "removed", "count", "result"):
+                if key in body:
+                    return bool(body[key])
+        elif isinstance(body, (int, bool)):
+            return bool(body)
+        return True
+    
+    async def _delete_result_keys(self, task_ids: List[str]) -> List[bool]:
+        """Delete several result keys with bounded concurrency."""
+        semaphore = asyncio.Semaphore(POLL_MAX_CONCURRENCY)
+        
+        async def delete(task_id: str) -> bool:
+            async with semaphore:
+                return await self._delete_result_key(task_id)
+        
+        return list(await asyncio.gather(*(delete(task_id) for task_id in task_ids)))
+    
+    async def _delete_read_results(self, task_ids: List[str]):
+        """Delete result keys the poller has delivered, so Redis does not fill up."""
+        deleted = await self._delete_result_keys(task_ids)
+        self._results_deleted += sum(deleted)
+    
+    async def _reap_abandoned(self):
+        """Delete abandoned tasks' result keys as their results arrive."""
+        loop = asyncio.get_running_loop()
+        
+        while self._abandoned:
+            await asyncio.sleep(ABANDONED_REAP_INTERVAL)
+            task_ids = list(self._abandoned)
+            deleted = await self._delete_result_keys(task_ids)
+            now = loop.time()
+            for task_id, was_deleted in zip(task_ids, deleted):
+                if was_deleted:
+                    self._abandoned_deleted += 1
+                if was_deleted or self._delete_supported is False or self._abandoned.get(task_id, 0) <= now:
+                    self._abandoned.pop(task_id, None)
+    
+    async def _push_loop(self):
+        """Keep a result-key subscription open while tasks are pending."""
+        delay = PUSH_RECONNECT_DELAY
+        while self._pending and self._push_supported is not False:
+            try:
+                await self._subscribe_results()
+                delay = PUSH_RECONNECT_DELAY
+            except (httpx.HTTPError, ValueError):
+                pass  # Connection dropped - polling covers the gap
+            except Exception:
+                self._push_supported = False  # Unusable endpoint - stay on polling
+            finally:
+                self._push_connected = False
+                self._push_verified = False
+            
+            if self._pending and self._push_supported is not False:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, PUSH_MAX_RECONNECT_DELAY)
+    
+    async def _subscribe_results(self):
+        """Stream result key write events and wake the poller for them.
+        
+        Uses ``GET /kv/subscribe?pattern=aparser_redis_api:*`` as server-sent
+        events. A missing endpoint disables push delivery for this client.
+        """
+        client = await self._get_client()
+        loop = asyncio.get_running_loop()
+        token = self._token
+        
+        async with client.stream(
+            "GET",
+            f"{self.base_url}/kv/subscribe",
+            params={"pattern": f"{RESULT_KEY_PREFIX}*"},
+            headers={**self._auth_headers(), "Accept": "text/event-stream"},
+            timeout=httpx.Timeout(PUSH_CONNECT_TIMEOUT, read=None),
+        ) as response:
+            content_type = response.headers.get("content-type", "")
+            if response.status_code in (404, 405, 501) or (
+                response.status_code == 200 and not content_type.startswith("text/event-stream")
+            ):
+                self._push_supported = False
+                return
+            if response.status_code == 401 and self._has_credentials():
+                await self._refresh_token(token)  # Next reconnect uses the new token
+            response.raise_for_status()
+            
+            self._push_supported = True
+            self._push_connected = True
+            
+            # Results may have landed before we subscribed - check everything once
+            now = loop.time()
+            for entry in self._pending.values():
+                entry.next_poll = now
+            self._poller_wakeup.set()
+            
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                task_id = self._task_id_from_event(line[5:].strip())
+                entry = self._pending.get(task_id) if task_id else None
+                if entry:
+                    self._push_events += 1
+                    self._push_verified = True
+                    entry.next_poll = loop.time()
+                    self._poller_wakeup.set()
+    
+    @staticmethod
+    def _task_id_from_event(data: str) -> Optional[str]:
+        """Extract the task ID from a key event payload.
+        
+        Accepts a JSON object with 'key' or 'channel' (e.g. a Redis keyspace
+        channel '__keyspace@0__:aparser_redis_api:<id>') or a bare key.
+        """
+        import json as stdlib_json
+        
+        try:
+            payload = stdlib_json.loads(data)
+        except ValueError:
+            payload = data
+        if isinstance(payload, dict):
+            payload = payload.get("key") or payload.get("channel") or ""
+        if not isinstance(payload, str):
+            return None
+        
+        index = payload.find(RESULT_KEY_PREFIX)
+        if index < 0:
+            return None
+        return payload[index + len(RESULT_KEY_PREFIX):] or None
+    
+    async def run_parser(
+        self,
+        parser_id: str,
+        query: str,
+        options: Optional[Dict] = None,
+        timeout: int = 180,
+        progress_callback: Optional[ProgressCallback] = None,
+        decode: bool = True,
+        priority: str = PRIORITY_INTERACTIVE,
+        caller: Optional[Hashable] = None,
+        task_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Run a parser task, serving repeated requests from the result cache.
+        
+        Concurrent identical requests (same parser, query and options) are
+        coalesced: they attach to the A-Parser task already in flight and
+        share its result or exception. Progress is reported to the caller
+        that started the task. Transient failures are retried and tasks
+        nobody will read are cancelled (see _run_parser_task).
+        
+        Args:
+            parser_id: Parser ID (e.g., 'perplexity', 'chatgpt')
+            query: Query string
+            options: Optional parser options
+            timeout: Maximum wait time in seconds, including time queued
+                for a scheduler slot (default: 180)
+            progress_callback: Optional callback receiving a ProgressUpdate
+                after each poll that finds the task still running
+            decode: Decode large result data (see wait_for_result)
+            priority: Scheduler priority class while waiting for a slot
+                (PRIORITY_INTERACTIVE or PRIORITY_BATCH)
+            caller: Identity for fair queuing while waiting for a slot (see
+                TaskScheduler.acquire)
+            task_id: Task already submitted for this query under a
+                scheduler slot the caller took (e.g. with
+                submit_parser_tasks). It is waited on instead of submitting
+                another, and the slot is released when the run ends. If the
+                result is cached or already being fetched, the task is
+                cancelled.
+            
+        Returns:
+            Dict with parsed result
+        """
+        key = self._cache_key(parser_id, query, options)
+        cached = await self.cache.get_async(key)
+        if cached is not None:
+            if task_id is not None:
+                self._drop_submitted_task(parser_id, task_id)
+            return decode_result(cached) if decode else cached
+        
+        deadline = time.monotonic() + timeout
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _InFlight(deadline)
+            flight.task = asyncio.create_task(
+                self._run_parser_task(
+                    key, flight, parser_id, query, options, progress_callback, priority,
+                    caller, task_id,
+                )
+            )
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._end_flight(key, flight))
+        else:
+            if task_id is not None:
+                self._drop_submitted_task(parser_id, task_id)
+            # Keep the shared run going for as long as this caller waits
+            flight.deadline = max(flight.deadline, deadline)
+            self._coalesced += 1
+        
+        flight.callers += 1
+        try:
+            result: Dict[str, Any] = await asyncio.wait_for(asyncio.shield(flight.task), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Parser {parser_id} timed out after {timeout}s")
+        finally:
+            flight.callers -= 1
+            if flight.callers == 0 and not flight.task.done():
+                # Every caller gave up - abandon the shared task
+                flight.task.cancel()
+        return decode_result(result) if decode else result
+    
+    async def _run_parser_task(
+        self,
+        key: str,
+        flight: _InFlight,
+        parser_id: str,
+        query: str,
+        options: Optional[Dict],
+        progress_callback: Optional[ProgressCallback],
+        priority: str,
+        caller: Optional[Hashable] = None,
+        task_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        def settle():
+            nonlocal task_id
+            task_id = None
+            self.scheduler.release(parser_id)
+        
+        async def attempt() -> Dict[str, Any]:
+            nonlocal task_id
+            if task_id is None:
+                # The slot is held until the task is done with, so each
+                # category has a bounded number of tasks on the A-Parser side
+                await self.scheduler.acquire(parser_id, priority, caller)
+                try:
+                    task_id = (await self.submit_parser_task(parser_id, query, options))["task_id"]
+                except BaseException:
+                    self.scheduler.release(parser_id)
+                    raise
+            try:
+                while True:
+                    try:
+                        result = await self.wait_for_result(
+                            task_id,
+                            timeout=max(1, round(flight.deadline - time.monotonic())),
+                            progress_callback=progress_callback,
+                            decode=False,
+                        )
+                        break
+                    except TimeoutError:
+                        if flight.deadline - time.monotonic() < 1:
+                            raise
+                        # A caller with a later deadline attached meanwhile
+            except httpx.HTTPError:
+                # Polling failed but the task is still live - a retry waits
+                # for it again instead of submitting another one
+                raise
+            except ValueError:
+                # The task finished with an error and its result key was
+                # read - a retry submits a new task
+                settle()
+                raise
+            settle()
+            return result
+        
+        # Transient failures are retried within the timeout
+        try:
+            result = await self.retry_policy.run(attempt, lambda: flight.deadline)
+        except BaseException:
+            if task_id is not None:
+                # Timed out, cancelled or still failing to poll - nobody will
+                # read this result, so free the backend
+                self.cancel_task(task_id)
+                settle()
+            raise
+        self.cache.set(key, result, get_cache_ttl(parser_id))
+        return result
+    
+    def _drop_submitted_task(self, parser_id: str, task_id: str):
+        """Cancel a task handed to run_parser that turned out not to be needed."""
+        self.cancel_task(task_id)
+        self.scheduler.release(parser_id)
+    
+    def _end_flight(self, key: str, flight: _InFlight):
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+    
+    async def get_cached_result(
+        self, parser_id: str, query: str, options: Optional[Dict] = None, decode: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached result for (parser, query, options), if fresh."""
+        cached = await self.cache.get_async(self._cache_key(parser_id, query, options))
+        return decode_result(cached) if decode else cached
+    
+    def cache_result(
+        self, parser_id: str, query: str, options: Optional[Dict], result: Dict[str, Any]
+    ):
+        """Store a result using the parser's cache TTL."""
+        self.cache.set(self._cache_key(parser_id, query, options), result, get_cache_ttl(parser_id))
+    
+    def _cache_key(self, parser_id: str, query: str, options: Optional[Dict]) -> str:
+        _, preset, aparser_options = self._translate_options(parser_id, options)
+        return ResultCache.make_key(parser_id, query, preset, aparser_options)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client performance counters."""
+        pool_wait_avg = self._pool_wait_total / self._pool_waits if self._pool_waits else 0.0
+        return {
+            "cache": self.cache.stats(),
+            "polling": {
+                "requests": self._poll_requests,
+                "checks": self._poll_checks,
+                "misses": self._poll_misses,
+                "pending": len(self._pending),
+                "latency": self.latency.stats(),
+            },
+            "http": {
+                "http2": self.http_settings.http2,
+                "max_connections": self.http_settings.max_connections,
+                "max_keepalive_connections": self.http_settings.max_keepalive_connections,
+                "requests": self._requests,
+                "pool_wait_avg_ms": round(pool_wait_avg * 1000, 2),
+                "pool_wait_max_ms": round(self._pool_wait_max * 1000, 2),
+                "pool_timeouts": self._pool_timeouts,
+            },
+            "auth": {
+                "token_expires_in_s": round(self._token_expires_at - time.time())
+                if self._token_expires_at is not None else None,
+                "refreshes": self._token_refreshes,
+                "retried_401": self._auth_retries,
+            },
+            "push": {
+                "mode": self.result_delivery,
+                "supported": self._push_supported,
+                "connected": self._push_connected,
+                "verified": self._push_verified,
+                "events": self._push_events,
+            },
+            "result_keys": {
+                "keep_results": self.keep_results,
+                "delete_supported": self._delete_supported,
+                "deleted_after_read": self._results_deleted,
+            },
+            "tasks": {
+                "registered": len(self._tasks),
+                "detached": sum(1 for info in self._tasks.values() if info.detached),
+            },
+            "scheduler": self.scheduler.stats(),
+            "rate_limit": self.rate_limiter.stats(),
+            "retry": self.retry_policy.stats(),
+            "cancellation": {
+                "cancelled": self._cancelled,
+                "dequeued": self._dequeued,
+                "results_deleted": self._abandoned_deleted,
+                "awaiting_cleanup": len(self._abandoned),
+            },
+            "single_flight": {
+                "in_flight": len(self._in_flight),
+                "coalesced": self._coalesced,
+            },
+        }
     
     async def close(self):
         """Close HTTP client."""
+        if self._poller_task and not self._poller_task.done():
+            self._poller_task.cancel()
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+        if self._token_refresh_task and not self._token_refresh_task.done():
+            self._token_refresh_task.cancel()
+        if self._reaper_task and not self._reaper_task.done():
+            self._reaper_task.cancel()
+        if self.cache.disk:
+            self.cache.disk.close()
         if self._client:
             await self._client.aclose()
@@ -0,0 +1,97 @@
+"""Per-parser completion latency statistics."""
+
+import math
+from typing import Any, Dict, List, Optional
+
+
+# Log-spaced histogram buckets: 0.25s upper bound growing 15% per bucket (~950s max)
+LATENCY_BUCKET_MIN = 0.25
+LATENCY_BUCKET_GROWTH = 1.15
+LATENCY_BUCKET_COUNT = 60
+
+
+class LatencySketch:
+    """Streaming quantile estimate of task completion times.
+
+    Completion times are counted in log-spaced buckets, so memory is fixed
+    and quantiles are accurate to within one bucket (about 15%).
+    """
+
+    def __init__(self):
+        self.counts: List[int] = [0] * LATENCY_BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= LATENCY_BUCKET_MIN:
+            return 0
+        index = math.ceil(math.log(seconds / LATENCY_BUCKET_MIN, LATENCY_BUCKET_GROWTH))
+        return min(index, LATENCY_BUCKET_COUNT - 1)
+
+    @staticmethod
+    def _upper_bound(index: int) -> float:
+        return LATENCY_BUCKET_MIN * LATENCY_BUCKET_GROWTH ** index
+
+    def add(self, seconds: float):
+        """Record one completion time."""
+        self.counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0..1), or None without samples."""
+        if self.min is None or self.max is None:
+            return None
+
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                # Clamp the bucket bound to the observed range
+                return min(max(self._upper_bound(index), self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for metrics output."""
+        return {
+            "count": self.count,
+            "mean_s": round(self.total / self.count, 2) if self.count else None,
+            "min_s": round(self.min, 2) if self.min is not None else None,
+            "p10_s": _round(self.quantile(0.1)),
+            "p50_s": _round(self.quantile(0.5)),
+            "p90_s": _round(self.quantile(0.9)),
+            "p99_s": _round(self.quantile(0.99)),
+            "max_s": round(self.max, 2) if self.max is not None else None,
+        }
+
+
+class LatencyTracker:
+    """Completion time sketches keyed by parser ID."""
+
+    def __init__(self):
+        self._sketches: Dict[str, LatencySketch] = {}
+
+    def record(self, parser_id: str, seconds: float):
+        """Record a task completion time for a parser."""
+        sketch = self._sketches.get(parser_id)
+        if sketch is None:
+            sketch = self._sketches[parser_id] = LatencySketch()
+        sketch.add(seconds)
+
+    def get(self, parser_id: str) -> Optional[LatencySketch]:
+        """Get the sketch for a parser, if any completions were recorded."""
+        return self._sketches.get(parser_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-parser latency summaries."""
+        return {parser_id: sketch.to_dict() for parser_id, sketch in sorted(self._sketches.items())}
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
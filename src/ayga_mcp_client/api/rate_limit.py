@@ -0,0 +1,179 @@
+"""Token-bucket rate limiting that adapts to 429 responses."""
+
+import asyncio
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+
+# Defaults: API requests per second (all requests) and task submissions per
+# second per parser; bursts up to the bucket capacity are sent at once
+DEFAULT_GLOBAL_RATE = 50.0
+DEFAULT_GLOBAL_BURST = 100
+DEFAULT_PARSER_RATE = 5.0
+DEFAULT_PARSER_BURST = 20
+
+# Pause used when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 5.0
+MAX_RETRY_AFTER = 300.0
+
+# Adaptation: halve the rate on 429, recover 5% of the configured rate per
+# successful request, never go below 10% of it
+RATE_DECREASE_FACTOR = 0.5
+RATE_RECOVERY_STEP = 0.05
+MIN_RATE_FRACTION = 0.1
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """Token bucket with reservations, a pause and an adaptive rate.
+
+    Tokens may go negative: a caller reserves what it needs right away and
+    sleeps until the bucket would have refilled, so waiting callers are
+    served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.paused_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return how long to wait before using them."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= tokens
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def penalize(self, retry_after: float):
+        """Back off after a 429: pause and lower the rate."""
+        now = time.monotonic()
+        self._refill(now)
+        self.paused_until = max(self.paused_until, now + retry_after)
+        self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate * RATE_DECREASE_FACTOR)
+        self.tokens = min(self.tokens, 0.0)
+
+    def recover(self):
+        """Raise the rate back toward its configured value after a success."""
+        if self.rate < self.base_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RATE_RECOVERY_STEP)
+
+
+class RateLimiter:
+    """Global request limit plus per-parser task submission limits.
+
+    Callers are delayed, never failed: acquire() sleeps until the buckets
+    allow the request. A 429 response pauses the global bucket for the
+    Retry-After delay (and the submitting parsers' buckets, for task
+    pushes) and halves their rates, which recover gradually on success.
+    """
+
+    def __init__(
+        self,
+        global_rate: Optional[float] = DEFAULT_GLOBAL_RATE,
+        global_burst: int = DEFAULT_GLOBAL_BURST,
+        parser_rate: Optional[float] = DEFAULT_PARSER_RATE,
+        parser_burst: int = DEFAULT_PARSER_BURST,
+    ):
+        """Initialize limiter.
+
+        Args:
+            global_rate: API requests per second (None or 0 = unlimited)
+            global_burst: Requests sent back to back before the rate applies
+            parser_rate: Task submissions per second per parser (None or 0 =
+                unlimited)
+            parser_burst: Submissions per parser sent back to back
+        """
+        self.global_bucket = TokenBucket(global_rate, global_burst) if global_rate else None
+        self.parser_rate = parser_rate
+        self.parser_burst = parser_burst
+        self._parsers: Dict[str, TokenBucket] = {}
+        self._delayed = 0
+        self._delay_total = 0.0
+        self._rate_limited = 0
+
+    def _parser_bucket(self, parser_id: str) -> Optional[TokenBucket]:
+        if not self.parser_rate:
+            return None
+        bucket = self._parsers.get(parser_id)
+        if bucket is None:
+            bucket = self._parsers[parser_id] = TokenBucket(self.parser_rate, self.parser_burst)
+        return bucket
+
+    async def acquire(self):
+        """Wait for the global bucket to allow one API request."""
+        if self.global_bucket is not None:
+            await self._sleep(self.global_bucket.reserve())
+
+    async def acquire_tasks(self, parser_ids: Iterable[str]):
+        """Wait until every parser's bucket allows its share of a task push."""
+        wait = 0.0
+        for parser_id, count in Counter(parser_ids).items():
+            bucket = self._parser_bucket(parser_id)
+            if bucket is not None:
+                wait = max(wait, bucket.reserve(count))
+        await self._sleep(wait)
+
+    async def _sleep(self, wait: float):
+        if wait > 0:
+            self._delayed += 1
+            self._delay_total += wait
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self, retry_after: Optional[float], parser_ids: Iterable[str] = ()):
+        """Record a 429 response."""
+        self._rate_limited += 1
+        delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        if self.global_bucket is not None:
+            self.global_bucket.penalize(delay)
+        for parser_id in set(parser_ids):
+            bucket = self._parser_bucket(parser_id)
+            if bucket is not None:
+                bucket.penalize(delay)
+
+    def on_success(self, parser_ids: Iterable[str] = ()):
+        """Record a successful request."""
+        if self.global_bucket is not None:
+            self.global_bucket.recover()
+        for parser_id in set(parser_ids):
+            bucket = self._parsers.get(parser_id)
+            if bucket is not None:
+                bucket.recover()
+
+    def stats(self) -> Dict[str, Any]:
+        """Delays, 429 responses and current (adapted) rates."""
+        return {
+            "delayed": self._delayed,
+            "delay_seconds": round(self._delay_total, 3),
+            "rate_limited": self._rate_limited,
+            "global_rate": round(self.global_bucket.rate, 2) if self.global_bucket else None,
+            "throttled_parsers": {
+                parser_id: round(bucket.rate, 2)
+                for parser_id, bucket in self._parsers.items()
+                if bucket.rate < bucket.base_rate
+            },
+        }
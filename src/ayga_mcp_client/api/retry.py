@@ -0,0 +1,146 @@
+"""Retry policy for transient errors: per-code limits, jittered backoff, deadline."""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, TypeVar
+
+import httpx
+
+from ..error_handler import ERROR_CODES, ErrorHandler
+
+
+T = TypeVar("T")
+
+# Retries per error code; only codes ERROR_CODES marks can_retry are retried
+DEFAULT_RETRY_LIMITS = {
+    "TIMEOUT": 1,
+    "RATE_LIMIT": 2,
+    "CONNECTION_ERROR": 3,
+    "SERVICE_UNAVAILABLE": 3,
+}
+
+# Decorrelated jitter: each delay is drawn from [base, 3 * previous delay],
+# capped at the maximum
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+
+# An attempt is not started with less than this many seconds of budget left
+MIN_ATTEMPT_BUDGET = 1.0
+
+# Gateway errors worth another attempt; other 5xx are reported as they are
+_UNAVAILABLE_STATUSES = {502, 503, 504}
+
+
+class RetryPolicy:
+    """Retries transient failures within a total deadline.
+
+    Failures are classified into ERROR_CODES codes - by exception type for
+    HTTP and timeout errors, otherwise from the message as the enhanced
+    error responses do. Codes marked can_retry are retried up to their
+    limit, sleeping a decorrelated-jitter delay between attempts. No
+    attempt starts unless the delay plus MIN_ATTEMPT_BUDGET fits in what
+    is left of the deadline, so retries never extend a tool call's timeout.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, int]] = None,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        min_attempt_budget: float = MIN_ATTEMPT_BUDGET,
+    ):
+        """Initialize policy.
+
+        Args:
+            limits: Retries per error code (default: DEFAULT_RETRY_LIMITS;
+                0 disables retries for a code)
+            base_delay: Smallest delay between attempts in seconds
+            max_delay: Largest delay between attempts in seconds
+            min_attempt_budget: Seconds an attempt needs to be started
+        """
+        self.limits = {**DEFAULT_RETRY_LIMITS, **(limits or {})}
+        self.base_delay = base_delay
+        self.max_delay = max(base_delay, max_delay)
+        self.min_attempt_budget = min_attempt_budget
+        self._retries: Counter = Counter()
+        self._recovered = 0
+        self._exhausted: Counter = Counter()
+        self._out_of_budget = 0
+
+    @staticmethod
+    def classify(error: BaseException) -> str:
+        """ERROR_CODES code of a failure."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status == 429:
+                return "RATE_LIMIT"
+            if status in _UNAVAILABLE_STATUSES:
+                return "SERVICE_UNAVAILABLE"
+        elif isinstance(error, (httpx.TimeoutException, TimeoutError)):
+            return "TIMEOUT"
+        elif isinstance(error, httpx.TransportError):
+            return "CONNECTION_ERROR"
+        return ErrorHandler.detect_error_code(str(error), "")
+
+    def max_retries(self, code: str) -> int:
+        """Retries allowed for an error code."""
+        if not ERROR_CODES.get(code, {}).get("can_retry"):
+            return 0
+        return max(0, self.limits.get(code, 0))
+
+    def next_delay(self, previous: float) -> float:
+        """Delay before the next attempt, given the previous delay."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    async def run(
+        self, operation: Callable[[], Awaitable[T]], deadline: Callable[[], float]
+    ) -> T:
+        """Run an operation, retrying transient failures until the deadline.
+
+        Args:
+            operation: Async callable making one attempt
+            deadline: Returns the time.monotonic() value all attempts and
+                delays must fit in; read after each failure, so it may be
+                extended while the operation runs
+
+        Returns:
+            The first successful attempt's result
+
+        Raises:
+            Exception: The last failure, once it is not retryable, its
+                code's retries are used up or the budget is spent
+        """
+        retries: Counter = Counter()
+        delay = self.base_delay
+        while True:
+            try:
+                result = await operation()
+            except Exception as e:
+                code = self.classify(e)
+                limit = self.max_retries(code)
+                if retries[code] >= limit:
+                    if limit:
+                        self._exhausted[code] += 1
+                    raise
+                delay = self.next_delay(delay)
+                if deadline() - time.monotonic() - delay < self.min_attempt_budget:
+                    self._out_of_budget += 1
+                    raise
+                retries[code] += 1
+                self._retries[code] += 1
+                await asyncio.sleep(delay)
+                continue
+            if retries:
+                self._recovered += 1
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Retries per error code and how retried calls ended."""
+        return {
+            "retries": dict(self._retries),
+            "recovered": self._recovered,
+            "exhausted": dict(self._exhausted),
+            "out_of_budget": self._out_of_budget,
+        }
@@ -0,0 +1,246 @@
+"""Client-side task scheduler: per-category concurrency caps with priorities."""
+
+import asyncio
+import contextlib
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, Mapping, Optional
+
+from ..registry import DEFAULT_TIMEOUT, TIMEOUT_CLASSES, get_parser
+
+
+# Priority classes: interactive tool calls are served before batch work
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BATCH)
+
+# Seconds of A-Parser work each category may have in flight; divided by the
+# category timeout this gives fast 96, medium 48 and slow 32 concurrent tasks,
+# so two run_batch calls at the default concurrency fit in the batch share
+SCHEDULER_BUDGET = 5760
+
+DEFAULT_CATEGORY_LIMITS = {
+    category: max(2, SCHEDULER_BUDGET // timeout) for category, timeout in TIMEOUT_CLASSES.items()
+}
+
+# Fraction of each category's slots batch work may use; the rest is kept
+# free so interactive calls start without waiting behind a batch
+BATCH_SHARE = 0.75
+
+
+def parse_category_limits(value: str) -> Dict[str, int]:
+    """Parse 'category=limit' pairs, e.g. 'slow=32,medium=48'.
+
+    Raises:
+        ValueError: If a pair is malformed, the category is not a timeout
+            class or the limit is not a positive integer
+    """
+    limits = {}
+    for pair in filter(None, (part.strip() for part in value.split(","))):
+        category, sep, limit = pair.partition("=")
+        category = category.strip()
+        if not sep or category not in TIMEOUT_CLASSES:
+            raise ValueError(
+                f"expected category=limit with category in {', '.join(TIMEOUT_CLASSES)}, got {pair!r}"
+            )
+        if not limit.strip().isdigit() or int(limit) < 1:
+            raise ValueError(f"limit for {category} must be a positive integer, got {limit!r}")
+        limits[category] = int(limit)
+    return limits
+
+
+class _Category:
+    """Slots and wait queues of one parser category."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.batch_limit = max(1, min(limit - 1, int(limit * BATCH_SHARE)))
+        self.active = 0
+        # priority -> caller -> waiting futures; callers are served round-robin
+        self.waiting: Dict[str, "OrderedDict[Hashable, Deque[asyncio.Future]]"] = {
+            priority: OrderedDict() for priority in PRIORITIES
+        }
+        self.acquired = {priority: 0 for priority in PRIORITIES}
+        self.waited = {priority: 0 for priority in PRIORITIES}
+        self.wait_total = {priority: 0.0 for priority in PRIORITIES}
+        self.wait_max = {priority: 0.0 for priority in PRIORITIES}
+
+    def can_admit(self, priority: str) -> bool:
+        limit = self.limit if priority == PRIORITY_INTERACTIVE else self.batch_limit
+        return self.active < limit
+
+    def queued(self, priority: str) -> int:
+        return sum(len(queue) for queue in self.waiting[priority].values())
+
+    def next_waiter(self, priority: str) -> Optional[asyncio.Future]:
+        """Pop the next live waiter, rotating between callers."""
+        callers = self.waiting[priority]
+        while callers:
+            caller, queue = next(iter(callers.items()))
+            future = queue.popleft()
+            del callers[caller]
+            if queue:
+                callers[caller] = queue  # Back of the line for this caller
+            if not future.done():
+                return future
+        return None
+
+
+class TaskScheduler:
+    """Limits how many A-Parser tasks the client has in flight.
+
+    Each parser category (its timeout class) has a concurrency cap. A task
+    holds a slot from submission until its result is delivered, it fails or
+    it is abandoned. Interactive calls are admitted before batch work, and
+    batch work never takes the last slots of a category. Within a priority
+    class, waiting callers (e.g. concurrent batches) take turns.
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, int]] = None):
+        """Initialize scheduler.
+
+        Args:
+            limits: Concurrent tasks per category (default:
+                DEFAULT_CATEGORY_LIMITS)
+        """
+        limits = {**DEFAULT_CATEGORY_LIMITS, **(limits or {})}
+        self._categories = {category: _Category(max(1, limit)) for category, limit in limits.items()}
+        self._callers = itertools.count()
+
+    @staticmethod
+    def category_of(parser_id: str) -> str:
+        """Category (timeout class) a parser's tasks are scheduled in."""
+        spec = get_parser(parser_id)
+        return spec.timeout_class if spec else "medium"
+
+    def _category(self, parser_id: str) -> _Category:
+        category = self.category_of(parser_id)
+        if category not in self._categories:
+            self._categories[category] = _Category(DEFAULT_CATEGORY_LIMITS.get(
+                category, max(2, SCHEDULER_BUDGET // DEFAULT_TIMEOUT)
+            ))
+        return self._categories[category]
+
+    def limit(self, parser_id: str, priority: str = PRIORITY_INTERACTIVE) -> int:
+        """Most tasks of a priority class the parser's category runs at once."""
+        state = self._category(parser_id)
+        return state.limit if priority == PRIORITY_INTERACTIVE else state.batch_limit
+
+    def try_acquire(self, parser_id: str, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """Take a slot if one is free right now, without queueing."""
+        state = self._category(parser_id)
+        if not self._admissible(state, priority):
+            return False
+        self._admit(state, priority, 0.0)
+        return True
+
+    async def acquire(
+        self,
+        parser_id: str,
+        priority: str = PRIORITY_INTERACTIVE,
+        caller: Optional[Hashable] = None,
+    ):
+        """Wait for a slot in the parser's category.
+
+        Args:
+            parser_id: Parser the task is for
+            priority: PRIORITY_INTERACTIVE or PRIORITY_BATCH
+            caller: Identity for fair queuing; waiters with the same caller
+                share one turn (default: a caller of its own)
+        """
+        state = self._category(parser_id)
+        if self._admissible(state, priority):
+            self._admit(state, priority, 0.0)
+            return
+
+        if caller is None:
+            caller = next(self._callers)
+        future = asyncio.get_running_loop().create_future()
+        state.waiting[priority].setdefault(caller, deque()).append(future)
+        start = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Handed a slot just as we were cancelled - pass it on
+                self._release(state)
+            else:
+                queue = state.waiting[priority].get(caller)
+                if queue is not None and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del state.waiting[priority][caller]
+            raise
+        self._record_wait(state, priority, time.monotonic() - start)
+
+    def release(self, parser_id: str):
+        """Free a slot taken with acquire() or try_acquire()."""
+        self._release(self._category(parser_id))
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        parser_id: str,
+        priority: str = PRIORITY_INTERACTIVE,
+        caller: Optional[Hashable] = None,
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(parser_id, priority, caller)
+        try:
+            yield
+        finally:
+            self.release(parser_id)
+
+    def _admissible(self, state: _Category, priority: str) -> bool:
+        # Nobody of the same or a higher priority may be queued ahead of us
+        for other in PRIORITIES:
+            if state.queued(other):
+                return False
+            if other == priority:
+                break
+        return state.can_admit(priority)
+
+    def _admit(self, state: _Category, priority: str, wait: float):
+        state.active += 1
+        self._record_wait(state, priority, wait)
+
+    def _record_wait(self, state: _Category, priority: str, wait: float):
+        state.acquired[priority] += 1
+        if wait > 0:
+            state.waited[priority] += 1
+            state.wait_total[priority] += wait
+            state.wait_max[priority] = max(state.wait_max[priority], wait)
+
+    def _release(self, state: _Category):
+        state.active = max(0, state.active - 1)
+        # Hand freed slots to waiters, highest priority first
+        for priority in PRIORITIES:
+            while state.can_admit(priority):
+                future = state.next_waiter(priority)
+                if future is None:
+                    break
+                state.active += 1
+                future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-category slots in use, queue depth and wait times."""
+        categories = {}
+        for category, state in self._categories.items():
+            categories[category] = {
+                "limit": state.limit,
+                "batch_limit": state.batch_limit,
+                "active": state.active,
+                "queued": {priority: state.queued(priority) for priority in PRIORITIES},
+                "acquired": dict(state.acquired),
+                "waited": dict(state.waited),
+                "avg_wait_seconds": {
+                    priority: round(state.wait_total[priority] / state.waited[priority], 3)
+                    if state.waited[priority] else 0.0
+                    for priority in PRIORITIES
+                },
+                "max_wait_seconds": {
+                    priority: round(state.wait_max[priority], 3) for priority in PRIORITIES
+                },
+            }
+        return categories
@@ -4,6 +4,8 @@ import json
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from .registry import get_parser
+
 
 # Error codes and their definitions
 ERROR_CODES = {
@@ -82,99 +84,6 @@ ERROR_CODES = {
 }
 
 
-# Parser-specific error context
-PARSER_CONTEXT = {
-    "perplexity": {
-        "name": "Perplexity AI",
-        "docs_url": "https://www.perplexity.ai/",
-        "common_issues": {
-            "timeout": "Deep Research queries can take 60-120 seconds",
-            "rate_limit": "Free tier: 5 queries/day, Pro: 600 queries/day"
-        }
-    },
-    "chatgpt": {
-        "name": "ChatGPT",
-        "docs_url": "https://platform.openai.com/",
-        "common_issues": {
-            "timeout": "Complex queries may take 30-60 seconds",
-            "rate_limit": "Rate limits depend on your API tier"
-        }
-    },
-    "claude": {
-        "name": "Claude AI",
-        "docs_url": "https://docs.anthropic.com/",
-        "common_issues": {
-            "timeout": "Long context queries may take 45-90 seconds",
-            "rate_limit": "Rate limits depend on your API tier"
-        }
-    },
-    "gemini": {
-        "name": "Google Gemini",
-        "docs_url": "https://ai.google.dev/",
-        "common_issues": {
-            "timeout": "Multimodal queries may take longer",
-            "rate_limit": "15 queries/minute for free tier"
-        }
-    },
-    "copilot": {
-        "name": "Microsoft Copilot",
-        "docs_url": "https://learn.microsoft.com/en-us/bing/copilot/",
-        "common_issues": {
-            "timeout": "Web search queries: 15-30 seconds",
-            "rate_limit": "Standard Microsoft rate limits apply"
-        }
-    },
-    "grok": {
-        "name": "Grok AI",
-        "docs_url": "https://x.ai/",
-        "common_issues": {
-            "timeout": "Real-time data queries: 20-40 seconds",
-            "rate_limit": "Premium subscribers have higher limits"
-        }
-    },
-    "deepseek": {
-        "name": "DeepSeek",
-        "docs_url": "https://www.deepseek.com/",
-        "common_issues": {
-            "timeout": "Technical queries: 30-60 seconds",
-            "rate_limit": "Check current rate limits"
-        }
-    },
-    "google_search": {
-        "name": "Google Search",
-        "docs_url": "https://developers.google.com/custom-search/",
-        "common_issues": {
-            "timeout": "Search queries: 5-15 seconds",
-            "rate_limit": "100 queries/day for free tier"
-        }
-    },
-    "bing_search": {
-        "name": "Bing Search",
-        "docs_url": "https://www.microsoft.com/en-us/bing/apis/",
-        "common_issues": {
-            "timeout": "Search queries: 5-15 seconds",
-            "rate_limit": "1000 queries/month for free tier"
-        }
-    },
-    "duckduckgo": {
-        "name": "DuckDuckGo",
-        "docs_url": "https://duckduckgo.com/",
-        "common_issues": {
-            "timeout": "Search queries: 5-10 seconds",
-            "rate_limit": "No strict rate limit"
-        }
-    },
-    "youtube_search": {
-        "name": "YouTube Search",
-        "docs_url": "https://developers.google.com/youtube/",
-        "common_issues": {
-            "timeout": "Video metadata: 5-15 seconds",
-            "rate_limit": "100 units/day for free tier"
-        }
-    }
-}
-
-
 class ErrorHandler:
     """Enhanced error handling with detailed context."""
 
@@ -217,7 +126,14 @@ class ErrorHandler:
     @staticmethod
     def get_parser_context(parser_id: str) -> Optional[Dict[str, Any]]:
         """Get parser-specific context."""
-        return PARSER_CONTEXT.get(parser_id)
+        spec = get_parser(parser_id)
+        if spec is None or spec.docs_url is None:
+            return None
+        return {
+            "name": spec.name,
+            "docs_url": spec.docs_url,
+            "common_issues": dict(spec.common_issues or {}),
+        }
 
     @staticmethod
     def create_enhanced_error(
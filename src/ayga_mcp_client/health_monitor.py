@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Optional
 from collections import defaultdict
 import asyncio
 
+from .registry import DEFAULT_THRESHOLDS, get_parser
+
 
 class HealthStatus:
     """Parser health status tracking."""
@@ -254,61 +256,7 @@ class HealthMonitor:
         return self.status_tracker.get_parser_status(parser_id)
 
 
-# Performance thresholds for different parsers
-PARSER_THRESHOLDS = {
-    "perplexity": {
-        "response_time_good": 10000,  # 10s
-        "response_time_degraded": 20000,  # 20s
-    },
-    "chatgpt": {
-        "response_time_good": 8000,
-        "response_time_degraded": 15000,
-    },
-    "claude": {
-        "response_time_good": 10000,
-        "response_time_degraded": 20000,
-    },
-    "gemini": {
-        "response_time_good": 8000,
-        "response_time_degraded": 15000,
-    },
-    "copilot": {
-        "response_time_good": 5000,
-        "response_time_degraded": 10000,
-    },
-    "grok": {
-        "response_time_good": 5000,
-        "response_time_degraded": 10000,
-    },
-    "deepseek": {
-        "response_time_good": 8000,
-        "response_time_degraded": 15000,
-    },
-    "google_search": {
-        "response_time_good": 2000,
-        "response_time_degraded": 5000,
-    },
-    "bing_search": {
-        "response_time_good": 2000,
-        "response_time_degraded": 5000,
-    },
-    "duckduckgo": {
-        "response_time_good": 2000,
-        "response_time_degraded": 5000,
-    },
-    "youtube_search": {
-        "response_time_good": 3000,
-        "response_time_degraded": 7000,
-    },
-}
-
-
 def get_parser_thresholds(parser_id: str) -> Dict[str, float]:
     """Get performance thresholds for a parser."""
-    return PARSER_THRESHOLDS.get(
-        parser_id,
-        {
-            "response_time_good": 5000,
-            "response_time_degraded": 15000,
-        }
-    )
+    spec = get_parser(parser_id)
+    return (spec.thresholds if spec else DEFAULT_THRESHOLDS).to_dict()
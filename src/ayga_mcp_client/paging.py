@@ -0,0 +1,245 @@
+"""Response size controls for parser tool results.
+
+Parser tools accept ``fields`` (projection), ``max_items`` and ``max_bytes``.
+When a result does not fit in one response, the first page is returned with
+a cursor and the (projected) data is kept in a small in-memory ResultStore;
+the ``get_result_page`` tool serves later pages from it.
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ._json import dumps
+
+
+# Results kept for get_result_page (count and total JSON size), and how
+# long a cursor stays valid
+RESULT_STORE_SIZE = 32
+RESULT_STORE_MAX_BYTES = 32 * 1024 * 1024
+RESULT_STORE_TTL = 900
+
+# Smallest max_bytes honored, so every page makes progress
+MIN_PAGE_BYTES = 256
+
+
+class ResultStore:
+    """Bounded, expiring store of results that have more pages to serve.
+
+    Least recently used results are dropped beyond max_entries or once the
+    stored data's JSON size exceeds max_bytes; the newest result is always
+    kept, so the cursor just handed out works.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESULT_STORE_SIZE,
+        ttl: float = RESULT_STORE_TTL,
+        max_bytes: int = RESULT_STORE_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._bytes = 0
+        # result ID -> (expires_at, size, data, max_items, max_bytes, as_text)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any, Optional[int], Optional[int], bool]]" = (
+            OrderedDict()
+        )
+
+    def put(
+        self, data: Any, max_items: Optional[int], max_bytes: Optional[int], as_text: bool = False
+    ) -> str:
+        """Store data with its page limits and layout and return its result ID."""
+        self._purge()
+        result_id = uuid.uuid4().hex[:16]
+        size = len(dumps(data))
+        self._entries[result_id] = (
+            time.monotonic() + self.ttl, size, data, max_items, max_bytes, as_text
+        )
+        self._bytes += size
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+        return result_id
+
+    def get(self, result_id: str) -> Optional[Tuple[Any, Optional[int], Optional[int], bool]]:
+        """Get (data, max_items, max_bytes, as_text) for a result ID, if still stored."""
+        self._purge()
+        entry = self._entries.get(result_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(result_id)
+        _, _, data, max_items, max_bytes, as_text = entry
+        return data, max_items, max_bytes, as_text
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, result_id: str):
+        self._bytes -= self._entries.pop(result_id)[1]
+
+    def _purge(self):
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry[0] <= now]
+        for key in expired:
+            self._remove(key)
+
+
+def make_cursor(result_id: str, offset: int) -> str:
+    return f"{result_id}.{offset}"
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a cursor into (result_id, offset).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    result_id, _, offset = cursor.partition(".")
+    if not result_id or not offset.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return result_id, int(offset)
+
+
+def project(data: Any, fields: Sequence[str]) -> Any:
+    """Keep only the given fields.
+
+    Fields are dotted paths ('title', 'comments.text'). Lists are projected
+    element by element, so 'comments.text' keeps only the text of each
+    comment.
+    """
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+    return _project(data, tree)
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, dict):
+        return {key: _project(value[key], sub) for key, sub in tree.items() if key in value}
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    return value
+
+
+def item_list_key(data: Any) -> Optional[str]:
+    """Find the list a result is paged over.
+
+    Returns:
+        '' if the data itself is a list, the key of its longest top-level
+        list if it is a dict, or None if there is nothing to page over
+    """
+    if isinstance(data, list):
+        return ""
+    if isinstance(data, dict):
+        lists: List[Tuple[int, str]] = [
+            (len(value), key) for key, value in data.items() if isinstance(value, list) and value
+        ]
+        if lists:
+            return max(lists, key=lambda entry: entry[0])[1]
+    return None
+
+
+def page(
+    data: Any,
+    offset: int = 0,
+    max_items: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    as_text: Optional[bool] = None,
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Cut one page out of a result.
+
+    Data with an item list is paged by items: up to max_items items, fewer
+    if the page would exceed max_bytes (at least one item is always
+    returned). The first page keeps the other top-level fields; later pages
+    carry only the item list. Data without a list - or whose other fields
+    or largest item alone would not fit in max_bytes - is paged as compact
+    JSON text in max_bytes slices.
+
+    Args:
+        data: Result data (already projected)
+        offset: Item index, or byte offset for text pages
+        max_items: Maximum items per page
+        max_bytes: Approximate maximum size of the page's JSON
+        as_text: Page as JSON text (True) or by items (False); decided
+            from the data and max_bytes if None. Pass the first page's
+            choice for later pages, so offsets keep their meaning.
+
+    Returns:
+        Tuple of (response fields, next offset or None on the last page).
+        The response fields are 'data' or 'data_text' plus 'page' metadata.
+    """
+    if max_items is not None:
+        max_items = max(1, max_items)
+    if max_bytes is not None:
+        max_bytes = max(MIN_PAGE_BYTES, max_bytes)
+
+    key = item_list_key(data)
+    if as_text is None:
+        as_text = key is None or (max_bytes is not None and not _fits_item_pages(data, key, max_bytes))
+    if key is not None and not as_text:
+        return _item_page(data, key, offset, max_items, max_bytes)
+
+    if max_bytes is None or (offset == 0 and len(dumps(data)) <= max_bytes):
+        return {"data": data}, None
+
+    encoded = dumps(data).encode("utf-8")
+    text = encoded[offset:offset + max_bytes].decode("utf-8", "ignore")
+    end = offset + len(text.encode("utf-8"))
+    next_offset = end if end < len(encoded) else None
+    info = {"offset": offset, "bytes": end - offset, "total_bytes": len(encoded)}
+    return {"data_text": text, "page": info}, next_offset
+
+
+def _envelope(data: Any, key: str) -> Any:
+    """The first item page without its items: the other top-level fields."""
+    if key == "":
+        return []
+    return {name: value for name, value in data.items() if name != key}
+
+
+def _page_overhead(envelope: Any, key: str) -> int:
+    return len(dumps(envelope)) + len(key) + 4
+
+
+def _fits_item_pages(data: Any, key: str, max_bytes: int) -> bool:
+    """Whether the first page's fields plus the largest item fit in max_bytes."""
+    items: List[Any] = data if key == "" else data[key]
+    largest = max((len(dumps(item)) + 1 for item in items), default=0)
+    return _page_overhead(_envelope(data, key), key) + largest <= max_bytes
+
+
+def _item_page(
+    data: Any, key: str, offset: int, max_items: Optional[int], max_bytes: Optional[int]
+) -> Tuple[Dict[str, Any], Optional[int]]:
+    items: List[Any] = data if key == "" else data[key]
+    end = len(items) if max_items is None else min(len(items), offset + max_items)
+
+    envelope = _envelope(data, key) if key == "" or offset == 0 else {}
+
+    if max_bytes is not None:
+        # Add items while the page fits; always return at least one
+        size = _page_overhead(envelope, key)
+        for index in range(offset, end):
+            size += len(dumps(items[index])) + 1
+            if size > max_bytes and index > offset:
+                end = index
+                break
+
+    page_items = items[offset:end]
+    if key == "":
+        page_data: Any = page_items
+    else:
+        page_data = {**envelope, key: page_items}
+
+    info = {"items": key or None, "offset": offset, "count": len(page_items), "total": len(items)}
+    next_offset = end if end < len(items) else None
+    if offset == 0 and next_offset is None:
+        return {"data": page_data}, None
+    return {"data": page_data, "page": info}, next_offset
@@ -0,0 +1,449 @@
+"""Parser registry: one immutable record per supported parser.
+
+Tool names, A-Parser names, timeouts, cache policies, health thresholds and
+error context are all looked up here, so adding or tuning a parser touches a
+single entry.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+# Default wait (seconds) by timeout class, based on A-Parser processing time
+TIMEOUT_CLASSES = MappingProxyType({
+    "fast": 60,  # 10-30 seconds
+    "medium": 120,  # 30-60 seconds
+    "slow": 180,  # 60-120+ seconds
+})
+DEFAULT_TIMEOUT = 120  # Unknown parsers
+
+
+@dataclass(frozen=True, slots=True)
+class HealthThresholds:
+    """Response time thresholds (ms) for health checks."""
+
+    response_time_good: float = 5000
+    response_time_degraded: float = 15000
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "response_time_good": self.response_time_good,
+            "response_time_degraded": self.response_time_degraded,
+        }
+
+
+DEFAULT_THRESHOLDS = HealthThresholds()
+
+
+@dataclass(frozen=True, slots=True)
+class OptionSpec:
+    """One tool argument forwarded to A-Parser as a task option.
+
+    Attributes:
+        name: Tool argument name
+        aparser_name: A-Parser option name
+        type: JSON schema type ('string', 'integer' or 'boolean')
+        description: Schema description
+        default: Schema default
+    """
+
+    name: str
+    aparser_name: str
+    type: str
+    description: str
+    default: Any = None
+
+    def schema(self) -> Dict[str, Any]:
+        """JSON schema for the tool argument."""
+        return {"type": self.type, "description": self.description, "default": self.default}
+
+    def convert(self, value: Any) -> Any:
+        """Validate a tool argument, converting lossless representations.
+
+        Raises:
+            ValueError: If the value does not fit the option type
+        """
+        if self.type == "integer":
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+            if isinstance(value, float) and value.is_integer():
+                return int(value)
+            if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+                return int(value)
+        elif self.type == "boolean":
+            if isinstance(value, bool):
+                return value
+            if isinstance(value, str) and value.lower() in ("true", "false"):
+                return value.lower() == "true"
+            if value in (0, 1):
+                return bool(value)
+        elif isinstance(value, str):
+            return value
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        raise ValueError(f"Invalid value for option '{self.name}': expected {self.type}, got {value!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class ParserSpec:
+    """Static description of one parser.
+
+    Attributes:
+        id: Parser ID used in tool names and the API
+        name: Display name
+        description: Tool description
+        prefix: Tool name prefix (tool name is prefix + id)
+        aparser_name: A-Parser parser the task is sent to
+        category: Parser category (FreeAI, YouTube, Social, ...)
+        timeout_class: Key into TIMEOUT_CLASSES
+        cache_policy: Result cache policy ('short', 'medium' or 'long')
+        options: Tool arguments forwarded to A-Parser besides 'preset'
+        presets: Allowed presets (any preset when empty)
+        preset_description: Schema description for 'preset'
+        thresholds: Health check response time thresholds
+        docs_url: Upstream documentation, shown in error details
+        common_issues: Troubleshooting tips by lowercase error code
+    """
+
+    id: str
+    name: str
+    description: str
+    prefix: str
+    aparser_name: str
+    category: str
+    timeout_class: str
+    cache_policy: str = "short"
+    options: Tuple[OptionSpec, ...] = ()
+    presets: Tuple[str, ...] = ()
+    preset_description: str = "Parser preset"
+    thresholds: HealthThresholds = DEFAULT_THRESHOLDS
+    docs_url: Optional[str] = None
+    common_issues: Optional[Mapping[str, str]] = None
+    # Option name -> spec, for one-pass translation
+    option_map: Mapping[str, OptionSpec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "option_map", MappingProxyType({option.name: option for option in self.options})
+        )
+
+    @property
+    def tool_name(self) -> str:
+        return f"{self.prefix}{self.id}"
+
+    @property
+    def submit_tool_name(self) -> str:
+        """Tool that submits a task and returns its ID without waiting."""
+        return f"submit_{self.id}"
+
+    @property
+    def default_timeout(self) -> int:
+        return TIMEOUT_CLASSES.get(self.timeout_class, DEFAULT_TIMEOUT)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary in the tool listing format (id, name, description, prefix)."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "prefix": self.prefix,
+        }
+
+
+_PAGES_COUNT = OptionSpec("pages_count", "pagesCount", "integer", "Number of pages to fetch", 1)
+
+_TRANSLATE_OPTIONS = (
+    OptionSpec("from_language", "fromLanguage", "string", "Source language (auto for auto-detection)", "auto"),
+    OptionSpec("to_language", "toLanguage", "string", "Target language", "en"),
+)
+_REDDIT_SEARCH_OPTIONS = (
+    _PAGES_COUNT,
+    OptionSpec("sort", "sort", "string", "Sort order", "relevance"),
+)
+_TRENDS_OPTIONS = (
+    OptionSpec(
+        "category", "search_category", "string",
+        "Category ID: 0=All, 3=Arts, 5=Computers, 7=Finance, 12=Business, 13=Health, 16=News, 22=Shopping, 174=Sports",
+        "0",
+    ),
+    OptionSpec(
+        "region", "search_region", "string",
+        "Country code (ISO 3166-1): '' (Worldwide), US, GB, DE, FR, RU, JP, CN, etc.",
+        "",
+    ),
+    OptionSpec(
+        "time_period", "search_time", "string",
+        "Time period: 'today 5-y', 'today 12-m', 'today 3-m', 'today 1-m', 'now 7-d', 'now 1-d', 'now 1-H'",
+        "today 5-y",
+    ),
+    OptionSpec("language", "hl", "string", "Interface language code: en, ru, de, fr, es, ja, etc.", "en"),
+    OptionSpec(
+        "property", "search_property", "string",
+        "Search property: '' (Web), 'images', 'news', 'froogle' (Shopping), 'youtube'",
+        "",
+    ),
+    OptionSpec(
+        "use_empty_queries", "use_empty_queries", "boolean",
+        "Get category trending without keywords (query should be language code)",
+        False,
+    ),
+)
+
+_FAST_SEARCH = HealthThresholds(2000, 5000)
+
+
+def _issues(timeout: str, rate_limit: str) -> Mapping[str, str]:
+    return MappingProxyType({"timeout": timeout, "rate_limit": rate_limit})
+
+
+PARSER_SPECS: Tuple[ParserSpec, ...] = (
+    # FreeAI Category (6 parsers)
+    ParserSpec(
+        "perplexity", "Perplexity AI", "AI-powered search with sources", "search_",
+        "FreeAI::Perplexity", "FreeAI", "fast",
+        thresholds=HealthThresholds(10000, 20000),
+        docs_url="https://www.perplexity.ai/",
+        common_issues=_issues(
+            "Deep Research queries can take 60-120 seconds",
+            "Free tier: 5 queries/day, Pro: 600 queries/day",
+        ),
+    ),
+    ParserSpec(
+        "googleai", "Google AI", "Google AI-powered search with structured sources", "search_",
+        "FreeAI::GoogleAI", "FreeAI", "slow",
+    ),
+    ParserSpec(
+        "chatgpt", "ChatGPT", "ChatGPT with web search", "search_",
+        "FreeAI::ChatGPT", "FreeAI", "fast",
+        thresholds=HealthThresholds(8000, 15000),
+        docs_url="https://platform.openai.com/",
+        common_issues=_issues(
+            "Complex queries may take 30-60 seconds",
+            "Rate limits depend on your API tier",
+        ),
+    ),
+    ParserSpec(
+        "kimi", "Kimi AI", "Kimi AI for translation and education", "search_",
+        "FreeAI::Kimi", "FreeAI", "fast",
+    ),
+    ParserSpec(
+        "deepai", "DeepAI", "DeepAI multi-style chat", "search_",
+        "FreeAI::DeepAI", "FreeAI", "fast",
+    ),
+    ParserSpec(
+        "copilot", "Microsoft Copilot", "Microsoft Copilot search", "search_",
+        "FreeAI::Copilot", "FreeAI", "fast",
+        thresholds=HealthThresholds(5000, 10000),
+        docs_url="https://learn.microsoft.com/en-us/bing/copilot/",
+        common_issues=_issues(
+            "Web search queries: 15-30 seconds",
+            "Standard Microsoft rate limits apply",
+        ),
+    ),
+
+    # YouTube Category (6 parsers)
+    ParserSpec(
+        "youtube_video", "YouTube Video", "Parse video metadata, subtitles, comments", "parse_",
+        "SE::YouTube::Video", "YouTube", "medium", cache_policy="medium",
+        options=(
+            OptionSpec("interface_language", "interfaceLanguage", "string", "Interface language (e.g., 'en', 'ru')", "en"),
+            OptionSpec("subtitles_language", "subtitlesLanguage", "string", "Subtitles language (e.g., 'en', 'ru')", "en"),
+            OptionSpec("comments_pages", "commentsPages", "integer", "Number of comment pages to fetch (0-20)", 0),
+        ),
+    ),
+    ParserSpec(
+        "youtube_search", "YouTube Search", "Search YouTube videos", "search_",
+        "SE::YouTube", "YouTube", "medium",
+        options=(
+            _PAGES_COUNT,
+            OptionSpec("sort", "sort", "string", "Sort order (relevance, date, viewCount, rating)", "relevance"),
+        ),
+        thresholds=HealthThresholds(3000, 7000),
+        docs_url="https://developers.google.com/youtube/",
+        common_issues=_issues(
+            "Video metadata: 5-15 seconds",
+            "100 units/day for free tier",
+        ),
+    ),
+    ParserSpec(
+        "youtube_suggest", "YouTube Suggest", "Get keyword suggestions", "get_",
+        "SE::YouTube::Suggest", "YouTube", "fast",
+    ),
+    ParserSpec(
+        "youtube_channel_videos", "YouTube Channel Videos", "List channel videos", "get_",
+        "JS::Example::Youtube::Channel::Videos", "YouTube", "medium", cache_policy="medium",
+    ),
+    ParserSpec(
+        "youtube_channel_about", "YouTube Channel About", "Get channel info", "get_",
+        "Net::HTTP", "YouTube", "medium", cache_policy="long",
+    ),
+    ParserSpec(
+        "youtube_comments", "YouTube Comments", "Parse video comments", "parse_",
+        "JS::Example::Youtube::Comments", "YouTube", "slow", cache_policy="medium",
+    ),
+
+    # Social Media Category (10 parsers)
+    ParserSpec(
+        "telegram_group", "Telegram Group", "Scrape public group messages", "scrape_",
+        "Telegram::GroupScraper", "Social", "slow",
+        options=(OptionSpec("max_empty_posts", "maxEmptyPosts", "integer", "Max empty posts before stopping", 100),),
+    ),
+    ParserSpec(
+        "reddit_posts", "Reddit Posts", "Search Reddit posts", "search_",
+        "Reddit::Posts", "Social", "fast",
+        options=_REDDIT_SEARCH_OPTIONS,
+    ),
+    ParserSpec(
+        "reddit_post_info", "Reddit Post Info", "Get post with comments", "get_",
+        "Reddit::PostInfo", "Social", "fast", cache_policy="medium",
+        options=(OptionSpec("max_comments_count", "maxCommentsCount", "integer", "Maximum comments to fetch (0-1000)", 100),),
+    ),
+    ParserSpec(
+        "reddit_comments", "Reddit Comments", "Search Reddit comments", "search_",
+        "Reddit::Comments", "Social", "fast",
+        options=_REDDIT_SEARCH_OPTIONS,
+    ),
+    ParserSpec(
+        "instagram_profile", "Instagram Profile", "Parse Instagram profile data, posts, followers", "parse_",
+        "Social::Instagram::Profile", "Social", "slow", cache_policy="medium",
+    ),
+    ParserSpec(
+        "instagram_post", "Instagram Post", "Parse Instagram post with likes, comments, caption", "parse_",
+        "Social::Instagram::Post", "Social", "slow", cache_policy="medium",
+    ),
+    ParserSpec(
+        "instagram_tag", "Instagram Tag", "Parse Instagram posts by hashtag", "parse_",
+        "Social::Instagram::Tag", "Social", "slow",
+    ),
+    ParserSpec(
+        "instagram_geo", "Instagram Geo", "Parse Instagram posts by location", "parse_",
+        "Social::Instagram::Geo", "Social", "slow",
+    ),
+    ParserSpec(
+        "instagram_search", "Instagram Search", "Search Instagram profiles, hashtags, locations", "search_",
+        "Social::Instagram::Search", "Social", "slow",
+    ),
+    ParserSpec(
+        "tiktok_profile", "TikTok Profile", "Parse TikTok profile data, videos, followers", "parse_",
+        "Social::TikTok::Profile", "Social", "slow", cache_policy="medium",
+    ),
+
+    # Translation Category (4 parsers)
+    ParserSpec(
+        "google_translate", "Google Translate", "Google translation service", "translate_",
+        "SE::Google::Translate", "Translation", "slow", cache_policy="long",
+        options=_TRANSLATE_OPTIONS,
+    ),
+    ParserSpec(
+        "deepl_translate", "DeepL Translate", "High-quality DeepL translation", "translate_",
+        "DeepL::Translator", "Translation", "slow", cache_policy="long",
+        options=_TRANSLATE_OPTIONS,
+    ),
+    ParserSpec(
+        "bing_translate", "Bing Translate", "Microsoft Bing translator", "translate_",
+        "SE::Bing::Translator", "Translation", "slow", cache_policy="long",
+        options=_TRANSLATE_OPTIONS,
+    ),
+    ParserSpec(
+        "yandex_translate", "Yandex Translate", "Yandex translator with captcha bypass", "translate_",
+        "SE::Yandex::Translate", "Translation", "slow", cache_policy="long",
+        options=_TRANSLATE_OPTIONS,
+    ),
+
+    # Search Engine Category (8 parsers)
+    ParserSpec(
+        "google_search", "Google Search", "Parse Google search results with operators support", "search_",
+        "SE::Google", "SE", "slow",
+        thresholds=_FAST_SEARCH,
+        docs_url="https://developers.google.com/custom-search/",
+        common_issues=_issues(
+            "Search queries: 5-15 seconds",
+            "100 queries/day for free tier",
+        ),
+    ),
+    ParserSpec(
+        "yandex_search", "Yandex Search", "Parse Yandex search results (Russian search engine)", "search_",
+        "SE::Yandex", "SE", "slow",
+    ),
+    ParserSpec(
+        "bing_search", "Bing Search", "Parse Bing search results with operators support", "search_",
+        "SE::Bing", "SE", "slow",
+        thresholds=_FAST_SEARCH,
+        docs_url="https://www.microsoft.com/en-us/bing/apis/",
+        common_issues=_issues(
+            "Search queries: 5-15 seconds",
+            "1000 queries/month for free tier",
+        ),
+    ),
+    ParserSpec(
+        "duckduckgo_search", "DuckDuckGo Search", "Privacy-focused search engine results", "search_",
+        "SE::DuckDuckGo", "SE", "slow",
+        thresholds=_FAST_SEARCH,
+        docs_url="https://duckduckgo.com/",
+        common_issues=_issues(
+            "Search queries: 5-10 seconds",
+            "No strict rate limit",
+        ),
+    ),
+    ParserSpec(
+        "baidu_search", "Baidu Search", "Parse Chinese search engine Baidu results", "search_",
+        "SE::Baidu", "SE", "slow",
+    ),
+    ParserSpec(
+        "yahoo_search", "Yahoo Search", "Parse Yahoo search results", "search_",
+        "SE::Yahoo", "SE", "slow",
+    ),
+    ParserSpec(
+        "rambler_search", "Rambler Search", "Parse Russian search engine Rambler results", "search_",
+        "SE::Rambler", "SE", "slow",
+    ),
+    ParserSpec(
+        "you_search", "You.com Search", "Parse You.com AI-powered search results", "search_",
+        "SE::You", "SE", "slow",
+    ),
+
+    # Content Category (3 parsers)
+    ParserSpec(
+        "article_extractor", "Article Extractor", "Extract articles using Mozilla Readability algorithm", "parse_",
+        "HTML::ArticleExtractor", "Content", "medium", cache_policy="long",
+    ),
+    ParserSpec(
+        "text_extractor", "Text Extractor", "Parse text blocks from web pages with HTML cleaning", "parse_",
+        "HTML::TextExtractor", "Content", "fast", cache_policy="long",
+    ),
+    ParserSpec(
+        "link_extractor", "Link Extractor", "Extract all links from HTML pages with filtering and deduplication", "extract_",
+        "HTML::LinkExtractor", "Content", "medium", cache_policy="medium",
+        presets=("default", "deep_crawl", "all_links"),
+        preset_description="Preset: 'default' (single page, internal only), 'deep_crawl' (multi-level crawl), 'all_links' (internal + external)",
+    ),
+
+    # Analytics Category (1 parser)
+    ParserSpec(
+        "google_trends", "Google Trends", "Parse trending keywords and interest data from Google Trends", "get_",
+        "SE::Google::Trends", "Analytics", "slow", cache_policy="medium",
+        options=_TRENDS_OPTIONS,
+    ),
+
+    # Visual Content Category (1 parser)
+    ParserSpec(
+        "pinterest_search", "Pinterest Search", "Parse Pinterest search results: images, titles, descriptions", "search_",
+        "SE::Pinterest", "Visual", "medium",
+    ),
+
+    # Net Category (1 parser)
+    ParserSpec(
+        "http", "HTTP Fetcher", "Fetch raw URL content", "fetch_",
+        "Net::HTTP", "Net", "fast",
+    ),
+)
+
+# Parser ID -> spec, and tool name -> spec
+PARSER_REGISTRY: Mapping[str, ParserSpec] = MappingProxyType({spec.id: spec for spec in PARSER_SPECS})
+TOOL_REGISTRY: Mapping[str, ParserSpec] = MappingProxyType({spec.tool_name: spec for spec in PARSER_SPECS})
+
+
+def get_parser(parser_id: str) -> Optional[ParserSpec]:
+    """Look up a parser by ID."""
+    return PARSER_REGISTRY.get(parser_id)
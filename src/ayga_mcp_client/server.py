@@ -1,61 +1,64 @@
 """MCP server implementation."""
 
-import json
+import asyncio
+import functools
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.types import ListToolsRequest, Tool, TextContent
 from mcp.server.stdio import stdio_server
 
-from .api.client import RedisAPIClient
+from ._json import decode_result, dumps
+from .api.cache import DiskResultCache, ResultCache
+from .api.client import (
+    TASK_REGISTRY_TTL,
+    HTTPSettings,
+    ProgressCallback,
+    ProgressUpdate,
+    RedisAPIClient,
+)
+from .api.rate_limit import RateLimiter
+from .api.scheduler import PRIORITY_BATCH, TaskScheduler
 from .error_handler import ErrorHandler, create_timeout_error, create_rate_limit_error
+from .paging import MIN_PAGE_BYTES, ResultStore, make_cursor, page, parse_cursor, project
+from .registry import DEFAULT_TIMEOUT, PARSER_REGISTRY, PARSER_SPECS, TOOL_REGISTRY, ParserSpec
 
 
-# Parser timeout categories based on A-Parser processing time
-PARSER_TIMEOUT_CATEGORIES = {
-    # Fast parsers (10-30 seconds)
-    "fast": {
-        "default": 60,
-        "parsers": ["perplexity", "chatgpt", "deepai", "kimi", "copilot",
-                    "youtube_suggest", "reddit_posts", "reddit_post_info", "reddit_comments",
-                    "text_extractor", "http"]
-    },
-    # Medium parsers (30-60 seconds)
-    "medium": {
-        "default": 120,
-        "parsers": ["youtube_search", "youtube_video", "youtube_channel_videos",
-                    "youtube_channel_about", "pinterest_search", "article_extractor",
-                    "link_extractor"]
-    },
-    # Slow parsers (60-120+ seconds)
-    "slow": {
-        "default": 180,
-        "parsers": ["googleai", "google_search", "google_translate", "google_trends",
-                    "deepl_translate", "bing_translate", "yandex_translate",
-                    "bing_search", "yandex_search", "duckduckgo_search", "baidu_search",
-                    "yahoo_search", "rambler_search", "you_search",
-                    "youtube_comments", "telegram_group",
-                    "instagram_profile", "instagram_post", "instagram_tag",
-                    "instagram_geo", "instagram_search", "tiktok_profile"]
-    }
-}
+# Parser ID -> default timeout, from the parser registry
+PARSER_TIMEOUTS = {spec.id: spec.default_timeout for spec in PARSER_SPECS}
 
 
 def get_default_timeout(parser_id: str) -> int:
     """Get default timeout for a parser based on its category."""
-    for category, config in PARSER_TIMEOUT_CATEGORIES.items():
-        if parser_id in config["parsers"]:
-            return config["default"]
-    return 120  # Default for unknown parsers
+    return PARSER_TIMEOUTS.get(parser_id, DEFAULT_TIMEOUT)
+
+
+# Response size controls accepted by every parser tool (see paging.py)
+RESULT_SHAPE_PROPERTIES = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Only return these result fields (dotted paths, e.g. 'title', 'comments.text')"
+    },
+    "max_items": {
+        "type": "integer",
+        "minimum": 1,
+        "description": "Maximum list items to return; get more with get_result_page"
+    },
+    "max_bytes": {
+        "type": "integer",
+        "minimum": MIN_PAGE_BYTES,
+        "description": "Approximate maximum result size in bytes; get more with get_result_page"
+    },
+}
 
 
 def get_parser_input_schema(parser: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate input schema based on parser category."""
-    parser_id = parser['id']
-    default_timeout = get_default_timeout(parser_id)
+    """Generate input schema from the parser's registry entry."""
+    spec = PARSER_REGISTRY.get(parser['id'])
     
     # Base schema (all parsers)
-    schema = {
+    schema: Dict[str, Any] = {
         "type": "object",
         "properties": {
             "query": {
@@ -65,7 +68,7 @@ def get_parser_input_schema(parser: Dict[str, Any]) -> Dict[str, Any]:
             "timeout": {
                 "type": "integer",
                 "description": "Maximum wait time in seconds",
-                "default": default_timeout
+                "default": get_default_timeout(parser['id'])
             },
             "preset": {
                 "type": "string",
@@ -75,177 +78,342 @@ def get_parser_input_schema(parser: Dict[str, Any]) -> Dict[str, Any]:
         },
         "required": ["query"]
     }
+    if spec is None:
+        return schema
     
-    # YouTube parsers - add extended parameters
-    if parser_id.startswith("youtube_"):
-        if parser_id == "youtube_video":
-            schema["properties"]["interface_language"] = {
-                "type": "string",
-                "description": "Interface language (e.g., 'en', 'ru')",
-                "default": "en"
+    if spec.presets:
+        schema["properties"]["preset"]["enum"] = list(spec.presets)
+        schema["properties"]["preset"]["description"] = spec.preset_description
+    
+    # Parser-specific options
+    for option in spec.options:
+        schema["properties"][option.name] = option.schema()
+    
+    schema["properties"].update(RESULT_SHAPE_PROPERTIES)
+    return schema
+
+
+def get_submit_input_schema(parser: Dict[str, Any]) -> Dict[str, Any]:
+    """Input schema for a submit_<parser> tool: the parser's, minus waiting and shaping."""
+    schema = get_parser_input_schema(parser)
+    properties = {
+        key: value for key, value in schema["properties"].items()
+        if key != "timeout" and key not in RESULT_SHAPE_PROPERTIES
+    }
+    return {**schema, "properties": properties}
+
+
+# Arguments of get_task_status and get_task_results
+TASK_IDS_PROPERTY = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Task IDs returned by submit_<parser> tools"
+}
+
+
+# Parser list in tool listing format (id, name, description, prefix)
+PARSERS = [spec.to_dict() for spec in PARSER_SPECS]
+
+PARSER_IDS = set(PARSER_REGISTRY)
+
+# Parser ID -> tool arguments forwarded to A-Parser as task options
+PARSER_OPTION_KEYS = {spec.id: ("preset", *spec.option_map) for spec in PARSER_SPECS}
+
+# Default number of batch queries in flight at once
+DEFAULT_BATCH_CONCURRENCY = 10
+
+# Handles one tool call: arguments -> tool result content
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[list[TextContent]]]
+
+
+@functools.lru_cache(maxsize=None)
+def build_tool_catalog() -> Tuple[Tool, ...]:
+    """Build the tool definitions for all parsers and metadata tools (once)."""
+    tools = []
+    
+    # Add parser tools
+    for spec in PARSER_SPECS:
+        tools.append(Tool(
+            name=spec.tool_name,
+            description=f"{spec.description}. Args: query (string), timeout (int, default {spec.default_timeout})",
+            inputSchema=get_parser_input_schema(spec.to_dict())
+        ))
+    
+    # Submit-now, fetch-later variants of the parser tools
+    for spec in PARSER_SPECS:
+        tools.append(Tool(
+            name=spec.submit_tool_name,
+            description=f"Submit a {spec.name} task and return its task_id without waiting; fetch the result later with get_task_results",
+            inputSchema=get_submit_input_schema(spec.to_dict())
+        ))
+    
+    # Add metadata tools
+    tools.extend([
+        Tool(
+            name="list_parsers",
+            description="List all available parsers with details",
+            inputSchema={
+                "type": "object",
+                "properties": {}
             }
-            schema["properties"]["subtitles_language"] = {
-                "type": "string",
-                "description": "Subtitles language (e.g., 'en', 'ru')",
-                "default": "en"
+        ),
+        Tool(
+            name="get_parser_info",
+            description="Get detailed information about a specific parser",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "parser_id": {
+                        "type": "string",
+                        "description": "Parser identifier (e.g., 'perplexity', 'chatgpt')"
+                    }
+                },
+                "required": ["parser_id"]
             }
-            schema["properties"]["comments_pages"] = {
-                "type": "integer",
-                "description": "Number of comment pages to fetch (0-20)",
-                "default": 0
+        ),
+        Tool(
+            name="run_batch",
+            description="Run one parser over many queries concurrently. Results stream back as progress notifications as each query finishes; the final result lists every query in order, with per-query errors",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "parser_id": {
+                        "type": "string",
+                        "description": "Parser identifier (e.g., 'google_search', 'perplexity')"
+                    },
+                    "queries": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Query strings, URLs, or prompts"
+                    },
+                    "options": {
+                        "type": "object",
+                        "description": "Parser options shared by all queries (e.g., preset, pages_count)"
+                    },
+                    "timeout": {
+                        "type": "integer",
+                        "description": "Maximum wait time per query in seconds (default: parser category timeout)"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of queries in flight at once; capped by the "
+                                       "batch slots of the parser's category (see 'concurrency' in the result)",
+                        "default": DEFAULT_BATCH_CONCURRENCY,
+                        "minimum": 1
+                    }
+                },
+                "required": ["parser_id", "queries"]
             }
-        elif parser_id == "youtube_search":
-            schema["properties"]["pages_count"] = {
-                "type": "integer",
-                "description": "Number of pages to fetch",
-                "default": 1
+        ),
+        Tool(
+            name="get_task_status",
+            description="Check tasks started with submit_<parser> tools without waiting (status only)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_ids": TASK_IDS_PROPERTY
+                },
+                "required": ["task_ids"]
             }
-            schema["properties"]["sort"] = {
-                "type": "string",
-                "description": "Sort order (relevance, date, viewCount, rating)",
-                "default": "relevance"
+        ),
+        Tool(
+            name="get_task_results",
+            description="Get results of tasks started with submit_<parser> tools without waiting; unfinished tasks report their status",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_ids": TASK_IDS_PROPERTY,
+                    **RESULT_SHAPE_PROPERTIES
+                },
+                "required": ["task_ids"]
             }
-    
-    # Translation parsers - add language parameters
-    elif parser_id.endswith("_translate"):
-        schema["properties"]["from_language"] = {
-            "type": "string",
-            "description": "Source language (auto for auto-detection)",
-            "default": "auto"
-        }
-        schema["properties"]["to_language"] = {
-            "type": "string",
-            "description": "Target language",
-            "default": "en"
-        }
-    
-    # Social parsers - add pagination/sorting
-    elif parser_id.startswith("reddit_"):
-        if parser_id in ["reddit_posts", "reddit_comments"]:
-            schema["properties"]["pages_count"] = {
-                "type": "integer",
-                "description": "Number of pages to fetch",
-                "default": 1
+        ),
+        Tool(
+            name="get_result_page",
+            description="Get the next page of a parser result that was cut by max_items or max_bytes",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cursor": {
+                        "type": "string",
+                        "description": "The page.next_cursor value from the previous response"
+                    },
+                    "max_items": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Maximum list items to return (default: as in the original call)"
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "minimum": MIN_PAGE_BYTES,
+                        "description": "Approximate maximum result size in bytes (default: as in the original call)"
+                    }
+                },
+                "required": ["cursor"]
             }
-            schema["properties"]["sort"] = {
-                "type": "string",
-                "description": "Sort order",
-                "default": "relevance"
+        ),
+        Tool(
+            name="client_stats",
+            description="Show client performance counters (result cache hits/misses, size and evictions)",
+            inputSchema={
+                "type": "object",
+                "properties": {}
             }
-        elif parser_id == "reddit_post_info":
-            schema["properties"]["max_comments_count"] = {
-                "type": "integer",
-                "description": "Maximum comments to fetch (0-1000)",
-                "default": 100
+        ),
+        Tool(
+            name="health_check",
+            description="Check Redis API health status",
+            inputSchema={
+                "type": "object",
+                "properties": {}
             }
-    elif parser_id == "telegram_group":
-        schema["properties"]["max_empty_posts"] = {
-            "type": "integer",
-            "description": "Max empty posts before stopping",
-            "default": 100
-        }
+        ),
+    ])
     
-    # Google Trends - add category, region, time period parameters
-    elif parser_id == "google_trends":
-        schema["properties"]["category"] = {
-            "type": "string",
-            "description": "Category ID: 0=All, 3=Arts, 5=Computers, 7=Finance, 12=Business, 13=Health, 16=News, 22=Shopping, 174=Sports",
-            "default": "0"
-        }
-        schema["properties"]["region"] = {
-            "type": "string", 
-            "description": "Country code (ISO 3166-1): '' (Worldwide), US, GB, DE, FR, RU, JP, CN, etc.",
-            "default": ""
-        }
-        schema["properties"]["time_period"] = {
-            "type": "string",
-            "description": "Time period: 'today 5-y', 'today 12-m', 'today 3-m', 'today 1-m', 'now 7-d', 'now 1-d', 'now 1-H'",
-            "default": "today 5-y"
-        }
-        schema["properties"]["language"] = {
-            "type": "string",
-            "description": "Interface language code: en, ru, de, fr, es, ja, etc.",
-            "default": "en"
-        }
-        schema["properties"]["property"] = {
-            "type": "string",
-            "description": "Search property: '' (Web), 'images', 'news', 'froogle' (Shopping), 'youtube'",
-            "default": ""
-        }
-        schema["properties"]["use_empty_queries"] = {
-            "type": "boolean",
-            "description": "Get category trending without keywords (query should be language code)",
-            "default": False
+    return tuple(tools)
+
+
+async def run_parser_batch(
+    client: RedisAPIClient,
+    parser_id: str,
+    queries: List[str],
+    options: Optional[Dict[str, Any]] = None,
+    timeout: Optional[int] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    on_result: Optional[Callable[[Dict[str, Any], int, int], Awaitable[None]]] = None,
+) -> List[Dict[str, Any]]:
+    """Run one parser over many queries with a concurrency limit.
+    
+    Cached queries are answered immediately. The rest run through
+    ``client.run_parser`` as batch-priority work in the client's scheduler,
+    with its retries and cleanup: as much of the first window as has free
+    slots is submitted in a single bulk request, and each finished query
+    frees a slot for the next one. Failures are recorded per query instead
+    of failing the whole batch.
+    
+    Args:
+        client: API client
+        parser_id: Parser ID (e.g., 'google_search')
+        queries: Query strings
+        options: Parser options shared by all queries
+        timeout: Per-query wait time (default: parser category timeout)
+        concurrency: Maximum number of queries in flight (also capped by the
+            category's batch slots in the client scheduler)
+        on_result: Optional async callback(item, completed, total) called as
+            each query finishes
+        
+    Returns:
+        One item per query, in query order, with 'result' or 'error'.
+        Large result data is left as RawJSON for serialization with
+        ``_json.dumps``.
+    """
+    if timeout is None:
+        timeout = get_default_timeout(parser_id)
+    total = len(queries)
+    scheduler = client.scheduler
+    caller = object()  # Queries of this batch share one fair-queuing turn
+    
+    async def run_one(index: int, task_id: Optional[str]) -> Dict[str, Any]:
+        item: Dict[str, Any] = {"index": index, "query": queries[index], "task_id": task_id}
+        try:
+            # Retries, cancellation of abandoned tasks and caching are
+            # run_parser's; a bulk-submitted task_id already holds its slot
+            item["result"] = await client.run_parser(
+                parser_id,
+                queries[index],
+                options,
+                timeout=timeout,
+                decode=False,
+                priority=PRIORITY_BATCH,
+                caller=caller,
+                task_id=task_id,
+            )
+            item["task_id"] = item["result"].get("task_id", task_id)
+        except TimeoutError as e:
+            item["error"] = str(e)
+        except Exception as e:
+            item["error"] = f"Failed to execute parser: {str(e)}"
+        return item
+    
+    results: List[Dict[str, Any]] = [{} for _ in queries]
+    completed = 0
+    
+    # Serve cached queries right away; only the rest are submitted
+    uncached = []
+    for index, query in enumerate(queries):
+        cached = await client.get_cached_result(parser_id, query, options, decode=False)
+        if cached is None:
+            uncached.append(index)
+            continue
+        results[index] = {
+            "index": index,
+            "query": query,
+            "task_id": cached.get("task_id"),
+            "result": cached,
+            "cached": True,
         }
+        completed += 1
+        if on_result:
+            await on_result(results[index], completed, total)
     
-    # Link Extractor - add preset enum
-    elif parser_id == "link_extractor":
-        schema["properties"]["preset"]["enum"] = ["default", "deep_crawl", "all_links"]
-        schema["properties"]["preset"]["description"] = "Preset: 'default' (single page, internal only), 'deep_crawl' (multi-level crawl), 'all_links' (internal + external)"
+    window = min(concurrency, len(uncached))
+    # Bulk-submit the part of the first window that has free slots now; the
+    # rest of the window queues for slots one by one
+    ready = 0
+    while ready < window and scheduler.try_acquire(parser_id, PRIORITY_BATCH):
+        ready += 1
+    task_ids: List[Optional[str]] = []
+    if ready:
+        try:
+            task_ids = list(await client.submit_parser_tasks(
+                [(parser_id, queries[index], options) for index in uncached[:ready]]
+            ))
+        except Exception:
+            # Nothing was left queued - submit these queries one by one, so
+            # errors are recorded per query instead of failing the batch
+            for _ in range(ready):
+                scheduler.release(parser_id)
+            task_ids = [None] * ready
+        except BaseException:
+            for _ in range(ready):
+                scheduler.release(parser_id)
+            raise
+    in_flight = {
+        asyncio.create_task(run_one(index, task_id))
+        for index, task_id in zip(uncached, task_ids)
+    }
+    in_flight.update(
+        asyncio.create_task(run_one(index, None)) for index in uncached[ready:window]
+    )
+    next_index = window
     
-    return schema
+    try:
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                item = finished.result()
+                results[item["index"]] = item
+                completed += 1
+                
+                if next_index < len(uncached):
+                    in_flight.add(asyncio.create_task(run_one(uncached[next_index], None)))
+                    next_index += 1
+                
+                if on_result:
+                    await on_result(item, completed, total)
+    finally:
+        for pending in in_flight:
+            pending.cancel()
+    
+    return results
 
 
-# Complete parser list (21 parsers) - synced with redis_wrapper
-PARSERS = [
-    # FreeAI Category (6 parsers)
-    {"id": "perplexity", "name": "Perplexity AI", "description": "AI-powered search with sources", "prefix": "search_"},
-    {"id": "googleai", "name": "Google AI", "description": "Google AI-powered search with structured sources", "prefix": "search_"},
-    {"id": "chatgpt", "name": "ChatGPT", "description": "ChatGPT with web search", "prefix": "search_"},
-    {"id": "kimi", "name": "Kimi AI", "description": "Kimi AI for translation and education", "prefix": "search_"},
-    {"id": "deepai", "name": "DeepAI", "description": "DeepAI multi-style chat", "prefix": "search_"},
-    {"id": "copilot", "name": "Microsoft Copilot", "description": "Microsoft Copilot search", "prefix": "search_"},
-    
-    # YouTube Category (6 parsers)
-    {"id": "youtube_video", "name": "YouTube Video", "description": "Parse video metadata, subtitles, comments", "prefix": "parse_"},
-    {"id": "youtube_search", "name": "YouTube Search", "description": "Search YouTube videos", "prefix": "search_"},
-    {"id": "youtube_suggest", "name": "YouTube Suggest", "description": "Get keyword suggestions", "prefix": "get_"},
-    {"id": "youtube_channel_videos", "name": "YouTube Channel Videos", "description": "List channel videos", "prefix": "get_"},
-    {"id": "youtube_channel_about", "name": "YouTube Channel About", "description": "Get channel info", "prefix": "get_"},
-    {"id": "youtube_comments", "name": "YouTube Comments", "description": "Parse video comments", "prefix": "parse_"},
-    
-    # Social Media Category (10 parsers)
-    {"id": "telegram_group", "name": "Telegram Group", "description": "Scrape public group messages", "prefix": "scrape_"},
-    {"id": "reddit_posts", "name": "Reddit Posts", "description": "Search Reddit posts", "prefix": "search_"},
-    {"id": "reddit_post_info", "name": "Reddit Post Info", "description": "Get post with comments", "prefix": "get_"},
-    {"id": "reddit_comments", "name": "Reddit Comments", "description": "Search Reddit comments", "prefix": "search_"},
-    {"id": "instagram_profile", "name": "Instagram Profile", "description": "Parse Instagram profile data, posts, followers", "prefix": "parse_"},
-    {"id": "instagram_post", "name": "Instagram Post", "description": "Parse Instagram post with likes, comments, caption", "prefix": "parse_"},
-    {"id": "instagram_tag", "name": "Instagram Tag", "description": "Parse Instagram posts by hashtag", "prefix": "parse_"},
-    {"id": "instagram_geo", "name": "Instagram Geo", "description": "Parse Instagram posts by location", "prefix": "parse_"},
-    {"id": "instagram_search", "name": "Instagram Search", "description": "Search Instagram profiles, hashtags, locations", "prefix": "search_"},
-    {"id": "tiktok_profile", "name": "TikTok Profile", "description": "Parse TikTok profile data, videos, followers", "prefix": "parse_"},
-    
-    # Translation Category (4 parsers)
-    {"id": "google_translate", "name": "Google Translate", "description": "Google translation service", "prefix": "translate_"},
-    {"id": "deepl_translate", "name": "DeepL Translate", "description": "High-quality DeepL translation", "prefix": "translate_"},
-    {"id": "bing_translate", "name": "Bing Translate", "description": "Microsoft Bing translator", "prefix": "translate_"},
-    {"id": "yandex_translate", "name": "Yandex Translate", "description": "Yandex translator with captcha bypass", "prefix": "translate_"},
-    
-    # Search Engine Category (8 parsers)
-    {"id": "google_search", "name": "Google Search", "description": "Parse Google search results with operators support", "prefix": "search_"},
-    {"id": "yandex_search", "name": "Yandex Search", "description": "Parse Yandex search results (Russian search engine)", "prefix": "search_"},
-    {"id": "bing_search", "name": "Bing Search", "description": "Parse Bing search results with operators support", "prefix": "search_"},
-    {"id": "duckduckgo_search", "name": "DuckDuckGo Search", "description": "Privacy-focused search engine results", "prefix": "search_"},
-    {"id": "baidu_search", "name": "Baidu Search", "description": "Parse Chinese search engine Baidu results", "prefix": "search_"},
-    {"id": "yahoo_search", "name": "Yahoo Search", "description": "Parse Yahoo search results", "prefix": "search_"},
-    {"id": "rambler_search", "name": "Rambler Search", "description": "Parse Russian search engine Rambler results", "prefix": "search_"},
-    {"id": "you_search", "name": "You.com Search", "description": "Parse You.com AI-powered search results", "prefix": "search_"},
-    
-    # Content Category (3 parsers)
-    {"id": "article_extractor", "name": "Article Extractor", "description": "Extract articles using Mozilla Readability algorithm", "prefix": "parse_"},
-    {"id": "text_extractor", "name": "Text Extractor", "description": "Parse text blocks from web pages with HTML cleaning", "prefix": "parse_"},
-    {"id": "link_extractor", "name": "Link Extractor", "description": "Extract all links from HTML pages with filtering and deduplication", "prefix": "extract_"},
-    
-    # Analytics Category (1 parser)
-    {"id": "google_trends", "name": "Google Trends", "description": "Parse trending keywords and interest data from Google Trends", "prefix": "get_"},
-    
-    # Visual Content Category (1 parser)
-    {"id": "pinterest_search", "name": "Pinterest Search", "description": "Parse Pinterest search results: images, titles, descriptions", "prefix": "search_"},
-    
-    # Net Category (1 parser)
-    {"id": "http", "name": "HTTP Fetcher", "description": "Fetch raw URL content", "prefix": "fetch_"},
-]
+def _get_request_context(server: Server):
+    """Return the current MCP request context, or None outside a request."""
+    try:
+        return server.request_context
+    except LookupError:
+        return None
 
 
 def create_mcp_server(
@@ -253,158 +421,334 @@ def create_mcp_server(
     username: Optional[str] = None,
     password: Optional[str] = None,
     api_key: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    result_delivery: str = "auto",
+    http_settings: Optional[HTTPSettings] = None,
+    keep_results: bool = False,
+    compact_output: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    category_limits: Optional[Dict[str, int]] = None,
 ) -> Server:
-    """Create MCP server with Redis API integration."""
+    """Create MCP server with Redis API integration.
+    
+    Args:
+        cache_dir: Optional directory for the persistent result cache shared
+            by all server processes on this machine
+        result_delivery: 'auto' (push with polling fallback) or 'poll'
+        http_settings: Connection pool, HTTP/2 and timeout settings
+        keep_results: Keep result keys in Redis after reading (for debugging)
+        compact_output: Emit tool results as compact JSON instead of
+            indenting them (roughly halves the payload sent over stdio)
+        rate_limiter: Request and submission rate limits (default limits
+            if omitted)
+        category_limits: Concurrent tasks per parser category, overriding
+            the scheduler defaults (e.g. {"slow": 48})
+    """
     
     server = Server("ayga-mcp-client")
+    disk_cache = DiskResultCache(cache_dir) if cache_dir else None
     client = RedisAPIClient(
         base_url=api_url,
         username=username,
         password=password,
         api_key=api_key,
+        cache=ResultCache(disk=disk_cache),
+        result_delivery=result_delivery,
+        http_settings=http_settings,
+        keep_results=keep_results,
+        rate_limiter=rate_limiter,
+        scheduler=TaskScheduler(category_limits),
     )
+    # Projected results with pages left to serve through get_result_page
+    result_store = ResultStore()
     
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available tools."""
-        tools = []
+        return list(build_tool_catalog())
+    
+    # The catalog never changes at runtime, so serve the response built for
+    # the first tools/list call to every later one
+    list_tools_handler = server.request_handlers[ListToolsRequest]
+    list_tools_response = None
+    
+    async def cached_list_tools(request: ListToolsRequest):
+        nonlocal list_tools_response
+        if list_tools_response is None:
+            list_tools_response = await list_tools_handler(request)
+        return list_tools_response
+    
+    server.request_handlers[ListToolsRequest] = cached_list_tools
+    
+    output_indent = None if compact_output else 2
+    
+    def text_result(payload: Any, indent: Optional[int] = output_indent) -> list[TextContent]:
+        # Large results are spliced in as raw JSON text, not re-encoded
+        return [TextContent(type="text", text=dumps(payload, indent=indent))]
+    
+    def error_result(message: str) -> list[TextContent]:
+        return text_result({"error": message}, indent=None)
+    
+    async def handle_health_check(arguments: Dict[str, Any]) -> list[TextContent]:
+        return text_result(await client.health_check())
+    
+    async def handle_client_stats(arguments: Dict[str, Any]) -> list[TextContent]:
+        return text_result(client.get_stats())
+    
+    async def handle_list_parsers(arguments: Dict[str, Any]) -> list[TextContent]:
+        return text_result(await client.list_parsers())
+    
+    async def handle_get_parser_info(arguments: Dict[str, Any]) -> list[TextContent]:
+        parser_id = arguments.get("parser_id")
+        if not parser_id:
+            return error_result("parser_id is required")
+        return text_result(await client.get_parser_info(parser_id))
+    
+    def shape_result(
+        result: Dict[str, Any],
+        fields: Optional[List[str]] = None,
+        max_items: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Apply fields/max_items/max_bytes, storing the rest for later pages."""
+        data = decode_result(result)["data"]
+        if fields:
+            data = project(data, fields)
+        response, next_offset = page(data, 0, max_items, max_bytes)
+        if next_offset is not None:
+            result_id = result_store.put(data, max_items, max_bytes, as_text="data_text" in response)
+            response["page"]["next_cursor"] = make_cursor(result_id, next_offset)
+        return {**response, "task_id": result.get("task_id")}
+    
+    async def handle_get_result_page(arguments: Dict[str, Any]) -> list[TextContent]:
+        cursor = arguments.get("cursor")
+        if not cursor:
+            return error_result("cursor is required")
+        try:
+            result_id, offset = parse_cursor(cursor)
+        except ValueError as e:
+            return error_result(str(e))
         
-        # Add parser tools
-        for parser in PARSERS:
-            tool_name = f"{parser['prefix']}{parser['id']}"
-            default_timeout = get_default_timeout(parser['id'])
-            tools.append(Tool(
-                name=tool_name,
-                description=f"{parser['description']}. Args: query (string), timeout (int, default {default_timeout})",
-                inputSchema=get_parser_input_schema(parser)
-            ))
+        stored = result_store.get(result_id)
+        if stored is None:
+            return error_result("Result expired or unknown cursor; run the parser again")
+        data, max_items, max_bytes, as_text = stored
         
-        # Add metadata tools
-        tools.extend([
-            Tool(
-                name="list_parsers",
-                description="List all available parsers with details",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ),
-            Tool(
-                name="get_parser_info",
-                description="Get detailed information about a specific parser",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "parser_id": {
-                            "type": "string",
-                            "description": "Parser identifier (e.g., 'perplexity', 'chatgpt')"
-                        }
-                    },
-                    "required": ["parser_id"]
-                }
-            ),
-            Tool(
-                name="health_check",
-                description="Check Redis API health status",
-                inputSchema={
-                    "type": "object",
-                    "properties": {}
-                }
-            ),
-        ])
+        response, next_offset = page(
+            data,
+            offset,
+            arguments.get("max_items", max_items),
+            arguments.get("max_bytes", max_bytes),
+            as_text=as_text,
+        )
+        if next_offset is not None:
+            response["page"]["next_cursor"] = make_cursor(result_id, next_offset)
+        return text_result(response)
+    
+    async def check_tasks(arguments: Dict[str, Any], consume: bool = True) -> List[Dict[str, Any]]:
+        """Check the task_ids argument's tasks (see RedisAPIClient.check_tasks).
         
-        return tools
+        Raises:
+            ValueError: If task_ids is missing or not a list of strings
+        """
+        task_ids = arguments.get("task_ids")
+        if isinstance(task_ids, str):
+            task_ids = [task_ids]
+        if not task_ids or not all(isinstance(task_id, str) for task_id in task_ids):
+            raise ValueError("task_ids is required")
+        statuses = await client.check_tasks(task_ids, consume=consume)
+        return [statuses[task_id] for task_id in task_ids]
     
-    @server.call_tool()
-    async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
-        """Handle tool calls."""
+    async def handle_get_task_status(arguments: Dict[str, Any]) -> list[TextContent]:
+        try:
+            # Results are left in place for get_task_results
+            tasks = await check_tasks(arguments, consume=False)
+        except ValueError as e:
+            return error_result(str(e))
+        except Exception as e:
+            return error_result(f"Failed to check tasks: {str(e)}")
         
-        # Health check
-        if name == "health_check":
-            result = await client.health_check()
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
+        for task in tasks:
+            task.pop("result", None)
+        return text_result({"tasks": tasks})
+    
+    async def handle_get_task_results(arguments: Dict[str, Any]) -> list[TextContent]:
+        try:
+            tasks = await check_tasks(arguments)
+            shape = {key: arguments[key] for key in RESULT_SHAPE_PROPERTIES if arguments.get(key)}
+            if shape:
+                for task in tasks:
+                    if "result" in task:
+                        task["result"] = shape_result(task["result"], **shape)
+        except ValueError as e:
+            return error_result(str(e))
+        except Exception as e:
+            return error_result(f"Failed to check tasks: {str(e)}")
         
-        # List parsers
-        if name == "list_parsers":
-            result = await client.list_parsers()
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
+        return text_result({"tasks": tasks})
+    
+    async def handle_run_batch(arguments: Dict[str, Any]) -> list[TextContent]:
+        """Run one parser over many queries."""
+        parser_id = arguments.get("parser_id")
+        queries = arguments.get("queries") or []
+        if parser_id not in PARSER_IDS:
+            return error_result(f"Unknown parser: {parser_id}")
+        if not queries:
+            return error_result("queries is required")
         
-        # Get parser info
-        if name == "get_parser_info":
-            parser_id = arguments.get("parser_id")
-            if not parser_id:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"error": "parser_id is required"})
-                )]
-            
-            result = await client.get_parser_info(parser_id)
-            return [TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
+        shared = arguments.get("options") or {}
+        options = {key: shared[key] for key in PARSER_OPTION_KEYS[parser_id] if key in shared}
+        timeout = arguments.get("timeout", get_default_timeout(parser_id))
+        concurrency = arguments.get("concurrency", DEFAULT_BATCH_CONCURRENCY)
+        
+        # Stream each finished query to the host as a progress notification
+        ctx = _get_request_context(server)
+        progress_token = ctx.meta.progressToken if ctx and ctx.meta else None
+        
+        async def on_result(item: Dict[str, Any], completed: int, total: int):
+            if progress_token is None:
+                return
+            await ctx.session.send_progress_notification(
+                progress_token,
+                completed,
+                total=total,
+                message=dumps(item),
+                related_request_id=ctx.request_id,
+            )
         
-        # Parser tool - match by checking if name matches any parser pattern
-        parser = None
-        for p in PARSERS:
-            tool_name = f"{p['prefix']}{p['id']}"
-            if name == tool_name:
-                parser = p
-                break
+        try:
+            results = await run_parser_batch(
+                client,
+                parser_id,
+                queries,
+                options or None,
+                timeout=timeout,
+                concurrency=concurrency,
+                on_result=on_result,
+            )
+        except Exception as e:
+            return error_result(f"Failed to submit batch: {str(e)}")
         
-        if parser:
-            parser_id = parser['id']
+        # Batch work never holds more than the category's batch slots
+        effective = min(concurrency, client.scheduler.limit(parser_id, PRIORITY_BATCH))
+        return text_result({
+            "parser_id": parser_id,
+            "concurrency": {"requested": concurrency, "effective": effective},
+            "results": results,
+        })
+    
+    def progress_reporter() -> Optional[ProgressCallback]:
+        """Forward poll progress as MCP progress notifications, if the host asked for them."""
+        ctx = _get_request_context(server)
+        progress_token = ctx.meta.progressToken if ctx and ctx.meta else None
+        if progress_token is None:
+            return None
+        
+        async def report(update: ProgressUpdate):
+            await ctx.session.send_progress_notification(
+                progress_token,
+                round(update.elapsed, 1),
+                total=update.timeout,
+                message=f"{update.status}: {update.elapsed:.0f}s elapsed, {update.polls} polls",
+                related_request_id=ctx.request_id,
+            )
+        
+        return report
+    
+    def make_parser_handler(spec: ParserSpec) -> ToolHandler:
+        """Build the handler for one parser tool with its option keys bound."""
+        parser_id = spec.id
+        default_timeout = spec.default_timeout
+        option_keys = PARSER_OPTION_KEYS[parser_id]
+        
+        async def handle_parser(arguments: Dict[str, Any]) -> list[TextContent]:
             query = arguments.get("query")
-            default_timeout = get_default_timeout(parser_id)
             timeout = arguments.get("timeout", default_timeout)
             
             if not query:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"error": "query is required"})
-                )]
+                return error_result("query is required")
             
-            # Collect all optional parameters for A-Parser
-            options = {}
-            for key in ["preset", "from_language", "to_language", "pages_count", 
-                       "max_comments_count", "max_empty_posts", "interface_language",
-                       "subtitles_language", "comments_pages", "sort"]:
-                if key in arguments:
-                    options[key] = arguments[key]
+            # Copy only the options this parser accepts
+            options = {key: arguments[key] for key in option_keys if key in arguments}
             
             try:
-                # Submit task with options
-                task = await client.submit_parser_task(parser_id, query, options if options else None)
-                task_id = task.get("task_id")
-                
-                # Wait for result
-                result = await client.wait_for_result(task_id, timeout=timeout)
-                
-                return [TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )]
+                # Submit task with options and wait (or serve from cache)
+                result = await client.run_parser(
+                    parser_id,
+                    query,
+                    options if options else None,
+                    timeout=timeout,
+                    progress_callback=progress_reporter(),
+                    decode=False,
+                )
             except TimeoutError as e:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"error": str(e)})
-                )]
+                return error_result(str(e))
             except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"error": f"Failed to execute parser: {str(e)}"})
-                )]
+                return error_result(f"Failed to execute parser: {str(e)}")
+            
+            shape = {key: arguments[key] for key in RESULT_SHAPE_PROPERTIES if arguments.get(key)}
+            if not shape:
+                # Nothing to cut - pass the result through as is
+                return text_result(result)
+            try:
+                return text_result(shape_result(result, **shape))
+            except ValueError as e:
+                return error_result(f"Failed to shape result: {str(e)}")
         
-        return [TextContent(
-            type="text",
-            text=json.dumps({"error": f"Unknown tool: {name}"})
-        )]
+        return handle_parser
+    
+    def make_submit_handler(spec: ParserSpec) -> ToolHandler:
+        """Build the submit_<parser> handler: queue the task, return its ID."""
+        parser_id = spec.id
+        option_keys = PARSER_OPTION_KEYS[parser_id]
+        
+        async def handle_submit(arguments: Dict[str, Any]) -> list[TextContent]:
+            query = arguments.get("query")
+            if not query:
+                return error_result("query is required")
+            
+            options = {key: arguments[key] for key in option_keys if key in arguments}
+            try:
+                task = await client.submit_parser_task(
+                    parser_id, query, options if options else None, detached=True
+                )
+            except Exception as e:
+                return error_result(f"Failed to submit task: {str(e)}")
+            
+            return text_result({
+                "task_id": task["task_id"],
+                "parser_id": parser_id,
+                "status": "queued",
+                "expires_in": TASK_REGISTRY_TTL,
+            })
+        
+        return handle_submit
+    
+    # Tool name -> handler, built once
+    handlers: Dict[str, ToolHandler] = {
+        tool_name: make_parser_handler(spec) for tool_name, spec in TOOL_REGISTRY.items()
+    }
+    handlers.update({
+        spec.submit_tool_name: make_submit_handler(spec) for spec in PARSER_SPECS
+    })
+    handlers.update({
+        "health_check": handle_health_check,
+        "client_stats": handle_client_stats,
+        "list_parsers": handle_list_parsers,
+        "get_parser_info": handle_get_parser_info,
+        "run_batch": handle_run_batch,
+        "get_result_page": handle_get_result_page,
+        "get_task_status": handle_get_task_status,
+        "get_task_results": handle_get_task_results,
+    })
+    
+    @server.call_tool()
+    async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
+        """Handle tool calls."""
+        handler = handlers.get(name)
+        if handler is None:
+            return error_result(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     return server
 
@@ -414,9 +758,28 @@ async def run_stdio_server(
     username: Optional[str] = None,
     password: Optional[str] = None,
     api_key: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    result_delivery: str = "auto",
+    http_settings: Optional[HTTPSettings] = None,
+    keep_results: bool = False,
+    compact_output: bool = False,
+    rate_limiter: Optional[RateLimiter] = None,
+    category_limits: Optional[Dict[str, int]] = None,
 ):
     """Run MCP server with stdio transport."""
-    server = create_mcp_server(api_url, username, password, api_key)
+    server = create_mcp_server(
+        api_url,
+        username,
+        password,
+        api_key,
+        cache_dir=cache_dir,
+        result_delivery=result_delivery,
+        http_settings=http_settings,
+        keep_results=keep_results,
+        compact_output=compact_output,
+        rate_limiter=rate_limiter,
+        category_limits=category_limits,
+    )
     
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
@@ -0,0 +1,31 @@
+"""Shared fixtures for client tests."""
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import client as client_module
+from ayga_mcp_client.api.client import RedisAPIClient
+
+
+@pytest.fixture
+def make_client():
+    """Factory for clients wired to a mock transport.
+
+    Call it with a request handler; `keep_results` and any other keyword
+    arguments are passed to RedisAPIClient (result delivery defaults to
+    polling).
+    """
+    def factory(handler, keep_results: bool = False, **kwargs) -> RedisAPIClient:
+        kwargs.setdefault("result_delivery", "poll")
+        client = RedisAPIClient(keep_results=keep_results, **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return factory
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    """Shrink poll delays so tests run quickly."""
+    monkeypatch.setattr(client_module, "POLL_INITIAL_DELAY", 0.01)
+    monkeypatch.setattr(client_module, "POLL_MAX_DELAY", 0.02)
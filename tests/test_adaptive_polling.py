@@ -0,0 +1,123 @@
+"""Tests for latency sketches and the adaptive polling schedule."""
+
+import json
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import client as client_module
+from ayga_mcp_client.api.client import RedisAPIClient, _PendingResult
+from ayga_mcp_client.api.latency import LatencySketch
+
+
+def test_sketch_quantiles():
+    """Quantiles are accurate to about one bucket."""
+    sketch = LatencySketch()
+    for seconds in range(1, 101):
+        sketch.add(float(seconds))
+
+    assert sketch.count == 100
+    assert sketch.quantile(0.5) == pytest.approx(50, rel=0.16)
+    assert sketch.quantile(0.9) == pytest.approx(90, rel=0.16)
+    assert sketch.quantile(1.0) == 100
+    assert sketch.to_dict()["mean_s"] == 50.5
+
+
+def test_empty_sketch():
+    sketch = LatencySketch()
+    assert sketch.quantile(0.5) is None
+    assert sketch.to_dict()["count"] == 0
+
+
+def make_entry(parser_id=None) -> _PendingResult:
+    return _PendingResult(
+        task_id="t", future=None, next_poll=0.0, submitted_at=0.0, parser_id=parser_id
+    )
+
+
+def test_fixed_schedule_without_samples():
+    """Unknown parsers use the 1.5s / x1.2 / 5s cap schedule."""
+    client = RedisAPIClient()
+    entry = make_entry("google_trends")
+    delays = [client._next_poll_delay(entry, 0.0)]
+    for _ in range(9):
+        entry.polls += 1
+        delays.append(client._next_poll_delay(entry, 0.0))
+
+    assert delays[:3] == pytest.approx([1.5, 1.5, 1.8])
+    assert max(delays) == 5.0
+
+
+def test_adaptive_schedule_follows_latency():
+    """Sleep until the expected window, poll densely inside, back off after."""
+    client = RedisAPIClient()
+    for seconds in [100, 110, 120, 130, 140, 150]:
+        client.latency.record("google_trends", seconds)
+    sketch = client.latency.get("google_trends")
+    first, last = sketch.quantile(0.1), sketch.quantile(0.9)
+
+    entry = make_entry("google_trends")
+    assert client._next_poll_delay(entry, 0.0) == client_module.POLL_MAX_SLEEP
+    assert client._next_poll_delay(entry, first - 10) == pytest.approx(10)
+    inside = client._next_poll_delay(entry, first + 1)
+    assert client_module.POLL_MIN_DELAY <= inside <= client_module.POLL_DENSE_MAX_DELAY
+    tail = [client._next_poll_delay(entry, last + 1) for _ in range(20)]
+    assert tail == sorted(tail)
+    assert tail[-1] == client_module.POLL_MAX_DELAY
+
+
+def test_sleep_is_cut_short_by_waiter_deadline():
+    """A waiter's deadline always gets a check, whatever the sketch expects."""
+    client = RedisAPIClient()
+    for _ in range(5):
+        client.latency.record("perplexity", 8.0)
+
+    entry = make_entry("perplexity")
+    entry.waiters.append((None, 0.0, 5.0))
+    assert client._next_poll_delay(entry, 0.0) == 5.0 - client_module.POLL_DEADLINE_MARGIN
+    assert client._next_poll_delay(entry, 4.5) > 0.5  # Past the last chance
+
+
+@pytest.mark.asyncio
+async def test_completion_times_recorded(make_client, fast_polling):
+    """Completed tasks feed per-parser latency stats."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        value = [task_id, "success", 0, "", "ok"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    client = make_client(handler)
+    await client.run_parser("youtube_suggest", "mcp", timeout=5)
+
+    polling = client.get_stats()["polling"]
+    assert polling["latency"]["youtube_suggest"]["count"] == 1
+    assert polling["checks"] == 1
+    assert polling["requests"] >= 1
+    assert client._tasks == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stored_result_found_before_timeout(make_client):
+    """A slow sketch does not keep an already stored result from being fetched."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        return httpx.Response(200, json={"value": json.dumps([task_id, "success", 0, "", "ok"])})
+
+    client = make_client(handler)
+    for _ in range(5):
+        client.latency.record("perplexity", 8.0)
+
+    result = await client.run_parser("perplexity", "q", timeout=2)
+
+    assert result["data"] == "ok"
+    await client.close()
@@ -0,0 +1,141 @@
+"""Tests for submit-now, fetch-later task tools."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ayga_mcp_client import server as server_module
+
+
+class FakeRedis:
+    """Queue and result keys; a task's result appears after `ready_after` reads."""
+
+    def __init__(self, ready_after: int = 1):
+        self.ready_after = ready_after
+        self.tasks = {}
+        self.reads = {}
+        self.deleted = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            body = json.loads(request.content)
+            for value in body.get("values", [body.get("value")]):
+                task = json.loads(value)
+                self.tasks[task[0]] = task[3]
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        if request.method == "DELETE":
+            self.deleted.append(task_id)
+            return httpx.Response(200, json={"deleted": 1})
+        self.reads[task_id] = self.reads.get(task_id, 0) + 1
+        if task_id not in self.tasks or task_id in self.deleted:
+            return httpx.Response(404)
+        if self.reads[task_id] <= self.ready_after:
+            value = [task_id, "processing", 0, "", None]
+        else:
+            value = [task_id, "success", 0, "", self.tasks[task_id].upper()]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+
+@pytest.mark.asyncio
+async def test_check_tasks_keeps_detached_results(make_client):
+    """A detached task's result stays available after its key is deleted."""
+    redis = FakeRedis()
+    client = make_client(redis.handler)
+    task = await client.submit_parser_task("google_search", "python", detached=True)
+    task_id = task["task_id"]
+
+    first = await client.check_tasks([task_id])
+    assert first[task_id]["status"] == "processing"
+    assert "result" not in first[task_id]
+
+    second = await client.check_tasks([task_id])
+    await asyncio.sleep(0.01)
+    third = await client.check_tasks([task_id, "other"])
+
+    assert second[task_id]["status"] == "completed"
+    assert second[task_id]["result"]["data"] == "PYTHON"
+    assert redis.deleted == [task_id]
+    assert third[task_id]["result"]["data"] == "PYTHON"
+    assert third["other"]["status"] == "unknown"
+    assert redis.reads[task_id] == 2  # Not fetched again once completed
+    assert "google_search" not in client.get_stats()["polling"]["latency"]
+    assert await client.get_cached_result("google_search", "python") == second[task_id]["result"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_detached_task_is_cancelled(make_client):
+    """Unfetched detached tasks are cancelled when they expire."""
+    redis = FakeRedis()
+    client = make_client(redis.handler)
+    task = await client.submit_parser_task("http", "https://example.com", detached=True)
+    client._tasks[task["task_id"]].expires_at = 0
+
+    await client.check_tasks([])
+
+    assert client.get_stats()["cancellation"]["cancelled"] == 1
+    await client.close()
+
+
+async def call_tool(server, name, arguments):
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    return json.loads(response.root.content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_submit_and_fetch_tools(make_client, monkeypatch):
+    """submit_<parser> returns at once; status and results tools never block."""
+    redis = FakeRedis()
+    client = make_client(redis.handler)
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: client)
+    server = server_module.create_mcp_server()
+
+    submitted = [
+        await call_tool(server, "submit_google_trends", {"query": q, "region": "US"})
+        for q in ("a", "b")
+    ]
+    task_ids = [item["task_id"] for item in submitted]
+    assert submitted[0]["status"] == "queued"
+
+    status = await call_tool(server, "get_task_status", {"task_ids": task_ids})
+    assert [task["status"] for task in status["tasks"]] == ["processing", "processing"]
+
+    results = await call_tool(server, "get_task_results", {"task_ids": task_ids})
+    assert [task["result"]["data"] for task in results["tasks"]] == ["A", "B"]
+
+    missing = await call_tool(server, "get_task_results", {"task_ids": []})
+    assert "error" in missing
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_tasks_from_an_earlier_session_are_not_lost(make_client, monkeypatch):
+    """Checking a task this process did not submit never throws its result away."""
+    redis = FakeRedis(ready_after=0)
+    redis.tasks["old-task"] = "old"
+    client = make_client(redis.handler)
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: client)
+    server = server_module.create_mcp_server()
+
+    for _ in range(2):
+        status = await call_tool(server, "get_task_status", {"task_ids": ["old-task"]})
+        assert status["tasks"][0]["status"] == "completed"
+        await asyncio.sleep(0.01)
+    assert redis.deleted == []
+
+    for _ in range(2):
+        results = await call_tool(server, "get_task_results", {"task_ids": ["old-task"]})
+        assert results["tasks"][0]["result"]["data"] == "OLD"
+        await asyncio.sleep(0.01)
+    assert redis.deleted == ["old-task"]
+    assert redis.reads["old-task"] == 3  # Kept in the registry once consumed
+    await client.close()
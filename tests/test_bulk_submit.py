@@ -0,0 +1,283 @@
+"""Tests for bulk task submission and the run_batch tool."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ayga_mcp_client import server as server_module
+from ayga_mcp_client.api import client as client_module
+
+
+@pytest.mark.asyncio
+async def test_submit_parser_tasks_single_request(make_client):
+    """A batch goes out as one multi-value LPUSH with IDs in order."""
+    pushes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        pushes.append(json.loads(request.content))
+        return httpx.Response(200, json={"length": 3})
+
+    client = make_client(handler)
+    task_ids = await client.submit_parser_tasks([
+        ("google_search", "a", None),
+        ("youtube_search", "b", {"pages_count": 2}),
+        ("perplexity", "c", None),
+    ])
+
+    assert len(pushes) == 1
+    tasks = [json.loads(value) for value in pushes[0]["values"]]
+    assert [task[0] for task in tasks] == task_ids
+    assert [task[3] for task in tasks] == ["a", "b", "c"]
+    assert tasks[1][4] == {"pagesCount": 2}
+    assert tasks[2][1] == "FreeAI::Perplexity"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_parser_tasks_chunks(make_client, monkeypatch):
+    """Large batches are split into chunked requests."""
+    monkeypatch.setattr(client_module, "LPUSH_CHUNK_SIZE", 2)
+    pushes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        pushes.append(len(body["values"]) if "values" in body else 1)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    task_ids = await client.submit_parser_tasks([("http", str(i), None) for i in range(5)])
+
+    assert len(task_ids) == 5
+    assert pushes == [2, 2, 1]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_parser_tasks_fallback(make_client):
+    """If multi-value LPUSH is rejected, tasks are pushed one by one."""
+    pushes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if "values" in body:
+            return httpx.Response(422)
+        pushes.append(json.loads(body["value"])[3])
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    await client.submit_parser_tasks([("http", q, None) for q in ["x", "y", "z"]])
+
+    assert pushes == ["x", "y", "z"]
+    assert client._multi_lpush_supported is False
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_submit_cancels_tasks_already_queued(make_client):
+    """A batch is all or nothing: pushed tasks are withdrawn if a later push fails."""
+    pushes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if "values" in body:
+            return httpx.Response(422)
+        if "value" in body and request.url.path.endswith("/lpush"):
+            pushes.append(json.loads(body["value"])[0])
+            if len(pushes) == 2:
+                return httpx.Response(503)
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.submit_parser_tasks([("http", q, None) for q in ["x", "y", "z"]])
+
+    await asyncio.sleep(0.01)
+    assert len(pushes) == 2
+    assert client.get_stats()["cancellation"]["dequeued"] == 1
+    assert client._tasks == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_run_parser_batch_survives_failed_bulk_submit(make_client, fast_polling):
+    """A failed bulk push falls back to per-query submits instead of failing the batch."""
+    queries = {}
+    bulk_attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal bulk_attempts
+        if request.method == "POST":
+            body = json.loads(request.content)
+            if "values" in body:
+                bulk_attempts += 1
+                return httpx.Response(503)
+            task = json.loads(body["value"])
+            queries[task[0]] = task[3]
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        value = [task_id, "success", 0, "", queries[task_id].upper()]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    client = make_client(handler)
+    results = await server_module.run_parser_batch(client, "google_search", ["x", "y", "z"])
+
+    assert bulk_attempts == 1
+    assert [item["result"]["data"] for item in results] == ["X", "Y", "Z"]
+    assert client.scheduler.stats()["slow"]["active"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_run_batch_tool(make_client, fast_polling, monkeypatch):
+    """run_batch returns results in query order with per-query errors."""
+    queries = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            for value in json.loads(request.content)["values"]:
+                task = json.loads(value)
+                queries[task[0]] = task[3]
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        if queries[task_id] == "bad":
+            value = [task_id, "error", 1, "blocked", None]
+        else:
+            value = [task_id, "success", 0, "", queries[task_id].upper()]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: make_client(handler))
+    server = server_module.create_mcp_server()
+
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="run_batch",
+            arguments={"parser_id": "google_search", "queries": ["one", "bad", "two"]},
+        ),
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    payload = json.loads(response.root.content[0].text)
+
+    assert [item["query"] for item in payload["results"]] == ["one", "bad", "two"]
+    assert payload["results"][0]["result"]["data"] == "ONE"
+    assert "blocked" in payload["results"][1]["error"]
+    assert payload["results"][2]["result"]["data"] == "TWO"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("category_limits, effective", [(None, 10), ({"slow": 8}, 6)])
+async def test_run_batch_reaches_effective_concurrency(
+    make_client, fast_polling, monkeypatch, category_limits, effective
+):
+    """run_batch keeps its effective concurrency in flight and reports it."""
+    submitted = []
+    finished = set()
+    max_in_flight = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal max_in_flight
+        if request.method == "POST":
+            body = json.loads(request.content)
+            for value in body.get("values", [body.get("value")]):
+                submitted.append(json.loads(value)[0])
+            max_in_flight = max(max_in_flight, len(submitted) - len(finished))
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget" or max_in_flight < effective:
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        finished.add(task_id)
+        value = [task_id, "success", 0, "", "ok"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    monkeypatch.setattr(
+        server_module,
+        "RedisAPIClient",
+        lambda **kwargs: make_client(handler, scheduler=kwargs["scheduler"]),
+    )
+    server = server_module.create_mcp_server(category_limits=category_limits)
+
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(
+            name="run_batch",
+            arguments={"parser_id": "google_search", "queries": [f"q{i}" for i in range(20)]},
+        ),
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    payload = json.loads(response.root.content[0].text)
+
+    assert payload["concurrency"] == {"requested": 10, "effective": effective}
+    assert max_in_flight == effective
+    assert all(item["result"]["data"] == "ok" for item in payload["results"])
+
+
+@pytest.mark.asyncio
+async def test_duplicate_queries_share_one_task(make_client, fast_polling):
+    """A bulk-submitted duplicate attaches to the first run and its task is cancelled."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"removed": 1})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        value = [task_id, "success", 0, "", "ok"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    client = make_client(handler)
+    results = await server_module.run_parser_batch(client, "google_search", ["a", "a"])
+    await asyncio.sleep(0.01)
+
+    assert results[0]["result"] == results[1]["result"]
+    stats = client.get_stats()
+    assert stats["cancellation"]["dequeued"] == 1
+    assert stats["single_flight"]["coalesced"] == 1
+    assert client.scheduler.stats()["slow"]["active"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_run_parser_batch_concurrency_limit(make_client, fast_polling):
+    """No more than `concurrency` queries are in flight; results stream in."""
+    submitted = []
+    finished = set()
+    max_in_flight = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal max_in_flight
+        if request.method == "POST":
+            body = json.loads(request.content)
+            for value in body.get("values", [body.get("value")]):
+                submitted.append(json.loads(value)[0])
+            max_in_flight = max(max_in_flight, len(submitted) - len(finished))
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        finished.add(task_id)
+        value = [task_id, "success", 0, "", "ok"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    streamed = []
+
+    async def on_result(item, completed, total):
+        streamed.append((item["query"], completed, total))
+
+    client = make_client(handler)
+    queries = [f"q{i}" for i in range(7)]
+    results = await server_module.run_parser_batch(
+        client, "http", queries, concurrency=2, on_result=on_result
+    )
+
+    assert [item["query"] for item in results] == queries
+    assert all(item["result"]["data"] == "ok" for item in results)
+    assert max_in_flight <= 2
+    assert [completed for _, completed, _ in streamed] == list(range(1, 8))
+    assert {total for _, _, total in streamed} == {7}
+    await client.close()
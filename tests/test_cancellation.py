@@ -0,0 +1,143 @@
+"""Tests for cleaning up abandoned parser tasks."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ayga_mcp_client import server as server_module
+from ayga_mcp_client.api import client as client_module
+from ayga_mcp_client.api.retry import RetryPolicy
+
+
+@pytest.fixture(autouse=True)
+def fast_timers(fast_polling, monkeypatch):
+    """Shrink the reap interval too so tests run quickly."""
+    monkeypatch.setattr(client_module, "ABANDONED_REAP_INTERVAL", 0.01)
+
+
+class Backend:
+    """Queue and KV store stand-in; tasks finish when `finish` is called."""
+
+    def __init__(self, picked_up: bool):
+        self.picked_up = picked_up
+        self.queue = []
+        self.results = {}
+        self.requests = []
+
+    def finish(self, task_id: str):
+        self.results[task_id] = json.dumps([task_id, "success", 0, "", "late"])
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append((request.method, path))
+        if path.endswith("/lpush"):
+            body = json.loads(request.content)
+            self.queue.extend(body.get("values", [body.get("value")]))
+            if self.picked_up:
+                self.queue.clear()
+            return httpx.Response(200, json={})
+        if path.endswith("/lrem"):
+            value = json.loads(request.content)["value"]
+            removed = int(value in self.queue)
+            if removed:
+                self.queue.remove(value)
+            return httpx.Response(200, json={"removed": removed})
+        if path == "/kv/mget":
+            return httpx.Response(404)
+        key = path.removeprefix("/kv/")
+        task_id = key.split(":", 1)[1]
+        if request.method == "DELETE":
+            deleted = int(self.results.pop(task_id, None) is not None)
+            return httpx.Response(200, json={"deleted": deleted})
+        if task_id in self.results:
+            return httpx.Response(200, json={"value": self.results[task_id]})
+        return httpx.Response(404)
+
+
+@pytest.mark.asyncio
+async def test_cancel_removes_queued_task(make_client):
+    """A cancelled task that has not started is taken off the queue."""
+    backend = Backend(picked_up=False)
+    client = make_client(backend)
+
+    run = asyncio.create_task(client.run_parser("perplexity", "q", timeout=5))
+    await asyncio.sleep(0.05)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    await asyncio.sleep(0.05)
+
+    assert backend.queue == []
+    stats = client.get_stats()["cancellation"]
+    assert stats["cancelled"] == 1
+    assert stats["dequeued"] == 1
+    assert stats["awaiting_cleanup"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_running_task_result_is_deleted(make_client):
+    """A running task's result key is deleted once it lands after a timeout."""
+    backend = Backend(picked_up=True)
+    client = make_client(backend)
+
+    with pytest.raises(TimeoutError):
+        await client.run_parser("perplexity", "q", timeout=0.05)
+    await asyncio.sleep(0.01)  # the abandoned run finishes cancelling
+    task_id = next(iter(client._abandoned))
+
+    backend.finish(task_id)
+    await asyncio.sleep(0.1)
+
+    assert backend.results == {}
+    stats = client.get_stats()["cancellation"]
+    assert stats["dequeued"] == 0
+    assert stats["results_deleted"] == 1
+    assert stats["awaiting_cleanup"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_disabled_without_endpoints(make_client):
+    """Missing LREM/DELETE endpoints turn cleanup off after one attempt."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/lpush"):
+            return httpx.Response(200, json={})
+        if request.url.path.endswith("/lrem") or request.method == "DELETE":
+            return httpx.Response(405)
+        return httpx.Response(404)
+
+    client = make_client(handler)
+    with pytest.raises(TimeoutError):
+        await client.run_parser("perplexity", "q", timeout=0.05)
+    await asyncio.sleep(0.05)
+
+    assert client._lrem_supported is False
+    assert client._delete_supported is False
+    assert client._abandoned == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_query_with_failed_poll_is_cancelled(make_client):
+    """A batch query whose result cannot be fetched does not leave its task behind."""
+    backend = Backend(picked_up=False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/kv/") and request.url.path != "/kv/mget":
+            return httpx.Response(503)
+        return backend(request)
+
+    policy = RetryPolicy(base_delay=0.01, max_delay=0.02, min_attempt_budget=0.1)
+    client = make_client(handler, retry_policy=policy)
+    results = await server_module.run_parser_batch(client, "http", ["a", "b"])
+    await asyncio.sleep(0.05)
+
+    assert all("503" in item["error"] for item in results)
+    assert backend.queue == []
+    stats = client.get_stats()["cancellation"]
+    assert stats["cancelled"] == 2
+    assert stats["dequeued"] == 2
+    await client.close()
@@ -0,0 +1,119 @@
+"""Tests for lazy client initialization, authentication and token refresh."""
+
+import asyncio
+import base64
+import json
+import time
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import client as client_module
+from ayga_mcp_client.api.client import _token_expiry
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_login(make_client):
+    """A burst of first calls exchanges the API key once and sends the token."""
+    exchanges = 0
+    auth_headers = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal exchanges
+        if request.url.path == "/auth/exchange":
+            exchanges += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"access_token": "jwt"})
+        auth_headers.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = make_client(handler, api_key="key")
+
+    await asyncio.gather(*(client.health_check() for _ in range(10)))
+
+    assert exchanges == 1
+    assert auth_headers == ["Bearer jwt"] * 10
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_login_is_retried(make_client):
+    """A failed login does not leave the client marked as authenticated."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        if request.url.path == "/auth/exchange":
+            attempts += 1
+            if attempts == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"access_token": "jwt"})
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = make_client(handler, api_key="key")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.health_check()
+    assert await client.health_check() == {"status": "ok"}
+    assert attempts == 2
+    await client.close()
+
+
+def make_jwt(exp: float) -> str:
+    """Unsigned JWT with an exp claim."""
+    def encode(obj) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode({'exp': exp})}.sig"
+
+
+def test_token_expiry_decoding():
+    """The exp claim is read from JWTs; opaque tokens have no expiry."""
+    assert _token_expiry(make_jwt(1234567890)) == 1234567890.0
+    assert _token_expiry("opaque-token") is None
+    assert _token_expiry("a.!!!.c") is None
+
+
+@pytest.mark.asyncio
+async def test_401_refreshes_token_and_replays_request(make_client):
+    """A rejected token is refreshed once and the request is replayed."""
+    tokens = iter(["old", "new"])
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/auth/exchange":
+            return httpx.Response(200, json={"access_token": next(tokens)})
+        seen.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer old":
+            return httpx.Response(401)
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = make_client(handler, api_key="key")
+
+    assert await client.health_check() == {"status": "ok"}
+    assert seen == ["Bearer old", "Bearer new"]
+    assert client.get_stats()["auth"]["retried_401"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_token_refreshed_in_background_before_expiry(make_client, monkeypatch):
+    """A token close to expiry is replaced without waiting for a request."""
+    monkeypatch.setattr(client_module, "TOKEN_REFRESH_MARGIN", 0)
+    exchanges = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal exchanges
+        exchanges += 1
+        lifetime = 0.05 if exchanges == 1 else 3600
+        return httpx.Response(200, json={"access_token": make_jwt(time.time() + lifetime)})
+
+    client = make_client(handler, api_key="key")
+
+    await client._get_client()
+    first = client._token
+    await asyncio.sleep(0.2)
+
+    assert exchanges == 2
+    assert client._token != first
+    assert client.get_stats()["auth"]["refreshes"] == 1
+    await client.close()
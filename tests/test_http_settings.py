@@ -0,0 +1,120 @@
+"""Tests for HTTP connection pool settings and pool metrics."""
+
+import sys
+
+import httpx
+import pytest
+
+from ayga_mcp_client import __main__ as main_module
+from ayga_mcp_client.api.client import HTTPSettings
+
+
+def test_http_settings_build_limits_and_timeout():
+    """Settings map onto httpx limits and per-phase timeouts."""
+    settings = HTTPSettings(
+        max_connections=8,
+        max_keepalive_connections=4,
+        connect_timeout=2,
+        read_timeout=60,
+        pool_timeout=5,
+    )
+
+    limits = settings.limits()
+    timeout = settings.timeout()
+
+    assert limits.max_connections == 8
+    assert limits.max_keepalive_connections == 4
+    assert timeout.connect == 2
+    assert timeout.read == 60
+    assert timeout.pool == 5
+
+
+@pytest.mark.asyncio
+async def test_requests_are_counted_in_http_stats(make_client):
+    """Requests through the shared client show up in the http stats."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"status": "ok"})
+
+    client = make_client(handler)
+
+    await client.health_check()
+    await client.health_check()
+
+    http = client.get_stats()["http"]
+    assert http["requests"] == 2
+    assert http["pool_timeouts"] == 0
+    await client.close()
+
+
+def run_main(monkeypatch, *argv) -> dict:
+    """Run the CLI entry point, capturing the server arguments."""
+    captured = {}
+
+    async def fake_server(**kwargs):
+        captured.update(kwargs)
+
+    monkeypatch.setattr(main_module, "run_stdio_server", fake_server)
+    monkeypatch.setattr(sys, "argv", ["ayga-mcp-client", *argv])
+    main_module.main()
+    return captured
+
+
+def test_http2_without_h2_fails_at_startup(monkeypatch, capsys):
+    monkeypatch.setattr(main_module.importlib.util, "find_spec", lambda name: None)
+
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch, "--http2")
+
+    assert exc.value.code == 2
+    assert "pip install ayga-mcp-client[http2]" in capsys.readouterr().err
+
+
+def test_no_http2_overrides_env(monkeypatch):
+    monkeypatch.setenv("REDIS_HTTP2", "1")
+
+    kwargs = run_main(monkeypatch, "--no-http2")
+
+    assert kwargs["http_settings"].http2 is False
+
+
+def test_category_limits_from_env_and_flag(monkeypatch, capsys):
+    monkeypatch.setenv("REDIS_CATEGORY_LIMITS", "slow=64")
+    assert run_main(monkeypatch)["category_limits"] == {"slow": 64}
+    assert run_main(monkeypatch, "--category-limits", "fast=8")["category_limits"] == {"fast": 8}
+
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, "--category-limits", "slow=0")
+    assert "positive integer" in capsys.readouterr().err
+
+
+def test_invalid_result_delivery_env_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setenv("REDIS_RESULT_DELIVERY", "push")
+
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch)
+
+    assert exc.value.code == 2
+    assert "REDIS_RESULT_DELIVERY must be one of auto, poll" in capsys.readouterr().err
+
+
+def test_pool_settings_from_env_are_validated(monkeypatch, capsys):
+    monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "50")
+    monkeypatch.setenv("REDIS_READ_TIMEOUT", "12.5")
+    settings = run_main(monkeypatch)["http_settings"]
+    assert (settings.max_connections, settings.read_timeout) == (50, 12.5)
+
+    monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "lots")
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch)
+    assert exc.value.code == 2
+    assert "invalid int value: 'lots'" in capsys.readouterr().err
+
+
+def test_invalid_rate_limit_env_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setenv("REDIS_RATE_LIMIT", "fast")
+
+    with pytest.raises(SystemExit) as exc:
+        run_main(monkeypatch)
+
+    assert exc.value.code == 2
+    assert "invalid float value: 'fast'" in capsys.readouterr().err
@@ -0,0 +1,66 @@
+"""Tests for the pluggable JSON backend and compact tool output."""
+
+import json
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ayga_mcp_client import _json
+from ayga_mcp_client import server as server_module
+
+
+AVAILABLE = ["json"] + [
+    name for name, module in (("orjson", _json.orjson), ("msgspec", _json.msgspec)) if module
+]
+
+
+@pytest.fixture(params=AVAILABLE)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(_json, "BACKEND", request.param)
+    return request.param
+
+
+def test_round_trip(backend):
+    """Every backend decodes text and bytes and encodes compact or indented."""
+    value = {"query": "поиск", "n": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+    compact = _json.dumps(value)
+    indented = _json.dumps(value, indent=2)
+
+    assert _json.loads(compact) == value
+    assert _json.loads(indented.encode("utf-8")) == value
+    assert "\n" not in compact and "\n" in indented
+    assert "поиск" in compact  # Not escaped to \u sequences
+
+
+def test_raw_values_and_fallback(backend):
+    """RawJSON is spliced verbatim and the fallback handles unknown types."""
+    payload = {"data": _json.RawJSON('[1, {"b": 2}]'), "when": object()}
+
+    decoded = json.loads(_json.dumps(payload, fallback=lambda value: "obj"))
+
+    assert decoded == {"data": [1, {"b": 2}], "when": "obj"}
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        _json.loads("{not json")
+
+
+@pytest.mark.asyncio
+async def test_compact_output(monkeypatch):
+    """compact_output drops indentation from tool results."""
+    class StubClient:
+        def get_stats(self):
+            return {"cache": {"hits": 1}}
+
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: StubClient())
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name="client_stats", arguments={})
+    )
+
+    indented = await server_module.create_mcp_server().request_handlers[CallToolRequest](request)
+    compact = await server_module.create_mcp_server(compact_output=True).request_handlers[CallToolRequest](request)
+
+    assert "\n" in indented.root.content[0].text
+    assert compact.root.content[0].text == '{"cache":{"hits":1}}'
@@ -0,0 +1,60 @@
+"""Tests for table-driven option translation."""
+
+import pytest
+
+from ayga_mcp_client.api.client import RedisAPIClient
+
+
+@pytest.fixture
+def client():
+    return RedisAPIClient(result_delivery="poll")
+
+
+def test_options_mapped_to_aparser_names(client):
+    """Accepted options are renamed; the preset is split out."""
+    name, preset, options = client._translate_options("google_trends", {
+        "preset": "fast",
+        "category": "3",
+        "region": "US",
+        "language": "de",
+        "use_empty_queries": True,
+    })
+
+    assert name == "SE::Google::Trends"
+    assert preset == "fast"
+    assert options == {
+        "search_category": "3",
+        "search_region": "US",
+        "hl": "de",
+        "use_empty_queries": True,
+    }
+
+
+def test_unknown_options_dropped(client):
+    """Options the parser does not declare are not sent."""
+    _, _, options = client._translate_options("google_search", {"pages_count": 2, "bogus": 1})
+    assert options == {}
+
+
+def test_option_values_converted(client):
+    """Lossless representations are converted to the declared type."""
+    _, _, options = client._translate_options("youtube_video", {
+        "comments_pages": "3",
+        "interface_language": "ru",
+    })
+    assert options == {"commentsPages": 3, "interfaceLanguage": "ru"}
+
+    _, _, options = client._translate_options("google_trends", {"category": 174, "use_empty_queries": "false"})
+    assert options == {"search_category": "174", "use_empty_queries": False}
+
+
+@pytest.mark.parametrize("parser_id, options", [
+    ("youtube_search", {"pages_count": "many"}),
+    ("youtube_search", {"pages_count": True}),
+    ("google_trends", {"use_empty_queries": "maybe"}),
+    ("link_extractor", {"preset": "everything"}),
+])
+def test_invalid_values_rejected(client, parser_id, options):
+    """Values that do not fit the declared type raise ValueError."""
+    with pytest.raises(ValueError):
+        client._translate_options(parser_id, options)
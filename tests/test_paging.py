@@ -0,0 +1,151 @@
+"""Tests for result projection, truncation and get_result_page."""
+
+import json
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ayga_mcp_client import paging
+from ayga_mcp_client import server as server_module
+
+
+VIDEO = {
+    "title": "Video",
+    "views": 1000,
+    "comments": [{"author": f"user{i}", "text": f"comment {i}", "likes": i} for i in range(25)],
+}
+
+
+def test_project_dotted_fields():
+    """Dotted paths select fields inside each list element."""
+    projected = paging.project(VIDEO, ["title", "comments.text"])
+
+    assert set(projected) == {"title", "comments"}
+    assert projected["comments"][0] == {"text": "comment 0"}
+
+
+def test_page_by_items_and_bytes():
+    """Pages hold at most max_items items and stay under max_bytes."""
+    first, next_offset = paging.page(VIDEO, 0, max_items=10)
+    assert first["data"]["title"] == "Video"
+    assert len(first["data"]["comments"]) == 10
+    assert first["page"] == {"items": "comments", "offset": 0, "count": 10, "total": 25}
+    assert next_offset == 10
+
+    second, next_offset = paging.page(VIDEO, 10, max_bytes=300)
+    assert set(second["data"]) == {"comments"}  # Other fields only on the first page
+    assert len(json.dumps(second["data"], separators=(",", ":"))) <= 300
+    assert second["data"]["comments"][0]["author"] == "user10"
+    assert next_offset == 10 + second["page"]["count"]
+
+
+def test_page_text_without_item_list():
+    """Data without a list is cut into max_bytes slices of its JSON."""
+    article = {"text": "слово " * 200}
+    chunks = []
+    offset = 0
+    while offset is not None:
+        response, offset = paging.page(article, offset or 0, max_bytes=256)
+        chunks.append(response["data_text"])
+        if offset is None:
+            break
+
+    assert len(chunks) > 1
+    assert json.loads("".join(chunks)) == article
+
+
+@pytest.mark.parametrize("items", [[{"author": "a", "text": "t"}] * 30, ["a"]])
+def test_large_fields_beside_items_are_paged_as_text(items):
+    """Fields next to the item list that alone exceed max_bytes are not sent whole."""
+    video = {"subtitles": "s" * 20000, "comments": items}
+    chunks = []
+    offset = 0
+    while offset is not None:
+        response, offset = paging.page(video, offset, max_bytes=2000)
+        assert len(response["data_text"].encode("utf-8")) <= 2000
+        chunks.append(response["data_text"])
+
+    assert len(chunks) > 1
+    assert json.loads("".join(chunks)) == video
+
+
+def test_result_store_evicts_oldest():
+    store = paging.ResultStore(max_entries=2)
+    first = store.put([1], None, None)
+    store.put([2], None, None)
+    store.put([3], None, None)
+
+    assert store.get(first) is None
+    assert len(store) == 2
+
+
+def test_result_store_caps_bytes():
+    """Results are evicted once their total size passes max_bytes; the newest stays."""
+    store = paging.ResultStore(max_bytes=250)
+    first = store.put(["x" * 100], None, None)
+    second = store.put(["y" * 100], None, None)
+    third = store.put(["z" * 100], None, None)
+
+    assert store.get(first) is None
+    assert store.get(second) is not None
+    assert len(store) == 2
+
+    huge = store.put(["h" * 1000], None, None)
+    assert store.get(third) is None
+    assert store.get(huge) is not None
+    assert len(store) == 1
+
+
+async def call_tool(server, name, arguments):
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    return json.loads(response.root.content[0].text)
+
+
+@pytest.mark.asyncio
+async def test_parser_tool_pages_through_result(monkeypatch):
+    """A cut result returns a cursor; get_result_page serves the rest."""
+    class StubClient:
+        async def run_parser(self, parser_id, query, options=None, timeout=None, progress_callback=None, decode=True):
+            return {"data": VIDEO, "task_id": "t1"}
+
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: StubClient())
+    server = server_module.create_mcp_server()
+
+    first = await call_tool(server, "parse_youtube_video", {
+        "query": "https://youtu.be/x", "fields": ["title", "comments.text"], "max_items": 20,
+    })
+    assert first["task_id"] == "t1"
+    assert first["data"]["comments"][0] == {"text": "comment 0"}
+
+    second = await call_tool(server, "get_result_page", {"cursor": first["page"]["next_cursor"]})
+    assert [c["text"] for c in second["data"]["comments"]] == [f"comment {i}" for i in range(20, 25)]
+    assert "next_cursor" not in second["page"]
+
+    expired = await call_tool(server, "get_result_page", {"cursor": "unknown.5"})
+    assert "error" in expired
+
+
+@pytest.mark.asyncio
+async def test_text_pages_continue_as_text(monkeypatch):
+    """Later pages keep the first page's layout, even with another max_bytes."""
+    video = {"subtitles": "s" * 5000, "comments": [{"text": "c"}] * 5}
+
+    class StubClient:
+        async def run_parser(self, parser_id, query, options=None, timeout=None, progress_callback=None, decode=True):
+            return {"data": video, "task_id": "t1"}
+
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: StubClient())
+    server = server_module.create_mcp_server()
+
+    response = await call_tool(server, "parse_youtube_video", {"query": "x", "max_bytes": 1000})
+    chunks = [response["data_text"]]
+    while "next_cursor" in response["page"]:
+        response = await call_tool(server, "get_result_page", {
+            "cursor": response["page"]["next_cursor"], "max_bytes": 100000,
+        })
+        chunks.append(response["data_text"])
+
+    assert json.loads("".join(chunks)) == video
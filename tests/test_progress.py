@@ -0,0 +1,117 @@
+"""Tests for progress reporting while waiting for results."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import CallToolRequest, CallToolRequestParams, RequestParams
+
+from ayga_mcp_client import server as server_module
+
+
+pytestmark = pytest.mark.usefixtures("fast_polling")
+
+
+def slow_task_handler(ready_after: int):
+    """Backend that reports 'queued' (404), then 'processing', then success."""
+    polls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal polls
+        if request.method == "POST":
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        polls += 1
+        if polls == 1:
+            return httpx.Response(404)
+        status = "success" if polls > ready_after else "processing"
+        return httpx.Response(200, json={"value": json.dumps([task_id, status, 0, "", "done"])})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_progress_updates_carry_polls_and_status(make_client):
+    """Each miss reports elapsed time, poll count and the A-Parser status."""
+    updates = []
+    client = make_client(slow_task_handler(ready_after=3))
+
+    result = await client.wait_for_result("t1", timeout=5, progress_callback=updates.append)
+
+    assert result["data"] == "done"
+    assert [u.polls for u in updates] == [1, 2, 3]
+    assert [u.status for u in updates] == ["queued", "processing", "processing"]
+    assert all(0 <= u.fraction < 1 for u in updates)
+    assert updates[0].elapsed <= updates[-1].elapsed
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_callback_does_not_block_polling(make_client):
+    """Coroutine callbacks run in the background and errors are contained."""
+    started = []
+
+    async def callback(update):
+        started.append(update.polls)
+        await asyncio.sleep(10)
+
+    client = make_client(slow_task_handler(ready_after=2))
+    result = await asyncio.wait_for(
+        client.wait_for_result("t1", timeout=5, progress_callback=callback), timeout=2
+    )
+
+    assert result["data"] == "done"
+    assert started == [1, 2]
+    for task in list(client._background_tasks):
+        task.cancel()
+    await client.close()
+
+
+class RecordingSession:
+    """Stand-in MCP session that records progress notifications."""
+
+    def __init__(self):
+        self.notifications = []
+
+    async def send_progress_notification(self, progress_token, progress, total=None,
+                                         message=None, related_request_id=None):
+        self.notifications.append((progress_token, progress, total, message))
+
+
+@pytest.mark.asyncio
+async def test_parser_tool_sends_mcp_progress(make_client, monkeypatch):
+    """With a progress token, parser tools stream poll progress to the host."""
+    monkeypatch.setattr(
+        server_module, "RedisAPIClient", lambda **kwargs: make_client(slow_task_handler(ready_after=2))
+    )
+    server = server_module.create_mcp_server()
+    session = RecordingSession()
+    token = request_ctx.set(RequestContext(
+        request_id=1,
+        meta=RequestParams.Meta(progressToken="tok"),
+        session=session,
+        lifespan_context=None,
+    ))
+    try:
+        handler = server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(
+                name="search_perplexity", arguments={"query": "q", "timeout": 5}
+            ),
+        )
+        response = await handler(request)
+        await asyncio.sleep(0)  # let background notifications finish
+    finally:
+        request_ctx.reset(token)
+
+    assert json.loads(response.root.content[0].text)["data"] == "done"
+    assert [n[0] for n in session.notifications] == ["tok", "tok"]
+    assert all(n[2] == 5 for n in session.notifications)
+    assert session.notifications[0][3].startswith("queued:")
+    assert "2 polls" in session.notifications[1][3]
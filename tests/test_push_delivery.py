@@ -0,0 +1,129 @@
+"""Tests for push-based result delivery against a stand-in server."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import client as client_module
+from ayga_mcp_client.api.client import RedisAPIClient
+
+
+class StandInServer:
+    """Minimal stand-in for the Redis API: KV store plus key event stream."""
+
+    def __init__(self, subscribe: bool = True, notify: bool = True):
+        self.subscribe = subscribe
+        self.notify = notify
+        self.values = {}
+        self.events: asyncio.Queue = asyncio.Queue()
+        self.kv_gets = 0
+
+    def write_result(self, task_id: str, data):
+        """Simulate A-Parser storing a finished result."""
+        key = f"aparser_redis_api:{task_id}"
+        self.values[key] = json.dumps([task_id, "success", 0, "", data])
+        if self.notify:
+            self.events.put_nowait(key)
+
+    async def stream_events(self):
+        yield b": connected\n\n"
+        while True:
+            key = await self.events.get()
+            yield f"event: set\ndata: {json.dumps({'key': key})}\n\n".encode()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/kv/subscribe":
+            if not self.subscribe:
+                return httpx.Response(404, json={"detail": "Not Found"})
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=self.stream_events(),
+            )
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        self.kv_gets += 1
+        key = request.url.path.removeprefix("/kv/")
+        if key not in self.values:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"key": key, "value": self.values[key]})
+
+
+@pytest.mark.asyncio
+async def test_push_event_delivers_result_without_waiting_for_poll(make_client, monkeypatch):
+    """A key event triggers an immediate fetch, long before the next poll."""
+    monkeypatch.setattr(client_module, "POLL_INITIAL_DELAY", 30.0)
+    server = StandInServer()
+    client = make_client(server.handler, result_delivery="auto")
+
+    waiter = asyncio.create_task(client.wait_for_result("t1", timeout=5))
+    await asyncio.sleep(0.05)
+    server.write_result("t1", "pushed")
+
+    result = await asyncio.wait_for(waiter, timeout=1)
+    assert result["data"] == "pushed"
+    stats = client.get_stats()["push"]
+    assert stats["supported"] is True
+    assert stats["events"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_result_written_before_subscribing_is_found(make_client, monkeypatch):
+    """On connect, pending tasks are checked once to catch missed writes."""
+    monkeypatch.setattr(client_module, "POLL_INITIAL_DELAY", 30.0)
+    server = StandInServer()
+    server.write_result("early", "done")
+    server.events.get_nowait()  # Event fired before anyone listened
+    client = make_client(server.handler, result_delivery="auto")
+
+    result = await asyncio.wait_for(client.wait_for_result("early", timeout=5), timeout=1)
+    assert result["data"] == "done"
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_polling_without_subscribe_endpoint(make_client, fast_polling):
+    """A 404 on the subscribe endpoint disables push; polling still works."""
+    server = StandInServer(subscribe=False)
+    client = make_client(server.handler, result_delivery="auto")
+
+    waiter = asyncio.create_task(client.wait_for_result("t2", timeout=5))
+    await asyncio.sleep(0.01)
+    server.write_result("t2", "polled")
+
+    result = await waiter
+    assert result["data"] == "polled"
+    assert client.get_stats()["push"]["supported"] is False
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_silent_stream_keeps_normal_polling(make_client, fast_polling):
+    """An open stream that delivers no events does not slow polling down."""
+    server = StandInServer(notify=False)
+    client = make_client(server.handler, result_delivery="auto")
+
+    waiter = asyncio.create_task(client.wait_for_result("t3", timeout=5))
+    await asyncio.sleep(0.1)
+    server.write_result("t3", "polled")
+
+    result = await asyncio.wait_for(waiter, timeout=1)
+    assert result["data"] == "polled"
+    assert client.get_stats()["push"]["supported"] is True
+    await client.close()
+
+
+def test_task_id_from_event():
+    parse = RedisAPIClient._task_id_from_event
+    assert parse('{"key": "aparser_redis_api:abc"}') == "abc"
+    assert parse('{"channel": "__keyspace@0__:aparser_redis_api:abc"}') == "abc"
+    assert parse("aparser_redis_api:abc") == "abc"
+    assert parse('{"key": "other:abc"}') is None
+
+
+def test_invalid_delivery_mode():
+    with pytest.raises(ValueError):
+        RedisAPIClient(result_delivery="carrier_pigeon")
@@ -0,0 +1,83 @@
+"""Tests for the token-bucket rate limiter and 429 handling."""
+
+import json
+import time
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_bucket_reserves_in_arrival_order():
+    """Beyond the burst, each reservation waits one more token interval."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_penalize_pauses_and_halves_rate():
+    bucket = TokenBucket(rate=10, capacity=5)
+    bucket.penalize(1.0)
+
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+    bucket.recover()
+    assert bucket.rate == 5.5
+
+
+@pytest.mark.asyncio
+async def test_429_is_waited_out_and_replayed(make_client):
+    """A submission answered 429 is delayed for Retry-After, then succeeds."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.1"})
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+
+    await client.submit_parser_task("google_search", "python")
+
+    assert len(attempts) == 2
+    assert attempts[1] - attempts[0] >= 0.09
+    stats = client.get_stats()["rate_limit"]
+    assert stats["rate_limited"] == 1
+    assert stats["global_rate"] < 50
+    assert "google_search" in stats["throttled_parsers"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_parser_rate_spreads_submissions(make_client):
+    """Submissions beyond a parser's burst are delayed, not rejected."""
+    pushed = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        pushed.append(len(body.get("values", [body.get("value")])))
+        return httpx.Response(200, json={})
+
+    limiter = RateLimiter(parser_rate=20, parser_burst=2)
+    client = make_client(handler, rate_limiter=limiter)
+
+    start = time.monotonic()
+    await client.submit_parser_tasks([("http", str(i), None) for i in range(4)])
+
+    assert pushed == [4]
+    assert time.monotonic() - start >= 0.09  # 2 tokens short at 20/s
+    assert limiter.stats()["delayed"] == 1
+    await client.close()
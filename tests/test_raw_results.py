@@ -0,0 +1,79 @@
+"""Tests for raw pass-through of large parser results."""
+
+import json
+
+import httpx
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from ayga_mcp_client import _json
+from ayga_mcp_client import server as server_module
+
+
+BIG_DATA = {
+    "pages": [{"url": f"https://example.com/{i}", "text": "x [ ] { } \" " * 50} for i in range(400)],
+}
+
+
+def big_value(task_id: str) -> str:
+    return json.dumps([task_id, "success", 0, "", BIG_DATA, {"extra": True}])
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.method == "POST":
+        return httpx.Response(200, json={})
+    if request.url.path == "/kv/mget":
+        return httpx.Response(404)
+    task_id = request.url.path.rsplit(":", 1)[1]
+    return httpx.Response(200, json={"value": big_value(task_id)})
+
+
+def test_parse_result_array_keeps_data_raw():
+    """Only the header is decoded; the data slice is the exact source text."""
+    value = big_value("t1")
+    assert len(value) >= _json.RAW_RESULT_MIN_CHARS
+
+    task_id, status, error_code, error_msg, data = _json.parse_result_array(value)
+
+    assert (task_id, status, error_code, error_msg) == ("t1", "success", 0, "")
+    assert isinstance(data, _json.RawJSON)
+    assert data.decode() == BIG_DATA
+
+
+def test_dumps_splices_raw_values():
+    """RawJSON is written verbatim, at any depth."""
+    payload = {"a": _json.RawJSON('{"b": [1, 2]}'), "list": [_json.RawJSON("3")], "s": "@raw:x"}
+    assert json.loads(_json.dumps(payload, indent=2)) == {"a": {"b": [1, 2]}, "list": [3], "s": "@raw:x"}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_result_decodes_by_default(make_client, fast_polling):
+    """Library callers get parsed data unless they opt out."""
+    client = make_client(handler, keep_results=True)
+
+    decoded = await client.wait_for_result("t1", timeout=5)
+    raw = await client.wait_for_result("t1", timeout=5, decode=False)
+
+    assert decoded == {"data": BIG_DATA, "task_id": "t1"}
+    assert isinstance(raw["data"], _json.RawJSON)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_parser_tool_passes_raw_result_through(make_client, fast_polling, monkeypatch):
+    """The tool output embeds the stored data and caches it undecoded."""
+    client = make_client(handler, keep_results=True)
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: client)
+    server = server_module.create_mcp_server()
+
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name="fetch_http", arguments={"query": "https://example.com"}),
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    payload = json.loads(response.root.content[0].text)
+
+    assert payload["data"] == BIG_DATA
+    cached = await client.get_cached_result("http", "https://example.com", decode=False)
+    assert isinstance(cached["data"], _json.RawJSON)
+    await client.close()
@@ -0,0 +1,46 @@
+"""Tests for the parser registry and the lookups built on it."""
+
+import dataclasses
+
+import pytest
+
+from ayga_mcp_client.api.cache import get_cache_ttl
+from ayga_mcp_client.error_handler import ErrorHandler
+from ayga_mcp_client.health_monitor import get_parser_thresholds
+from ayga_mcp_client.registry import (
+    PARSER_REGISTRY,
+    PARSER_SPECS,
+    TIMEOUT_CLASSES,
+    TOOL_REGISTRY,
+    get_parser,
+)
+
+
+def test_registry_entries_unique_and_complete():
+    """IDs and tool names are unique and every entry has valid classes."""
+    assert len(PARSER_REGISTRY) == len(PARSER_SPECS)
+    assert len(TOOL_REGISTRY) == len(PARSER_SPECS)
+    for spec in PARSER_SPECS:
+        assert spec.timeout_class in TIMEOUT_CLASSES
+        assert spec.cache_policy in ("short", "medium", "long")
+        assert spec.aparser_name
+
+
+def test_specs_are_immutable():
+    """Specs are frozen and slotted."""
+    spec = get_parser("google_search")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spec.aparser_name = "SE::Bing"
+    assert not hasattr(spec, "__dict__")
+
+
+def test_lookups_use_registry():
+    """Cache TTL, health thresholds and error context come from the registry."""
+    assert get_cache_ttl("google_trends") == 3600
+    assert get_parser_thresholds("duckduckgo_search")["response_time_good"] == 2000
+    assert get_parser_thresholds("unknown")["response_time_degraded"] == 15000
+
+    context = ErrorHandler.get_parser_context("perplexity")
+    assert context["name"] == "Perplexity AI"
+    assert context["docs_url"] == "https://www.perplexity.ai/"
+    assert ErrorHandler.get_parser_context("kimi") is None
@@ -0,0 +1,141 @@
+"""Tests for the in-process result cache."""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import cache as cache_module
+from ayga_mcp_client.api.cache import DiskResultCache, ResultCache, get_cache_ttl
+
+
+def test_ttl_by_policy():
+    """Search results expire quickly, page content is kept longer."""
+    assert get_cache_ttl("google_search") == 300
+    assert get_cache_ttl("perplexity") == 300
+    assert get_cache_ttl("youtube_channel_about") == 86400
+    assert get_cache_ttl("article_extractor") == 86400
+
+
+def test_key_normalization():
+    """Parser ID is normalized and option order does not matter."""
+    a = ResultCache.make_key(" Google_Search", "q", "default", {"a": 1, "b": 2})
+    b = ResultCache.make_key("google_search", "q", "default", {"b": 2, "a": 1})
+    c = ResultCache.make_key("google_search", "q", "default", {"a": 1})
+    assert a == b
+    assert a != c
+
+
+def test_expiry(monkeypatch):
+    """Expired entries count as misses and are dropped."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = ResultCache()
+    cache.set("k", {"data": 1}, ttl=10)
+
+    assert cache.get("k") == {"data": 1}
+    now[0] += 11
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    """Least recently used entries are evicted past either cap."""
+    cache = ResultCache(max_entries=2)
+    cache.set("a", {"v": 1}, ttl=60)
+    cache.set("b", {"v": 2}, ttl=60)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", {"v": 3}, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.evictions == 1
+
+    small = ResultCache(max_bytes=30)
+    small.set("x", {"v": "x" * 10}, ttl=60)
+    small.set("y", {"v": "y" * 10}, ttl=60)
+    assert small.get("x") is None
+    assert small.stats()["bytes"] <= 30
+
+
+@pytest.mark.asyncio
+async def test_run_parser_served_from_cache(make_client, fast_polling):
+    """A repeated call does not submit a second task."""
+    submits = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            submits.append(json.loads(json.loads(request.content)["value"]))
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        value = [task_id, "success", 0, "", "answer"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    client = make_client(handler)
+
+    first = await client.run_parser("perplexity", "What is MCP?", timeout=5)
+    second = await client.run_parser("perplexity", "What is MCP?", {"preset": "default"}, timeout=5)
+
+    assert first == second
+    assert len(submits) == 1
+    assert client.get_stats()["cache"]["hits"] == 1
+    await client.close()
+
+
+def test_disk_cache_shared_between_instances(tmp_path):
+    """A second cache on the same directory sees stored results."""
+    first = ResultCache(disk=DiskResultCache(str(tmp_path)))
+    first.set("k", {"data": "x" * 1000}, ttl=60)
+
+    second = ResultCache(disk=DiskResultCache(str(tmp_path)))
+    assert second.get("k") == {"data": "x" * 1000}
+    assert second.stats()["disk"]["hits"] == 1
+    assert second.stats()["entries"] == 1  # Promoted to memory
+
+    # Payloads are stored compressed
+    assert (tmp_path / DiskResultCache.FILENAME).stat().st_size < 64 * 1024
+    first.disk.close()
+    second.disk.close()
+
+
+def test_disk_cache_honors_ttl(tmp_path, monkeypatch):
+    """Expired disk entries are not served and are purged on open."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    disk = DiskResultCache(str(tmp_path))
+    disk.set("k", {"data": 1}, expires_at=1010.0)
+
+    assert disk.get("k") == (1010.0, {"data": 1})
+    now[0] = 1011.0
+    assert disk.get("k") is None
+    disk.close()
+
+    reopened = DiskResultCache(str(tmp_path))
+    assert reopened.stats()["entries"] == 0
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_io_runs_off_event_loop(tmp_path, monkeypatch):
+    """On the event loop, disk reads and writes run on the cache's I/O thread."""
+    disk = DiskResultCache(str(tmp_path))
+    threads = []
+
+    def on_thread(method):
+        def wrapper(*args):
+            threads.append(threading.current_thread().name)
+            return method(*args)
+        return wrapper
+
+    monkeypatch.setattr(disk, "get", on_thread(disk.get))
+    monkeypatch.setattr(disk, "set", on_thread(disk.set))
+
+    ResultCache(disk=disk).set("k", {"data": 1}, ttl=60)
+    assert await ResultCache(disk=disk).get_async("k") == {"data": 1}
+
+    assert len(threads) == 2
+    assert all(name.startswith("result-cache") for name in threads)
+    disk.close()
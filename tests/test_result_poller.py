@@ -0,0 +1,156 @@
+"""Tests for the shared result poller in RedisAPIClient."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+
+pytestmark = pytest.mark.usefixtures("fast_polling")
+
+
+def success_value(task_id: str, data) -> str:
+    """A-Parser array-format result value."""
+    return json.dumps([task_id, "success", 0, "", data])
+
+
+@pytest.mark.asyncio
+async def test_fanout_when_mget_unsupported(make_client):
+    """Without multi-key fetch, each task is fetched individually."""
+    polls = {"t1": 0, "t2": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        polls[task_id] += 1
+        if polls[task_id] < 2:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"value": success_value(task_id, {"n": task_id})})
+
+    client = make_client(handler)
+    r1, r2 = await asyncio.gather(
+        client.wait_for_result("t1", timeout=5),
+        client.wait_for_result("t2", timeout=5),
+    )
+
+    assert r1 == {"data": {"n": "t1"}, "task_id": "t1"}
+    assert r2 == {"data": {"n": "t2"}, "task_id": "t2"}
+    assert client._mget_supported is False
+    assert client._pending == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mget_checks_all_tasks_in_one_request(make_client):
+    """With multi-key fetch, due tasks share one request per tick."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"deleted": 1})  # Read results are cleaned up
+        requests.append(request)
+        assert request.url.path == "/kv/mget"
+        keys = request.url.params.get_list("keys")
+        values = [success_value(key.split(":", 1)[1], "ok") for key in keys]
+        return httpx.Response(200, json={"values": values})
+
+    client = make_client(handler)
+    results = await asyncio.gather(
+        *(client.wait_for_result(f"t{i}", timeout=5) for i in range(20))
+    )
+
+    assert [r["task_id"] for r in results] == [f"t{i}" for i in range(20)]
+    assert len(requests) < 20
+    assert client._mget_supported is True
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_parser_error_is_delivered_to_waiter(make_client):
+    """A parser error fails only the affected task."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        if task_id == "bad":
+            value = json.dumps([task_id, "error", 500, "boom", None])
+        else:
+            value = success_value(task_id, "ok")
+        return httpx.Response(200, json={"value": value})
+
+    client = make_client(handler)
+    good, bad = await asyncio.gather(
+        client.wait_for_result("good", timeout=5),
+        client.wait_for_result("bad", timeout=5),
+        return_exceptions=True,
+    )
+
+    assert good["data"] == "ok"
+    assert isinstance(bad, ValueError)
+    assert "boom" in str(bad)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_timeout_stops_polling(make_client):
+    """A timed-out task is removed from the poller."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    client = make_client(handler)
+    with pytest.raises(TimeoutError):
+        await client.wait_for_result("slow", timeout=0.05)
+
+    assert client._pending == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_result_keys_deleted_after_read(make_client):
+    """Delivered results (and stored parser errors) are deleted from Redis."""
+    deleted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        if request.method == "DELETE":
+            deleted.append(task_id)
+            return httpx.Response(200, json={"deleted": 1})
+        if task_id == "bad":
+            return httpx.Response(200, json={"value": json.dumps([task_id, "error", 1, "x", None])})
+        return httpx.Response(200, json={"value": success_value(task_id, "ok")})
+
+    client = make_client(handler)
+    await asyncio.gather(
+        client.wait_for_result("good", timeout=5),
+        client.wait_for_result("bad", timeout=5),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0.01)
+
+    assert sorted(deleted) == ["bad", "good"]
+    assert client.get_stats()["result_keys"]["deleted_after_read"] == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_keep_results_skips_delete(make_client):
+    """With keep_results, result keys are left in place."""
+    methods = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        methods.append(request.method)
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        return httpx.Response(200, json={"value": success_value(task_id, "ok")})
+
+    client = make_client(handler, keep_results=True)
+    await client.wait_for_result("t1", timeout=5)
+    await asyncio.sleep(0.01)
+
+    assert "DELETE" not in methods
+    await client.close()
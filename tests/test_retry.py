@@ -0,0 +1,164 @@
+"""Tests for the transient-error retry policy."""
+
+import json
+
+import httpx
+import pytest
+
+from ayga_mcp_client import server as server_module
+from ayga_mcp_client.api.retry import RetryPolicy
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(base_delay=0.01, max_delay=0.02, min_attempt_budget=0.1, **kwargs)
+
+
+def test_classify_and_limits():
+    request = httpx.Request("GET", "https://redis.ayga.tech/kv/x")
+    unavailable = httpx.HTTPStatusError(
+        "Server error", request=request, response=httpx.Response(503, request=request)
+    )
+    policy = RetryPolicy()
+
+    assert policy.classify(httpx.ConnectError("refused")) == "CONNECTION_ERROR"
+    assert policy.classify(httpx.ReadTimeout("slow")) == "TIMEOUT"
+    assert policy.classify(unavailable) == "SERVICE_UNAVAILABLE"
+    assert policy.classify(ValueError("Parser error: bad query")) == "PARSER_ERROR"
+    assert policy.max_retries("CONNECTION_ERROR") == 3
+    assert policy.max_retries("PARSER_ERROR") == 0  # can_retry is False
+    assert RetryPolicy(limits={"CONNECTION_ERROR": 0}).max_retries("CONNECTION_ERROR") == 0
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    delay = policy.base_delay
+    for _ in range(20):
+        previous, delay = delay, policy.next_delay(delay)
+        assert 1 <= delay <= min(4, previous * 3)
+
+
+class Backend:
+    """Task queue and result keys; the first pushes or polls can be made to fail."""
+
+    def __init__(self, fail_pushes: int = 0, fail_polls: int = 0, error: str = ""):
+        self.fail_pushes = fail_pushes
+        self.fail_polls = fail_polls
+        self.error = error
+        self.pushes = []
+        self.polls = 0
+        self.deleted = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            if request.url.path.endswith("/lrem"):
+                return httpx.Response(200, json={"removed": 0})
+            self.pushes.append(request)
+            if len(self.pushes) <= self.fail_pushes:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        if request.method == "DELETE":
+            self.deleted.append(task_id)
+            return httpx.Response(200, json={"deleted": 1})
+        self.polls += 1
+        if self.polls <= self.fail_polls:
+            return httpx.Response(503)
+        value = [task_id, "success", 1 if self.error else 0, self.error, "ok"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried(make_client):
+    backend = Backend(fail_pushes=2)
+    client = make_client(backend, retry_policy=fast_policy())
+
+    result = await client.run_parser("google_search", "python", timeout=5)
+
+    assert result["data"] == "ok"
+    assert len(backend.pushes) == 3
+    stats = client.get_stats()["retry"]
+    assert stats["retries"] == {"CONNECTION_ERROR": 2}
+    assert stats["recovered"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_at_limit_and_skip_permanent_errors(make_client):
+    backend = Backend(fail_pushes=5)
+    client = make_client(backend, retry_policy=fast_policy(limits={"CONNECTION_ERROR": 1}))
+    with pytest.raises(httpx.ConnectError):
+        await client.run_parser("google_search", "python", timeout=5)
+    assert len(backend.pushes) == 2
+    assert client.get_stats()["retry"]["exhausted"] == {"CONNECTION_ERROR": 1}
+    await client.close()
+
+    backend = Backend(error="Invalid query syntax")
+    client = make_client(backend, retry_policy=fast_policy())
+    with pytest.raises(ValueError):
+        await client.run_parser("google_search", "python", timeout=5)
+    assert len(backend.pushes) == 1
+    assert client.get_stats()["retry"]["retries"] == {}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_stay_within_deadline(make_client):
+    policy = RetryPolicy(base_delay=0.3, max_delay=0.3, min_attempt_budget=0.5)
+    backend = Backend(fail_pushes=5)
+    client = make_client(backend, retry_policy=policy)
+
+    with pytest.raises(httpx.ConnectError):
+        await client.run_parser("google_search", "python", timeout=1)
+
+    assert len(backend.pushes) == 2  # A third attempt would start with < 0.5s left
+    assert client.get_stats()["retry"]["out_of_budget"] == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_waits_on_the_same_task(make_client, fast_polling):
+    """A poll error is retried on the submitted task, not by resubmitting."""
+    backend = Backend(fail_polls=1)
+    client = make_client(backend, retry_policy=fast_policy())
+
+    result = await client.run_parser("google_search", "python", timeout=5)
+
+    assert result["data"] == "ok"
+    assert len(backend.pushes) == 1
+    assert client.get_stats()["retry"]["retries"] == {"SERVICE_UNAVAILABLE": 1}
+    assert client.get_stats()["cancellation"]["cancelled"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_task_abandoned_when_polls_keep_failing(make_client, fast_polling):
+    """Once poll retries are used up, the submitted task is cancelled."""
+    backend = Backend(fail_polls=10)
+    client = make_client(backend, retry_policy=fast_policy(limits={"SERVICE_UNAVAILABLE": 1}))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.run_parser("google_search", "python", timeout=5)
+
+    assert len(backend.pushes) == 1
+    assert client.get_stats()["cancellation"]["cancelled"] == 1
+    assert client.scheduler.stats()["slow"]["active"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_queries_are_retried(make_client, fast_polling):
+    """run_batch queries get the same retries as single parser calls."""
+    backend = Backend(fail_pushes=2, fail_polls=1)
+    client = make_client(backend, retry_policy=fast_policy())
+
+    results = await server_module.run_parser_batch(client, "google_search", ["a", "b"])
+
+    assert [item["result"]["data"] for item in results] == ["ok", "ok"]
+    assert len(backend.pushes) == 4  # Failed bulk push, 2 single pushes, 1 retry
+    stats = client.get_stats()
+    assert stats["retry"]["retries"] == {"CONNECTION_ERROR": 1, "SERVICE_UNAVAILABLE": 1}
+    assert stats["cancellation"]["cancelled"] == 0
+    assert client.scheduler.stats()["slow"]["active"] == 0
+    await client.close()
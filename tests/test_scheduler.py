@@ -0,0 +1,102 @@
+"""Tests for the client-side task scheduler."""
+
+import asyncio
+
+import pytest
+
+from ayga_mcp_client.api.scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    TaskScheduler,
+    parse_category_limits,
+)
+from ayga_mcp_client.server import DEFAULT_BATCH_CONCURRENCY
+
+
+PARSER = "google_search"
+
+
+def make_scheduler(limit: int) -> TaskScheduler:
+    return TaskScheduler({TaskScheduler.category_of(PARSER): limit})
+
+
+def category_stats(scheduler: TaskScheduler):
+    return scheduler.stats()[TaskScheduler.category_of(PARSER)]
+
+
+@pytest.mark.asyncio
+async def test_batch_leaves_room_for_interactive():
+    """Batch work stops short of the cap; interactive calls still start at once."""
+    scheduler = make_scheduler(4)
+
+    admitted = 0
+    while scheduler.try_acquire(PARSER, PRIORITY_BATCH):
+        admitted += 1
+    assert admitted == 3
+
+    await asyncio.wait_for(scheduler.acquire(PARSER, PRIORITY_INTERACTIVE), timeout=1)
+    assert category_stats(scheduler)["active"] == 4
+    assert not scheduler.try_acquire(PARSER, PRIORITY_INTERACTIVE)
+
+
+@pytest.mark.asyncio
+async def test_interactive_served_before_batch_and_callers_take_turns():
+    """Freed slots go to interactive waiters first, then batch callers round-robin."""
+    scheduler = make_scheduler(4)
+    for _ in range(4):
+        scheduler.try_acquire(PARSER, PRIORITY_INTERACTIVE)
+    order = []
+
+    async def wait(name, priority, caller):
+        await scheduler.acquire(PARSER, priority, caller)
+        order.append(name)
+
+    waiters = [
+        asyncio.create_task(wait(name, PRIORITY_BATCH, caller))
+        for name, caller in (("a1", "a"), ("a2", "a"), ("a3", "a"), ("b1", "b"))
+    ]
+    await asyncio.sleep(0)
+    waiters.append(asyncio.create_task(wait("i1", PRIORITY_INTERACTIVE, None)))
+    await asyncio.sleep(0)
+    assert category_stats(scheduler)["queued"] == {"interactive": 1, "batch": 4}
+
+    # Batch work may only use 3 of the 4 slots
+    for _ in range(6):
+        scheduler.release(PARSER)
+        await asyncio.sleep(0)
+
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+    assert order == ["i1", "a1", "b1", "a2", "a3"]
+    assert category_stats(scheduler)["waited"]["batch"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_hold_a_slot():
+    scheduler = make_scheduler(1)
+    scheduler.try_acquire(PARSER)
+
+    waiter = asyncio.create_task(scheduler.acquire(PARSER))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release(PARSER)
+    assert category_stats(scheduler)["active"] == 0
+    assert category_stats(scheduler)["queued"]["interactive"] == 0
+
+
+def test_default_limits_fit_two_default_batches():
+    """Two run_batch calls at the default concurrency are not throttled."""
+    scheduler = TaskScheduler()
+    for parser_id in ("google_search", "perplexity", "link_extractor"):
+        assert scheduler.limit(parser_id, PRIORITY_BATCH) >= 2 * DEFAULT_BATCH_CONCURRENCY
+        assert scheduler.limit(parser_id) > scheduler.limit(parser_id, PRIORITY_BATCH)
+
+
+def test_parse_category_limits():
+    assert parse_category_limits("slow=64, medium=48") == {"slow": 64, "medium": 48}
+    assert parse_category_limits("") == {}
+    for value in ("slow", "huge=4", "slow=0", "slow=x"):
+        with pytest.raises(ValueError):
+            parse_category_limits(value)
@@ -0,0 +1,107 @@
+"""Tests for single-flight coalescing of identical parser calls."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ayga_mcp_client.api import client as client_module
+
+
+@pytest.fixture
+def backend(make_client, fast_polling):
+    """Mock backend that answers on the second poll of each task."""
+    state = {"submits": [], "polls": {}, "error": None, "ready_after": 1}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            state["submits"].append(json.loads(json.loads(request.content)["value"]))
+            return httpx.Response(200, json={})
+        if request.url.path == "/kv/mget":
+            return httpx.Response(404)
+        task_id = request.url.path.rsplit(":", 1)[1]
+        state["polls"][task_id] = state["polls"].get(task_id, 0) + 1
+        if state["polls"][task_id] <= state["ready_after"]:
+            return httpx.Response(404)
+        if state["error"]:
+            value = [task_id, "error", 1, state["error"], None]
+        else:
+            value = [task_id, "success", 0, "", "answer"]
+        return httpx.Response(200, json={"value": json.dumps(value)})
+
+    return make_client(handler), state
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_task(backend):
+    client, state = backend
+    results = await asyncio.gather(
+        *(client.run_parser("perplexity", "same question", timeout=5) for _ in range(5))
+    )
+
+    assert len(state["submits"]) == 1
+    assert all(result == results[0] for result in results)
+    assert client.get_stats()["single_flight"] == {"in_flight": 0, "coalesced": 4}
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_different_options_are_not_coalesced(backend):
+    client, state = backend
+    await asyncio.gather(
+        client.run_parser("youtube_search", "q", {"pages_count": 1}, timeout=5),
+        client.run_parser("youtube_search", "q", {"pages_count": 2}, timeout=5),
+    )
+
+    assert len(state["submits"]) == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared(backend):
+    client, state = backend
+    state["error"] = "captcha"
+    outcomes = await asyncio.gather(
+        client.run_parser("perplexity", "q", timeout=5),
+        client.run_parser("perplexity", "q", timeout=5),
+        return_exceptions=True,
+    )
+
+    assert len(state["submits"]) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others(backend):
+    client, state = backend
+    first = asyncio.create_task(client.run_parser("perplexity", "q", timeout=5))
+    second = asyncio.create_task(client.run_parser("perplexity", "q", timeout=5))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    result = await second
+    assert result["data"] == "answer"
+    assert len(state["submits"]) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_run_lasts_for_the_longest_caller(backend, monkeypatch):
+    """A later caller with a longer timeout is not cut off at the first caller's."""
+    monkeypatch.setattr(client_module, "POLL_MAX_DELAY", 0.05)
+    client, state = backend
+    state["ready_after"] = 25  # About 1.2s
+
+    short, long = await asyncio.gather(
+        client.run_parser("perplexity", "q", timeout=1),
+        client.run_parser("perplexity", "q", timeout=5),
+        return_exceptions=True,
+    )
+
+    assert isinstance(short, TimeoutError)
+    assert "after 1s" in str(short)
+    assert long["data"] == "answer"
+    assert len(state["submits"]) == 1
+    await client.close()
@@ -0,0 +1,90 @@
+"""Tests for the precomputed tool catalog and tool dispatch."""
+
+import json
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from ayga_mcp_client import server as server_module
+from ayga_mcp_client.registry import DEFAULT_TIMEOUT, PARSER_SPECS, TIMEOUT_CLASSES
+
+
+async def call_tool(server, name, arguments):
+    """Invoke a tool through the server's request handler."""
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    response = await server.request_handlers[CallToolRequest](request)
+    return json.loads(response.root.content[0].text)
+
+
+def test_default_timeouts_from_registry():
+    """Every parser maps to its timeout class default."""
+    for spec in PARSER_SPECS:
+        assert server_module.get_default_timeout(spec.id) == TIMEOUT_CLASSES[spec.timeout_class]
+    assert server_module.get_default_timeout("unknown") == DEFAULT_TIMEOUT
+
+
+def test_catalog_built_once():
+    """The catalog is built on first use and reused afterwards."""
+    first = server_module.build_tool_catalog()
+    assert server_module.build_tool_catalog() is first
+    names = [tool.name for tool in first]
+    assert len(names) == len(set(names))
+    assert {f"{p['prefix']}{p['id']}" for p in server_module.PARSERS} <= set(names)
+
+
+@pytest.mark.asyncio
+async def test_list_tools_response_is_cached():
+    """Repeated tools/list calls return the same response."""
+    server = server_module.create_mcp_server()
+    handler = server.request_handlers[ListToolsRequest]
+    request = ListToolsRequest(method="tools/list")
+
+    first = await handler(request)
+    second = await handler(request)
+
+    assert second is first
+    assert len(first.root.tools) == len(server_module.build_tool_catalog())
+
+
+def test_option_keys_follow_input_schema():
+    """Each parser forwards exactly the options in its input schema."""
+    for spec in PARSER_SPECS:
+        properties = server_module.get_parser_input_schema(spec.to_dict())["properties"]
+        expected = set(properties) - {"query", "timeout"} - set(server_module.RESULT_SHAPE_PROPERTIES)
+        assert set(server_module.PARSER_OPTION_KEYS[spec.id]) == expected, spec.id
+    assert server_module.PARSER_OPTION_KEYS["google_search"] == ("preset",)
+
+
+@pytest.mark.asyncio
+async def test_parser_tool_copies_only_accepted_options(monkeypatch):
+    """Parser tools dispatch by name and drop options the parser does not take."""
+    calls = []
+
+    class StubClient:
+        async def run_parser(self, parser_id, query, options=None, timeout=None, progress_callback=None, decode=True):
+            calls.append((parser_id, query, options, timeout))
+            return {"data": "ok"}
+
+    monkeypatch.setattr(server_module, "RedisAPIClient", lambda **kwargs: StubClient())
+    server = server_module.create_mcp_server()
+
+    result = await call_tool(server, "get_google_trends", {
+        "query": "python", "region": "US", "pages_count": 3, "timeout": 5,
+    })
+    await call_tool(server, "search_google_search", {"query": "q", "from_language": "en"})
+
+    assert result == {"data": "ok"}
+    assert calls == [
+        ("google_trends", "python", {"region": "US"}, 5),
+        ("google_search", "q", None, server_module.get_default_timeout("google_search")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool():
+    """Unknown tool names return an error payload."""
+    server = server_module.create_mcp_server()
+    assert await call_tool(server, "nope", {}) == {"error": "Unknown tool: nope"}
@@ -121,12 +121,11 @@ def test_input_schemas():
 
 
 def test_a_parser_mapping():
-    """Verify A-Parser name mappings exist in client.py."""
+    """Verify A-Parser name mappings used when building tasks."""
+    import json
     from ayga_mcp_client.api.client import RedisAPIClient
     
-    # Read the parser_map from client.py source
-    import inspect
-    source = inspect.getsource(RedisAPIClient.submit_parser_task)
+    client = RedisAPIClient()
     
     # Check critical mappings (including new v1.3.0 parsers)
     critical_mappings = [
@@ -145,7 +144,8 @@ def test_a_parser_mapping():
     ]
     
     for parser_id, aparser_name in critical_mappings:
-        assert f'"{parser_id}": "{aparser_name}"' in source, \
+        _, task_json = client._build_task(parser_id, "test")
+        assert json.loads(task_json)[1] == aparser_name, \
             f"Missing mapping: {parser_id} → {aparser_name}"
     
     print(f"✓ A-Parser mappings present for all critical parsers")